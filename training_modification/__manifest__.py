@@ -1,6 +1,6 @@
 {
     'name': 'Training',
-    'version': '18.0.1.0',
+    'version': '18.0.1.3',
     'category': 'Website',
     'summary': 'Training Module',
     'description': """""",
@@ -8,11 +8,12 @@
     'price': 0,
     'license': 'LGPL-3',
     'currency': "INR",
-    'depends': ['base', 'website_slides', 'hr', 'mass_mailing'],
+    'depends': ['base', 'bus', 'website_slides', 'hr', 'mass_mailing'],
     'data': [
             'data/menu.xml',
             # 'security/training_security.xml',
             'security/ir.model.access.csv',
+            'data/ir_cron.xml',
             # 'data/tni_sequence.xml',
             'views/training_views.xml',
             'views/mail.xml',
@@ -33,6 +34,12 @@
                 'training_modification/static/src/js/elearning_dashboard.js',
 
                 'training_modification/static/src/xml/dashboard_template.xml',
+                'training_modification/static/src/css/attendance_register.css',
+                'training_modification/static/src/js/attendance_register.js',
+                'training_modification/static/src/xml/attendance_register.xml',
+                'training_modification/static/src/css/proof_review.css',
+                'training_modification/static/src/js/proof_review.js',
+                'training_modification/static/src/xml/proof_review.xml',
             ],
         },
     'installable': True,
@@ -0,0 +1,127 @@
+from odoo import http, fields
+from odoo.exceptions import AccessError
+from odoo.http import request, content_disposition
+from odoo.tools import SQL
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound
+from datetime import date, datetime
+import csv
+import io
+import tempfile
+
+import xlsxwriter
+
+from ..models.elearning_dashboard_service import EXPORT_BATCH_SIZE
+
+
+class DashboardExportController(http.Controller):
+
+    @http.route('/training/dashboard/export/<string:dataset>', type='http', auth='user', methods=['GET'])
+    def export_dashboard_dataset(self, dataset, format='csv', **kwargs):
+        """Stream a dashboard dataset as CSV or XLSX.
+
+        Accepts the dashboard filters as query parameters: date_from, date_to,
+        published (1/0), tag_ids and department_ids (comma separated ids).
+        """
+        if format not in ('csv', 'xlsx'):
+            raise NotFound()
+        try:
+            filters = self._parse_filters(kwargs)
+            headers, query = request.env['elearning.dashboard.service']._get_export_query(dataset, filters)
+        except AccessError:
+            raise Forbidden()
+        except ValueError:
+            raise NotFound()
+
+        # The request cursor is closed by the time the response body is
+        # consumed, so the rows are read from a cursor of our own
+        registry = request.env.registry
+        filename = f"{dataset}_{fields.Date.to_string(fields.Date.today())}.{format}"
+        if format == 'xlsx':
+            body = self._stream_xlsx(registry, headers, query, dataset)
+            content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        else:
+            body = self._stream_csv(registry, headers, query)
+            content_type = 'text/csv; charset=utf-8'
+
+        return request.make_response(body, headers=[
+            ('Content-Type', content_type),
+            ('Content-Disposition', content_disposition(filename)),
+            ('Cache-Control', 'no-store'),
+        ])
+
+    def _parse_filters(self, params):
+        """Dashboard filters of the query parameters; raises BadRequest on malformed values"""
+        for name in ('date_from', 'date_to'):
+            try:
+                fields.Date.to_date(params.get(name))
+            except ValueError:
+                raise BadRequest(f"Invalid {name}: expected a date as YYYY-MM-DD.")
+        filters = {
+            'date_from': params.get('date_from'),
+            'date_to': params.get('date_to'),
+            'tag_ids': self._parse_ids(params, 'tag_ids'),
+            'department_ids': self._parse_ids(params, 'department_ids'),
+        }
+        if params.get('published') in ('0', '1'):
+            filters['published'] = params['published'] == '1'
+        return filters
+
+    def _parse_ids(self, params, name):
+        try:
+            return [int(record_id) for record_id in params.get(name, '').split(',') if record_id]
+        except ValueError:
+            raise BadRequest(f"Invalid {name}: expected comma separated ids.")
+
+    def _iter_batches(self, registry, query):
+        """Rows of ``query`` in batches of EXPORT_BATCH_SIZE, read through a server-side cursor"""
+        with registry.cursor() as cr:
+            # Test cursors share the transaction of the test, which must stay writable
+            if not registry.in_test_mode():
+                cr.execute("SET TRANSACTION READ ONLY")
+            cr.execute(SQL("DECLARE dashboard_export NO SCROLL CURSOR FOR %s", query))
+            while True:
+                cr.execute("FETCH FORWARD %s FROM dashboard_export", [EXPORT_BATCH_SIZE])
+                rows = cr.fetchall()
+                if not rows:
+                    break
+                yield [tuple(self._format_value(value) for value in row) for row in rows]
+            cr.execute("CLOSE dashboard_export")
+
+    def _format_value(self, value):
+        if isinstance(value, datetime):
+            return fields.Datetime.to_string(value)
+        if isinstance(value, date):
+            return fields.Date.to_string(value)
+        return value
+
+    def _stream_csv(self, registry, headers, query):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # BOM so that spreadsheet applications detect the encoding
+        buffer.write('\ufeff')
+        writer.writerow(headers)
+        for rows in self._iter_batches(registry, query):
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    def _stream_xlsx(self, registry, headers, query, sheet_name):
+        # constant_memory flushes every row to disk as it is written; the
+        # workbook can only be sent once complete, from the temporary file
+        with tempfile.TemporaryFile() as output:
+            workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+            worksheet = workbook.add_worksheet(sheet_name[:31])
+            bold = workbook.add_format({'bold': True})
+            worksheet.write_row(0, 0, headers, bold)
+            row_index = 1
+            for rows in self._iter_batches(registry, query):
+                for row in rows:
+                    worksheet.write_row(row_index, 0, row)
+                    row_index += 1
+            workbook.close()
+
+            output.seek(0)
+            while chunk := output.read(64 * 1024):
+                yield chunk
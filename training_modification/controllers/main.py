@@ -1,6 +1,7 @@
 from odoo import http
+from odoo.exceptions import UserError
 from odoo.http import request
-import base64
+from odoo.addons.website_slides.controllers.main import WebsiteSlides
 
 
 class AttendanceProofController(http.Controller):
@@ -15,6 +16,7 @@ class AttendanceProofController(http.Controller):
             return request.redirect('/slides')
 
         partner = request.env.user.partner_id
+        request.env['slide.channel.recent'].sudo()._record_visit(channel_id)
 
         # Check if user is enrolled in the course
         is_member = request.env['slide.channel.partner'].search([
@@ -114,27 +116,32 @@ class AttendanceProofController(http.Controller):
             request.session['proof_upload_error'] = 'Invalid training schedule selected.'
             return request.redirect(f'/slides/course/{channel_id}/upload-proof')
 
-        # Handle multiple file uploads
-        files = request.httprequest.files.getlist('proof_file')
+        # Handle multiple file uploads; werkzeug spools each part to a temporary
+        # file, which is then copied to the filestore in chunks
+        Proof = request.env['attendance.proof']
+        _max_file_size, max_request_size = Proof._get_upload_limits()
+        if (request.httprequest.content_length or 0) > max_request_size:
+            request.session['proof_upload_error'] = (
+                f'The uploaded files exceed {max_request_size // (1024 * 1024)} MB in total.')
+            return request.redirect(f'/slides/course/{channel_id}/upload-proof')
+
+        files = [proof_file for proof_file in request.httprequest.files.getlist('proof_file') if proof_file]
 
         if files:
             try:
-                for proof_file in files:
-                    if proof_file:
-                        vals = {
-                            'partner_id': partner.id,
-                            'course_id': channel_id,
-                            'training_date': training_date,
-                            'proof_image': base64.b64encode(proof_file.read()),
-                            'proof_filename': proof_file.filename,
-                            'notes': notes or '',
-                            'status': 'pending'
-                        }
-                        request.env['attendance.proof'].create(vals)
+                Proof._create_from_uploads({
+                    'partner_id': partner.id,
+                    'course_id': channel_id,
+                    'training_date': training_date,
+                    'notes': notes or '',
+                    'status': 'pending'
+                }, files)
 
                 # Set success message
                 request.session['proof_upload_success'] = True
 
+            except UserError as e:
+                request.session['proof_upload_error'] = e.args[0]
             except Exception as e:
                 # Log error
                 request.env['ir.logging'].sudo().create({
@@ -152,6 +159,32 @@ class AttendanceProofController(http.Controller):
 
         return request.redirect(f'/slides/course/{channel_id}/upload-proof')
 
+    @http.route('/training/checkin', type='json', auth='user', methods=['POST'])
+    def training_checkin(self, token=None, **kwargs):
+        """Check the current user in to a training session from a scanned QR token.
+
+        The token is verified in memory (see training.calendar._verify_checkin_token)
+        and the presence is recorded with a single statement.
+        """
+        return self._check_in(token)
+
+    @http.route('/training/checkin/<string:token>', type='http', auth='user', website=True)
+    def training_checkin_page(self, token, **kwargs):
+        """Target of the session QR codes: check in, then show the course calendar"""
+        result = self._check_in(token)
+        if result.get('channel_id'):
+            return request.redirect(f"/slides/course/{result['channel_id']}/calendar?checkin={result['status']}")
+        return request.redirect('/slides')
+
+    def _check_in(self, token):
+        checkin = request.env['training.calendar']._verify_checkin_token(token)
+        if checkin['status'] != 'ok':
+            return checkin
+        # Attendees can only mark themselves, for the course and date of the signed token
+        matched = request.env['slide.attendance'].sudo().mark_attendance(
+            checkin['channel_id'], checkin['date'], [request.env.user.partner_id.id])
+        return dict(checkin, status='ok' if matched else 'not_enrolled')
+
     @http.route('/slides/course/proof/delete/<int:proof_id>', type='http', auth='user', website=True, csrf=True)
     def delete_proof(self, proof_id, **kwargs):
         """Delete a proof record"""
@@ -181,6 +214,7 @@ class AttendanceProofController(http.Controller):
 
         # Get current user partner
         current_partner = request.env.user.partner_id
+        request.env['slide.channel.recent'].sudo()._record_visit(channel_id)
 
         # Get current month/year or use provided
         today = date.today()
@@ -286,4 +320,14 @@ class AttendanceProofController(http.Controller):
             'editable': True,
         }
 
-        return request.render('training_modification.training_calendar_page', values)
\ No newline at end of file
+        return request.render('training_modification.training_calendar_page', values)
+
+
+class WebsiteSlidesRecent(WebsiteSlides):
+
+    @http.route()
+    def channel(self, channel=False, **kwargs):
+        """Remember the course as the user's current one"""
+        if channel:
+            request.env['slide.channel.recent'].sudo()._record_visit(channel.id)
+        return super().channel(channel=channel, **kwargs)
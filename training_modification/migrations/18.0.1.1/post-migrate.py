@@ -0,0 +1,31 @@
+import logging
+
+from odoo import api, fields, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """Attendance is now generated per training session (training.calendar)"""
+    # Link the existing rows to the session held on their date
+    cr.execute("""
+        UPDATE slide_attendance sa
+           SET session_id = tc.id
+          FROM training_calendar tc
+         WHERE sa.session_id IS NULL
+           AND tc.course_id = sa.channel_id
+           AND tc.training_date = sa.date
+    """)
+    _logger.info("Linked %s attendance records to their training session", cr.rowcount)
+
+    # Rows of days without a session were created on every course read and
+    # never filled in; the ones marked present are kept
+    cr.execute("DELETE FROM slide_attendance WHERE session_id IS NULL AND NOT present")
+    _logger.info("Deleted %s attendance records of days without a training session", cr.rowcount)
+
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    # Past sessions keep the attendance that was recorded; absent rows are only
+    # created for the upcoming ones
+    sessions = env['training.calendar'].search([('training_date', '>=', fields.Date.today())])
+    created = sessions._generate_attendance()
+    _logger.info("Created %s missing attendance records for upcoming sessions", created)
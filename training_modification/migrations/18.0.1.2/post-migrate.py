@@ -0,0 +1,18 @@
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """Proofs now record the hash of their uploaded file"""
+    # Not normalized yet: the checksum of the stored image is the one of the upload
+    cr.execute("""
+        UPDATE attendance_proof proof
+           SET content_hash = attachment.checksum
+          FROM ir_attachment attachment
+         WHERE attachment.res_model = 'attendance.proof'
+           AND attachment.res_field = 'proof_image'
+           AND attachment.res_id = proof.id
+           AND proof.content_hash IS NULL
+    """)
+    _logger.info("Set the content hash of %s attendance proofs", cr.rowcount)
@@ -0,0 +1,9 @@
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """The partial index on present attendance duplicated (channel_id, date)"""
+    cr.execute("DROP INDEX IF EXISTS slide_attendance_present_channel_date_index")
+    _logger.info("Dropped the redundant index slide_attendance_present_channel_date_index")
@@ -1,2 +1,9 @@
+from . import elearning_dashboard_source
 from . import slide_channel
-from . import elearning_dashboard_service
\ No newline at end of file
+from . import elearning_dashboard_service
+from . import elearning_dashboard_snapshot
+from . import slide_attendance_summary
+from . import slide_channel_recent
+from . import attendance_proof_job
+from . import attendance_proof_duplicate
+from . import ir_websocket
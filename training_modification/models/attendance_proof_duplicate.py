@@ -0,0 +1,57 @@
+from odoo import models, fields, tools, _
+
+
+class AttendanceProofDuplicate(models.Model):
+    _name = 'attendance.proof.duplicate'
+    _description = 'Duplicate Attendance Proofs'
+    _auto = False
+    _order = 'suspicious desc, reclaimed_size desc'
+
+    content_hash = fields.Char(string='Content Hash', readonly=True)
+    proof_count = fields.Integer(string='Proofs', readonly=True)
+    partner_count = fields.Integer(string='Attendees', readonly=True)
+    course_count = fields.Integer(string='Courses', readonly=True)
+    file_size = fields.Integer(string='File Size', readonly=True)
+    reclaimed_size = fields.Integer(string='Storage Reclaimed', readonly=True,
+                                    help='Bytes not stored thanks to the shared file')
+    first_upload = fields.Datetime(string='First Upload', readonly=True)
+    last_upload = fields.Datetime(string='Last Upload', readonly=True)
+    suspicious = fields.Boolean(string='Several Attendees', readonly=True,
+                                help='The same file was uploaded by different attendees')
+
+    def init(self):
+        # Proofs sharing the content of their upload; the copies share one
+        # file of the checksum-addressed filestore
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute("""
+            CREATE VIEW attendance_proof_duplicate AS (
+                SELECT MIN(proof.id) AS id,
+                       proof.content_hash,
+                       COUNT(*) AS proof_count,
+                       COUNT(DISTINCT proof.partner_id) AS partner_count,
+                       COUNT(DISTINCT proof.course_id) AS course_count,
+                       MAX(attachment.file_size) AS file_size,
+                       (COUNT(*) - 1) * MAX(attachment.file_size) AS reclaimed_size,
+                       MIN(proof.upload_date) AS first_upload,
+                       MAX(proof.upload_date) AS last_upload,
+                       COUNT(DISTINCT proof.partner_id) > 1 AS suspicious
+                  FROM attendance_proof proof
+             LEFT JOIN ir_attachment attachment
+                    ON attachment.res_model = 'attendance.proof'
+                   AND attachment.res_field = 'proof_image'
+                   AND attachment.res_id = proof.id
+                 WHERE proof.content_hash IS NOT NULL
+              GROUP BY proof.content_hash
+                HAVING COUNT(*) > 1
+            )
+        """)
+
+    def action_view_proofs(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _("Duplicate Proofs"),
+            'res_model': 'attendance.proof',
+            'view_mode': 'list,form',
+            'domain': [('content_hash', '=', self.content_hash)],
+        }
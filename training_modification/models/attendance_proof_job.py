@@ -0,0 +1,71 @@
+from odoo import models, fields, api
+from odoo.tools import SQL
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Jobs processed per cron run; the cron retriggers itself while some remain
+PROOF_JOBS_PER_RUN = 20
+PROOF_JOB_MAX_ATTEMPTS = 3
+
+
+class AttendanceProofJob(models.Model):
+    _name = 'attendance.proof.job'
+    _description = 'Attendance Proof Image Processing'
+    _order = 'id'
+
+    proof_id = fields.Many2one('attendance.proof', string='Proof', required=True, ondelete='cascade')
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('failed', 'Failed'),
+    ], string='Status', default='pending', required=True, index=True)
+    attempts = fields.Integer(string='Attempts')
+    error = fields.Text(string='Last Error')
+
+    @api.model
+    def _enqueue(self, proofs):
+        """Queue the images of ``proofs`` for processing and wake the worker up"""
+        if not proofs:
+            return
+        self.env.cr.execute(SQL("""
+            INSERT INTO attendance_proof_job (proof_id, state, attempts,
+                                              create_uid, create_date, write_uid, write_date)
+                 SELECT proof.id, 'pending', 0,
+                        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+                   FROM unnest(%(ids)s) AS proof(id)
+                  WHERE NOT EXISTS (SELECT 1 FROM attendance_proof_job job
+                                     WHERE job.proof_id = proof.id AND job.state = 'pending')
+            """, uid=self.env.uid, ids=list(proofs.ids)))
+        self.env.ref('training_modification.ir_cron_process_proof_images')._trigger()
+
+    @api.model
+    def _cron_process_jobs(self):
+        """Normalize the images of the pending proofs, a batch per run"""
+        self.flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT id FROM attendance_proof_job
+             WHERE state = 'pending'
+          ORDER BY id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+            """, PROOF_JOBS_PER_RUN + 1))
+        job_ids = [row[0] for row in self.env.cr.fetchall()]
+
+        for job in self.browse(job_ids[:PROOF_JOBS_PER_RUN]):
+            try:
+                with self.env.cr.savepoint():
+                    job.proof_id._process_image()
+            except Exception as e:
+                _logger.warning("Processing the image of proof %s failed", job.proof_id.id, exc_info=True)
+                attempts = job.attempts + 1
+                job.write({
+                    'attempts': attempts,
+                    'error': str(e),
+                    'state': 'failed' if attempts >= PROOF_JOB_MAX_ATTEMPTS else 'pending',
+                })
+            else:
+                job.unlink()
+
+        if len(job_ids) > PROOF_JOBS_PER_RUN:
+            self.env.ref('training_modification.ir_cron_process_proof_images')._trigger()
+
@@ -1,8 +1,86 @@
-from odoo import models, fields, api
-from datetime import datetime, date
+from odoo import models, fields, api, modules, _
+from odoo.exceptions import AccessError
+from odoo.http import request
+from odoo.tools import SQL
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta
+import hashlib
+import json
 import logging
+import statistics
+import threading
+import time
 
 _logger = logging.getLogger(__name__)
+# One line per measured computation, at DEBUG level (failures at WARNING), e.g. to ship to a log pipeline:
+# --log-handler=odoo.addons.training_modification.models.elearning_dashboard_service.metrics:DEBUG
+_metrics_logger = logging.getLogger(__name__ + '.metrics')
+
+# Dashboard sections: name -> (compute method, source models, uses per-course stats).
+# The source models are the tables whose changes invalidate a stored snapshot.
+DASHBOARD_SECTIONS = {
+    'kpis': ('_get_kpis', (
+        'slide.channel', 'slide.channel.partner', 'slide.slide', 'slide.question',
+        'slide.attendance', 'slide.attendance.summary', 'mailing.mailing', 'survey.survey',
+    ), True),
+    'CourseProgressChart': ('_get_course_progress_chart', ('slide.channel', 'slide.channel.partner', 'rating.rating'), True),
+    'enrollmentsByMonth': ('_get_enrollments_by_month', ('slide.channel.partner',), False),
+    'attendanceByMonth': ('_get_attendance_by_month', ('slide.attendance', 'slide.attendance.summary'), False),
+    'completionRates': ('_get_completion_rates', ('slide.channel', 'slide.channel.partner'), True),
+    'studentProgress': ('_get_student_progress_distribution', ('slide.channel.partner',), True),
+}
+CHART_SECTIONS = [name for name in DASHBOARD_SECTIONS if name != 'kpis']
+# Source models whose changes are not reported to _schedule_dashboard_update
+# (survey is not a dependency): fingerprinted by row count and last write date
+UNTRACKED_SOURCE_MODELS = ('survey.survey',)
+
+# Ranked course series: name -> (SQL sort key on the per-course stats, ascending
+# with ties broken by course id, list courses without enrollments). Pages are
+# fetched with a keyset cursor on (sort key, id).
+COURSE_SERIES = {
+    'top_enrollment': ("-stats.total", False),
+    'worst_completion': ("stats.completed::float / stats.total", False),
+    'all': ("lower(stats.name)", True),
+}
+COURSE_SERIES_PAGE_SIZE = 10
+COURSE_SERIES_MAX_PAGE_SIZE = 100
+
+# Columns of the per-course stats query, see _get_enrollment_stats_query
+ENROLLMENT_STATS_COLUMNS = (
+    'id', 'name', 'active', 'published', 'sequence', 'total', 'not_started',
+    'in_progress', 'completed', 'certified', 'started', 'attended',
+)
+
+# Datasets that can be exported (see controllers/dashboard_export.py): name ->
+# method returning the column headers and the query, and the rows fetched per
+# batch from the server-side cursor
+EXPORT_DATASETS = {
+    'course_progress': '_get_course_progress_export',
+    'monthly_attendance': '_get_monthly_attendance_export',
+    'completion_rates': '_get_completion_rates_export',
+    'enrollments': '_get_enrollments_export',
+}
+EXPORT_BATCH_SIZE = 2000
+
+# Opt-in parallel evaluation of the sections: size of the thread pool (0 or 1
+# evaluates them sequentially); each worker holds a database connection
+PARALLEL_WORKERS_PARAM = 'training_modification.dashboard_parallel_workers'
+PARALLEL_MAX_WORKERS = 8
+
+# Changes are pushed to open dashboards at most once per window (seconds)
+DASHBOARD_PUSH_WINDOW = 5
+
+# Rolling window of measurements kept per computation, in the memory of each
+# worker, and the upper bounds (ms) of the duration histogram buckets
+METRICS_WINDOW = 500
+METRICS_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+_metrics = defaultdict(lambda: deque(maxlen=METRICS_WINDOW))
+_metrics_lock = threading.Lock()
+# Per-thread measurement state: the stack of running measurements (rows are
+# attributed to the innermost one) and the list collecting the current call
+_measuring = threading.local()
 
 
 class ELearningDashboardService(models.AbstractModel):
@@ -10,12 +88,11 @@ class ELearningDashboardService(models.AbstractModel):
     _description = "eLearning Dashboard Service"
 
     def _safe_count(self, model, domain=None):
-        try:
-            if domain is None:
-                domain = []
-            return self.env[model].search_count(domain)
-        except Exception:
+        """search_count that counts 0 for optional models that are not installed (e.g. survey)"""
+        if model not in self.env:
             return 0
+        self._add_fetched_rows(1)
+        return self.env[model].search_count(domain or [])
 
     @api.model
     def get_initial_kpis(self):
@@ -23,59 +100,561 @@ class ELearningDashboardService(models.AbstractModel):
         return self.get_dashboard_data()['kpis']
 
     @api.model
-    def get_dashboard_data(self):
-        """Get both KPIs and chart data"""
-        kpis = {
-            "totalCourses": self._safe_count("slide.channel"),
-            "totalStudents": self._safe_count("slide.channel.partner"),
-            "activeCourses": self._safe_count("slide.channel", [('is_published', '=', True)]),
-            "completedCourses": self._get_completed_courses_count(),
-            "totalContent": self._safe_count("slide.slide"),
-            "attendanceRecords": self._get_attendance_percentage(),
-            "mailingCampaigns": self._safe_count("mailing.mailing", [('course_id', '!=', False)]),
-            "totalCertificates": self._safe_count("survey.survey"),
-            "quizzes": self._safe_count("slide.question"),
-            "CourseRatings": self._get_course_ratings(),
-            "employeesEnrolledThisMonth": self._get_employees_enrolled_this_month(),
-            "pendingCourses": self._safe_count("slide.question", [('is_published', '=', False)]),
+    def get_dashboard_data(self, filters=None):
+        """Get both KPIs and chart data.
+
+        Unfiltered dashboards are served from the precomputed snapshot; filtered
+        ones (see _normalize_filters) are computed live on the matching slice.
+        """
+        with self._collect_measurements() as measurements:
+            sections = self._get_sections(list(DASHBOARD_SECTIONS), filters)
+
+        result = {
+            "kpis": sections['kpis']['data'],
+            "chartData": {name: sections[name]['data'] for name in CHART_SECTIONS},
+            "refreshedAt": min(section['refresh_date'] for section in sections.values()),
         }
+        if self._is_debug_mode():
+            result['debug'] = measurements
+        return result
+
+    @api.model
+    def get_dashboard_section(self, name, since_version=None, filters=None):
+        """Get a single dashboard section.
+
+        When ``since_version`` matches the current version, only a not-modified
+        marker is returned and the client keeps what it already rendered.
+        """
+        return self.get_dashboard_sections({name: since_version}, filters)[name]
+
+    @api.model
+    def get_dashboard_sections(self, versions, filters=None):
+        """Batched get_dashboard_section: ``versions`` maps section names to the version held by the client"""
+        unknown = set(versions) - set(DASHBOARD_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown dashboard sections: {', '.join(sorted(unknown))}")
+
+        with self._collect_measurements() as measurements:
+            sections = self._get_sections(list(versions), filters)
 
-        chart_data = {
-            "CourseProgressChart": self._get_course_progress_chart(),
-            "enrollmentsByMonth": self._get_enrollments_by_month(),
-            "attendanceByMonth": self._get_attendance_by_month(),
-            "completionRates": self._get_completion_rates(),
-            "studentProgress": self._get_student_progress_distribution(),
+        result = {}
+        for name, since_version in versions.items():
+            section = sections[name]
+            if since_version and since_version == section['version']:
+                result[name] = {'version': section['version'], 'notModified': True}
+            else:
+                result[name] = {
+                    'version': section['version'],
+                    'data': section['data'],
+                    'refreshedAt': section['refresh_date'],
+                }
+        if self._is_debug_mode():
+            result['__debug__'] = measurements
+        return result
+
+    @api.model
+    def get_course_series(self, series='top_enrollment', limit=COURSE_SERIES_PAGE_SIZE, after=None, filters=None):
+        """One page of a ranked course series (see COURSE_SERIES) with progress and ratings.
+
+        ``after`` is the ``next`` cursor returned with the previous page. Returns
+        ``{'series', 'items', 'next'}``, ``next`` being False on the last page.
+        """
+        if series not in COURSE_SERIES:
+            raise ValueError(f"Unknown course series: {series}")
+        limit = max(1, min(int(limit or COURSE_SERIES_PAGE_SIZE), COURSE_SERIES_MAX_PAGE_SIZE))
+
+        with self._collect_measurements() as measurements:
+            result = self._instrumented(
+                f'courseSeries.{series}', self._get_course_series_page,
+                series, limit, after, self._normalize_filters(filters))
+        if self._is_debug_mode():
+            result['debug'] = measurements
+        return result
+
+    def _get_course_series_page(self, series, limit, after, filters):
+        sort_key, include_empty = COURSE_SERIES[series]
+        conditions = [SQL("stats.active")]
+        if not include_empty:
+            conditions.append(SQL("stats.total > 0"))
+        if after:
+            conditions.append(SQL("(%s, stats.id) > (%s, %s)", SQL(sort_key), after[0], int(after[1])))
+
+        # One row more than requested tells whether there is a next page
+        rows = self._fetchall(SQL("""
+            SELECT stats.*, %(sort_key)s
+              FROM (%(stats)s) stats
+             WHERE %(where)s
+          ORDER BY %(sort_key)s, stats.id
+             LIMIT %(limit)s
+            """,
+            sort_key=SQL(sort_key),
+            stats=self._get_enrollment_stats_query(filters),
+            where=SQL(" AND ").join(conditions),
+            limit=limit + 1,
+        ))
+        page = rows[:limit]
+        courses = [dict(zip(ENROLLMENT_STATS_COLUMNS, row)) for row in page]
+        return {
+            'series': series,
+            'items': self._get_course_series_items(courses),
+            'next': [page[-1][-1], page[-1][0]] if len(rows) > limit else False,
         }
 
+    def _get_course_series_items(self, courses):
+        """Chart entries of the given per-course stats, with their ratings"""
+        ratings = self._get_ratings_by_course([course['id'] for course in courses])
+        items = []
+        for course in courses:
+            avg_rating, total_reviews = ratings.get(course['id'], (0, 0))
+            items.append({
+                'id': course['id'],
+                'course': course['name'],
+                'notStarted': course['not_started'],
+                'inProgress': course['in_progress'],
+                'completed': course['completed'],
+                'totalEnrolled': course['total'],
+                'completionRate': round(course['completed'] / course['total'] * 100, 1) if course['total'] else 0,
+                'avgRating': round(avg_rating or 0, 2),
+                'totalReviews': total_reviews,
+            })
+        return items
+
+    @api.model
+    def _get_export_query(self, dataset, filters=None):
+        """Column headers and query of an export dataset (see EXPORT_DATASETS).
+
+        The query reads the tables directly, so the export is restricted to
+        eLearning officers, like the dashboard itself.
+        """
+        if dataset not in EXPORT_DATASETS:
+            raise ValueError(f"Unknown export dataset: {dataset}")
+        if not self.env.user.has_group('website_slides.group_website_slides_officer'):
+            raise AccessError(_("Only eLearning officers can export the training dashboard data."))
+        return getattr(self, EXPORT_DATASETS[dataset])(self._normalize_filters(filters))
+
+    def _get_course_progress_export(self, filters):
+        headers = [_("Course"), _("Published"), _("Enrolled"), _("Not Started"), _("In Progress"),
+                   _("Completed"), _("Certified"), _("Attended")]
+        return headers, SQL("""
+            SELECT stats.name, stats.published, stats.total, stats.not_started, stats.in_progress,
+                   stats.completed, stats.certified, stats.attended
+              FROM (%s) stats
+             WHERE stats.active
+          ORDER BY stats.sequence, stats.id
+        """, self._get_enrollment_stats_query(filters))
+
+    def _get_completion_rates_export(self, filters):
+        headers = [_("Course"), _("Enrolled"), _("Completed"), _("Completion Rate (%)")]
+        return headers, SQL("""
+            SELECT stats.name, stats.total, stats.completed,
+                   ROUND(stats.completed * 100.0 / stats.total, 1) AS rate
+              FROM (%s) stats
+             WHERE stats.active AND stats.total > 0
+          ORDER BY rate DESC, stats.id
+        """, self._get_enrollment_stats_query(filters))
+
+    def _get_monthly_attendance_export(self, filters):
+        headers = [_("Month"), _("Sessions"), _("Present"), _("Attendance Rate (%)")]
+        return headers, SQL("""
+            SELECT to_char(history.month, 'YYYY-MM'),
+                   SUM(history.total),
+                   SUM(history.present),
+                   ROUND(SUM(history.present) * 100.0 / NULLIF(SUM(history.total), 0), 1)
+              FROM (%s) history
+          GROUP BY history.month
+          ORDER BY history.month
+        """, self._get_attendance_history_sql(filters))
+
+    def _get_enrollments_export(self, filters):
+        for model in ('slide.channel.partner', 'slide.attendance', 'slide.attendance.summary'):
+            self.env[model].flush_model()
+        completed, _certified = self._get_enrollment_state_sql()
+        member_active = SQL("scp.active") if self._has_column('slide.channel.partner', 'active') else SQL("TRUE")
+        headers = [_("Course"), _("Attendee"), _("Email"), _("Enrolled On"), _("Progress (%)"), _("Status"),
+                   _("Sessions"), _("Present")]
+        # The lateral join keeps the plan streaming: attendance is counted per
+        # enrollment through the unique_attendance index as rows are fetched
+        return headers, SQL("""
+            SELECT COALESCE(sc.name->>%(lang)s, sc.name->>'en_US'),
+                   rp.name,
+                   rp.email,
+                   scp.create_date,
+                   COALESCE(scp.completion, 0),
+                   CASE WHEN %(completed)s THEN 'completed'
+                        WHEN scp.completion > 0 THEN 'in_progress'
+                        ELSE 'not_started' END,
+                   att.sessions + COALESCE(archived.sessions, 0),
+                   att.present + COALESCE(archived.present, 0)
+              FROM slide_channel_partner scp
+              JOIN slide_channel sc ON sc.id = scp.channel_id
+              JOIN res_partner rp ON rp.id = scp.partner_id
+     LEFT JOIN LATERAL (SELECT COUNT(*) AS sessions, COUNT(*) FILTER (WHERE sa.present) AS present
+                          FROM slide_attendance sa
+                         WHERE sa.name = scp.id) att ON TRUE
+     LEFT JOIN LATERAL (SELECT SUM(sas.total_count) AS sessions, SUM(sas.present_count) AS present
+                          FROM slide_attendance_summary sas
+                         WHERE sas.channel_id = scp.channel_id AND sas.partner_id = scp.partner_id) archived ON TRUE
+             WHERE %(member_active)s AND %(filter)s
+          ORDER BY scp.id
+            """,
+            lang=self.env.lang or 'en_US',
+            completed=completed,
+            member_active=member_active,
+            filter=self._get_filter_sql(
+                filters, channel=('scp', 'channel_id'), partner=('scp', 'partner_id'), date=('scp', 'create_date')),
+        )
+
+    @api.model
+    def get_dashboard_metrics(self):
+        """Summary of the recent measurements of every dashboard computation.
+
+        Measurements are kept in memory per worker (the last METRICS_WINDOW of
+        each computation), so the figures describe the worker serving the call.
+        """
+        if not self.env.is_admin():
+            raise AccessError(_("Only administrators can read the dashboard metrics."))
+
+        with _metrics_lock:
+            samples_by_name = {name: list(samples) for name, samples in _metrics.items()}
+
+        metrics = {}
+        for name, samples in sorted(samples_by_name.items()):
+            durations = sorted(sample['duration_ms'] for sample in samples)
+            histogram = []
+            lower = 0
+            for upper in METRICS_BUCKETS_MS + (None,):
+                histogram.append({
+                    'le': upper,
+                    'count': sum(1 for duration in durations if duration >= lower and (upper is None or duration < upper)),
+                })
+                lower = upper
+            metrics[name] = {
+                'samples': len(samples),
+                'errors': sum(1 for sample in samples if sample['status'] != 'ok'),
+                'duration_ms': {
+                    'mean': round(statistics.fmean(durations), 2),
+                    'p50': durations[len(durations) // 2],
+                    'p95': durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+                    'max': durations[-1],
+                },
+                'queries': {
+                    'mean': round(statistics.fmean(sample['queries'] for sample in samples), 2),
+                    'max': max(sample['queries'] for sample in samples),
+                },
+                'rows': {
+                    'mean': round(statistics.fmean(sample['rows'] for sample in samples), 2),
+                    'max': max(sample['rows'] for sample in samples),
+                },
+                'histogram': histogram,
+                'last': samples[-1]['at'],
+            }
+        return metrics
+
+    def _is_debug_mode(self):
+        return bool(request and request.session.debug)
+
+    @contextmanager
+    def _collect_measurements(self):
+        """Collect the measurements taken by the current thread in the block"""
+        previous = getattr(_measuring, 'collected', None)
+        _measuring.collected = collected = []
+        try:
+            yield collected
+        finally:
+            _measuring.collected = previous
+
+    def _instrumented(self, name, func, *args, **kwargs):
+        """Call ``func`` and record its wall time, SQL query count and rows fetched under ``name``.
+
+        Measurements nest: the queries and rows of an inner measurement also
+        count for the enclosing one.
+        """
+        stack = _measuring.__dict__.setdefault('stack', [])
+        frame = {'rows': 0}
+        stack.append(frame)
+        queries_before = self.env.cr.sql_log_count
+        start = time.perf_counter()
+        status = 'ok'
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            status = 'error'
+            raise
+        finally:
+            stack.pop()
+            if stack:
+                stack[-1]['rows'] += frame['rows']
+            self._record_measurement({
+                'name': name,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 2),
+                'queries': self.env.cr.sql_log_count - queries_before,
+                'rows': frame['rows'],
+                'status': status,
+                'at': fields.Datetime.to_string(fields.Datetime.now()),
+            })
+
+    def _add_fetched_rows(self, count):
+        stack = getattr(_measuring, 'stack', None)
+        if stack:
+            stack[-1]['rows'] += count
+
+    def _record_measurement(self, measurement):
+        with _metrics_lock:
+            _metrics[measurement['name']].append(measurement)
+        collected = getattr(_measuring, 'collected', None)
+        if collected is not None:
+            collected.append(measurement)
+        log = _metrics_logger.warning if measurement['status'] != 'ok' else _metrics_logger.debug
+        log("dashboard_metric name=%s duration_ms=%.2f queries=%d rows=%d status=%s company=%s",
+            measurement['name'], measurement['duration_ms'], measurement['queries'],
+            measurement['rows'], measurement['status'], self.env.company.id)
+
+    def _fetchall(self, query):
+        """Execute ``query`` and return its rows, counting them for the running measurement"""
+        self.env.cr.execute(query)
+        rows = self.env.cr.fetchall()
+        self._add_fetched_rows(len(rows))
+        return rows
+
+    def _get_sections(self, names, filters=None):
+        filters = self._normalize_filters(filters)
+        if not filters:
+            return self._instrumented(
+                'snapshot', self.env['elearning.dashboard.snapshot'].sudo()._get_sections, self.env.company, names)
+
+        values = self._compute_sections(names, filters)
+        now = fields.Datetime.to_string(fields.Datetime.now())
         return {
-            "kpis": kpis,
-            "chartData": chart_data
+            name: {'data': data, 'version': self._get_section_version(data), 'refresh_date': now}
+            for name, data in values.items()
         }
 
-    def _get_attendance_percentage(self):
-        """Get average attendance percentage across all active courses"""
-        active_courses = self.env["slide.channel"].search([("is_published", "=", True)])
-        if not active_courses:
-            return "0%"
+    @api.model
+    def _get_section_version(self, data):
+        """Content hash of a section, stable across recomputations of identical data"""
+        return hashlib.sha1(self._serialize_section(data).encode()).hexdigest()[:16]
 
-        course_percentages = []
+    @api.model
+    def _serialize_section(self, data):
+        return json.dumps(data, default=str, sort_keys=True)
 
-        for course in active_courses:
-            enrolled_students = len(course.channel_partner_ids)
-            if enrolled_students == 0:
-                continue
+    @api.model
+    def _normalize_filters(self, filters):
+        """Validate dashboard filters sent by the client.
 
-            # Get attendance records for this course
-            course_attendance = self.env["slide.attendance"].search([
-                ("channel_id", "=", course.id)
+        Supported keys: ``date_from``/``date_to`` (dates, inclusive), ``tag_ids``
+        (course tags), ``department_ids`` (hr departments, including their
+        sub-departments) and ``published`` (True/False). Returns an empty dict
+        when nothing is filtered.
+        """
+        filters = filters or {}
+        normalized = {}
+        if filters.get('date_from'):
+            normalized['date_from'] = fields.Date.to_date(filters['date_from'])
+        if filters.get('date_to'):
+            normalized['date_to'] = fields.Date.to_date(filters['date_to'])
+        if filters.get('tag_ids'):
+            normalized['tag_ids'] = [int(tag_id) for tag_id in filters['tag_ids']]
+        if filters.get('department_ids'):
+            departments = self.env['hr.department'].sudo().search([
+                ('id', 'child_of', [int(department_id) for department_id in filters['department_ids']]),
             ])
+            employees = self.env['hr.employee'].sudo().with_context(active_test=False).search_fetch(
+                [('department_id', 'in', departments.ids), ('work_contact_id', '!=', False)], ['work_contact_id'])
+            normalized['department_ids'] = departments.ids
+            normalized['partner_ids'] = employees.work_contact_id.ids or [0]
+        if filters.get('published') in (True, False):
+            normalized['published'] = filters['published']
+        return normalized
+
+    def _get_course_domain(self, filters):
+        domain = []
+        if filters.get('tag_ids'):
+            domain.append(('tag_ids', 'in', filters['tag_ids']))
+        if 'published' in filters:
+            domain.append(('is_published', '=', filters['published']))
+        return domain
+
+    def _get_enrollment_domain(self, filters, date_field='create_date'):
+        """slide.channel.partner domain for the filtered courses, departments and period"""
+        domain = []
+        course_domain = self._get_course_domain(filters)
+        if course_domain:
+            domain.append(('channel_id', 'any', course_domain))
+        if filters.get('partner_ids'):
+            domain.append(('partner_id', 'in', filters['partner_ids']))
+        if filters.get('date_from'):
+            domain.append((date_field, '>=', filters['date_from']))
+        if filters.get('date_to'):
+            domain.append((date_field, '<', filters['date_to'] + timedelta(days=1)))
+        return domain
+
+    def _get_filter_sql(self, filters, channel=None, partner=None, date=None):
+        """WHERE condition restricting a raw query to the dashboard filters.
+
+        ``channel``, ``partner`` and ``date`` are (alias, column) pairs naming the
+        course, partner and date columns of the query; the course filters are
+        expanded into a subquery of the ORM domain above.
+        """
+        conditions = []
+        course_domain = self._get_course_domain(filters)
+        if channel and course_domain:
+            conditions.append(SQL(
+                "%s IN %s", SQL.identifier(*channel),
+                self.env['slide.channel'].with_context(active_test=False)._search(course_domain).subselect(),
+            ))
+        if partner and filters.get('partner_ids'):
+            conditions.append(SQL("%s IN %s", SQL.identifier(*partner), tuple(filters['partner_ids'])))
+        if date and filters.get('date_from'):
+            conditions.append(SQL("%s >= %s", SQL.identifier(*date), filters['date_from']))
+        if date and filters.get('date_to'):
+            conditions.append(SQL("%s < %s", SQL.identifier(*date), filters['date_to'] + timedelta(days=1)))
+        return SQL(" AND ").join(conditions) if conditions else SQL("TRUE")
+
+    @api.model
+    def _schedule_dashboard_update(self, *model_names):
+        """Have the snapshot cron refresh and push the dashboard after this transaction.
+
+        ``model_names`` are the source models that changed: their change
+        counters are bumped once the transaction is committed, see
+        elearning.dashboard.snapshot._get_source_fingerprints. Triggers are
+        aligned on DASHBOARD_PUSH_WINDOW boundaries so that all the changes
+        committed within one window result in a single refresh and a single
+        bus message.
+        """
+        changed = self.env.cr.postcommit.data.get('training_dashboard_sources')
+        if changed is not None:
+            changed.update(model_names)
+            return
+        self.env.cr.postcommit.data['training_dashboard_sources'] = set(model_names)
+        self.env.cr.postcommit.add(self.env['elearning.dashboard.snapshot']._bump_source_counters)
+
+        cron = self.env.ref('training_modification.ir_cron_refresh_dashboard_snapshots', raise_if_not_found=False)
+        if cron:
+            now = fields.Datetime.now()
+            delay = DASHBOARD_PUSH_WINDOW - now.second % DASHBOARD_PUSH_WINDOW
+            cron.sudo()._trigger(at=now.replace(microsecond=0) + timedelta(seconds=delay))
+
+    def _compute_dashboard_data(self, filters=None):
+        """Compute KPIs and chart data live, bypassing the snapshot"""
+        sections = self._compute_sections(DASHBOARD_SECTIONS, self._normalize_filters(filters))
+
+        return {
+            "kpis": sections['kpis'],
+            "chartData": {name: sections[name] for name in CHART_SECTIONS},
+        }
+
+    def _compute_sections(self, names, filters=None):
+        """Compute the given dashboard sections, sharing the per-course stats query"""
+        filters = filters or {}
+        workers = self._get_parallel_workers()
+        if workers > 1 and len(names) > 1:
+            return self._compute_sections_parallel(names, filters, workers)
 
-            # Count unique students who attended this course
-            attended_students = len(set(course_attendance.mapped('name.id')))
+        stats = None
+        result = {}
+        for name in names:
+            method_name, _source_models, uses_stats = DASHBOARD_SECTIONS[name]
+            kwargs = {'filters': filters}
+            if uses_stats:
+                if stats is None:
+                    stats = self._instrumented('enrollmentStats', self._get_enrollment_stats, filters)
+                kwargs['stats'] = stats
+            result[name] = self._instrumented(name, getattr(self, method_name), **kwargs)
+        return result
 
-            course_percentage = (attended_students / enrolled_students) * 100
-            course_percentages.append(course_percentage)
+    def _get_parallel_workers(self):
+        """Number of threads evaluating the sections, from PARALLEL_WORKERS_PARAM.
+
+        The workers read through their own cursors and thus only see committed
+        data: the mode is meant for the snapshot cron and the filtered
+        dashboards, and is never used while running tests.
+        """
+        if modules.module.current_test:
+            return 0
+        try:
+            workers = int(self.env['ir.config_parameter'].sudo().get_param(PARALLEL_WORKERS_PARAM, 0))
+        except ValueError:
+            return 0
+        return min(workers, PARALLEL_MAX_WORKERS)
+
+    def _compute_sections_parallel(self, names, filters, workers):
+        """_compute_sections on a bounded thread pool, one read-only cursor per task.
+
+        The stats query is submitted first; the sections that use it wait for
+        its result while the other sections run alongside.
+        """
+        collected = getattr(_measuring, 'collected', None)
+
+        def run(func, *args, **kwargs):
+            with self.env.registry.cursor() as cr:
+                cr.execute("SET TRANSACTION READ ONLY")
+                thread = threading.current_thread()
+                thread.dbname = cr.dbname
+                thread.uid = self.env.uid
+                _measuring.collected = collected
+                try:
+                    service = self.with_env(api.Environment(cr, self.env.uid, self.env.context, su=self.env.su))
+                    return func(service, *args, **kwargs)
+                finally:
+                    _measuring.collected = None
+
+        def compute_stats(service):
+            return service._instrumented('enrollmentStats', service._get_enrollment_stats, filters)
+
+        def compute_section(service, name):
+            method_name, _source_models, uses_stats = DASHBOARD_SECTIONS[name]
+            kwargs = {'filters': filters}
+            if uses_stats:
+                kwargs['stats'] = stats_future.result()
+            return service._instrumented(name, getattr(service, method_name), **kwargs)
+
+        uses_stats = any(DASHBOARD_SECTIONS[name][2] for name in names)
+        with ThreadPoolExecutor(max_workers=min(workers, len(names) + uses_stats),
+                                thread_name_prefix='elearning_dashboard') as executor:
+            stats_future = executor.submit(run, compute_stats) if uses_stats else None
+            futures = {name: executor.submit(run, compute_section, name) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _get_kpis(self, stats=None, filters=None):
+        """Get the KPI strip values"""
+        filters = filters or {}
+        if stats is None:
+            stats = self._get_enrollment_stats(filters)
+
+        course_domain = self._get_course_domain(filters)
+        enrollment_domain = self._get_enrollment_domain(filters)
+        content_domain = [('channel_id', 'any', course_domain)] if course_domain else []
+        question_domain = [('slide_id.channel_id', 'any', course_domain)] if course_domain else []
+        mailing_domain = [('course_id', 'any', course_domain)] if course_domain else [('course_id', '!=', False)]
+
+        kpis = {
+            "totalCourses": lambda: self._safe_count("slide.channel", course_domain),
+            "totalStudents": lambda: self._safe_count("slide.channel.partner", enrollment_domain),
+            "activeCourses": lambda: self._safe_count("slide.channel", course_domain + [('is_published', '=', True)]),
+            "completedCourses": lambda: self._get_completed_courses_count(stats),
+            "totalContent": lambda: self._safe_count("slide.slide", content_domain),
+            "attendanceRecords": lambda: self._get_attendance_percentage(stats),
+            "mailingCampaigns": lambda: self._safe_count("mailing.mailing", mailing_domain),
+            "totalCertificates": lambda: self._safe_count("survey.survey"),
+            "quizzes": lambda: self._safe_count("slide.question", question_domain),
+            "CourseRatings": lambda: self._get_course_ratings(),
+            "employeesEnrolledThisMonth": lambda: self._get_employees_enrolled_this_month(filters),
+            # Shown as "Unpublished Courses" on the dashboard
+            "pendingCourses": lambda: self._safe_count("slide.channel", course_domain + [('is_published', '=', False)]),
+        }
+        return {name: self._instrumented(f'kpis.{name}', compute) for name, compute in kpis.items()}
+
+    def _get_attendance_percentage(self, stats=None, filters=None):
+        """Get average attendance percentage across all active courses"""
+        if stats is None:
+            stats = self._get_enrollment_stats(filters)
+
+        course_percentages = [
+            (course['attended'] / course['total']) * 100
+            for course in stats
+            if course['active'] and course['published'] and course['total']
+        ]
 
         if not course_percentages:
             return "0%"
@@ -83,26 +662,135 @@ class ELearningDashboardService(models.AbstractModel):
         average_percentage = sum(course_percentages) / len(course_percentages)
         return f"{round(average_percentage, 2)}%"
 
-    def _get_employees_enrolled_this_month(self):
-        try:
-            now = datetime.now()
-            start_of_month = datetime(now.year, now.month, 1)
-            enrollments = self.env['slide.channel.partner'].search_count([
-                ('create_date', '>=', start_of_month),
-            ])
-            return enrollments
-        except Exception:
-            return 0
+    def _get_enrollment_stats(self, filters=None):
+        """Per-course enrollment, progress and attendance counters.
+
+        Everything the course-level KPIs and charts need is computed by a single
+        grouped query, so the cost of a dashboard refresh does not depend on
+        the number of courses or enrollments. Filters restrict the courses,
+        the enrolled partners (department) and the enrollment/attendance dates.
+        """
+        rows = self._fetchall(SQL(
+            "SELECT * FROM (%s) stats ORDER BY stats.sequence, stats.id",
+            self._get_enrollment_stats_query(filters or {}),
+        ))
+        return [dict(zip(ENROLLMENT_STATS_COLUMNS, row)) for row in rows]
+
+    def _get_enrollment_stats_query(self, filters):
+        """The per-course stats query, selecting ENROLLMENT_STATS_COLUMNS"""
+        for model in ('slide.channel', 'slide.channel.partner', 'slide.attendance', 'slide.attendance.summary'):
+            self.env[model].flush_model()
+
+        completed, certified = self._get_enrollment_state_sql()
+        member_active = SQL("scp.active") if self._has_column('slide.channel.partner', 'active') else SQL("TRUE")
+
+        return SQL("""
+            SELECT sc.id AS id,
+                   COALESCE(sc.name->>%(lang)s, sc.name->>'en_US') AS name,
+                   sc.active AS active,
+                   sc.is_published AS published,
+                   sc.sequence AS sequence,
+                   COUNT(scp.id) AS total,
+                   COUNT(scp.id) FILTER (WHERE COALESCE(scp.completion, 0) = 0) AS not_started,
+                   COUNT(scp.id) FILTER (WHERE scp.completion > 0 AND scp.completion < 100 AND NOT %(completed)s) AS in_progress,
+                   COUNT(scp.id) FILTER (WHERE %(completed)s) AS completed,
+                   COUNT(scp.id) FILTER (WHERE %(completed)s AND %(certified)s) AS certified,
+                   COUNT(scp.id) FILTER (WHERE NOT %(completed)s AND scp.completion > 0) AS started,
+                   COALESCE(att.attended, 0) AS attended
+              FROM slide_channel sc
+         LEFT JOIN slide_channel_partner scp
+                ON scp.channel_id = sc.id AND %(member_active)s AND %(member_filter)s
+         LEFT JOIN (SELECT history.channel_id, COUNT(DISTINCT history.partner_id) AS attended
+                      FROM (%(attendance)s) history
+                  GROUP BY history.channel_id) att
+                ON att.channel_id = sc.id
+             WHERE %(course_filter)s
+          GROUP BY sc.id, att.attended
+            """,
+            lang=self.env.lang or 'en_US',
+            completed=completed,
+            certified=certified,
+            member_active=member_active,
+            member_filter=self._get_filter_sql(filters, partner=('scp', 'partner_id'), date=('scp', 'create_date')),
+            attendance=self._get_attendance_history_sql(filters, courses=False),
+            course_filter=self._get_filter_sql(filters, channel=('sc', 'id')),
+        )
+
+    def _get_attendance_history_sql(self, filters, date_from=None, date_to=None, courses=True):
+        """Detailed and archived attendance as one relation
+        (channel_id, partner_id, month, total, present).
 
-    def _get_completed_courses_count(self):
+        Detail rows count for one session each; rows of slide.attendance.summary
+        carry the counts of a month rolled up by the archival cron. Both are
+        restricted to the filters (archived months by overlap with the date
+        range) and to the ``date_from``/``date_to`` (exclusive) period;
+        ``courses=False`` leaves the course filters to the caller.
+        """
+        date_conditions = []
+        if date_from:
+            date_conditions.append(SQL("sa.date >= %s", date_from))
+        if date_to:
+            date_conditions.append(SQL("sa.date < %s", date_to))
+        month_conditions = []
+        if filters.get('date_from') or date_from:
+            first = max(day for day in (filters.get('date_from'), date_from) if day)
+            month_conditions.append(SQL("sas.month >= %s", first.replace(day=1)))
+        if filters.get('date_to'):
+            month_conditions.append(SQL("sas.month <= %s", filters['date_to']))
+        if date_to:
+            month_conditions.append(SQL("sas.month < %s", date_to))
+
+        channel = ('sa', 'channel_id') if courses else None
+        summary_channel = ('sas', 'channel_id') if courses else None
+        return SQL("""
+            SELECT sa.channel_id, sap.partner_id, date_trunc('month', sa.date)::date AS month,
+                   1 AS total, sa.present::int AS present
+              FROM slide_attendance sa
+              JOIN slide_channel_partner sap ON sap.id = sa.name
+             WHERE %(detail_filter)s AND %(detail_dates)s
+         UNION ALL
+            SELECT sas.channel_id, sas.partner_id, sas.month, sas.total_count, sas.present_count
+              FROM slide_attendance_summary sas
+             WHERE %(summary_filter)s AND %(summary_months)s
+            """,
+            detail_filter=self._get_filter_sql(filters, channel=channel, partner=('sap', 'partner_id'), date=('sa', 'date')),
+            detail_dates=SQL(" AND ").join(date_conditions) if date_conditions else SQL("TRUE"),
+            summary_filter=self._get_filter_sql(filters, channel=summary_channel, partner=('sas', 'partner_id')),
+            summary_months=SQL(" AND ").join(month_conditions) if month_conditions else SQL("TRUE"),
+        )
+
+    def _get_enrollment_state_sql(self):
+        """SQL predicates (on alias ``scp``) for completed and certified enrollments"""
+        if self._has_column('slide.channel.partner', 'completed'):
+            completed = SQL("COALESCE(scp.completed, FALSE)")
+        elif self._has_column('slide.channel.partner', 'member_status'):
+            completed = SQL("COALESCE(scp.member_status = 'completed', FALSE)")
+        else:
+            completed = SQL("FALSE")
+
+        if self._has_column('slide.channel.partner', 'survey_scoring_success'):
+            certified = SQL("COALESCE(scp.survey_scoring_success, FALSE)")
+        else:
+            certified = SQL("FALSE")
+
+        return completed, certified
+
+    def _has_column(self, model, field_name):
+        field = self.env[model]._fields.get(field_name)
+        return bool(field and field.store and field.column_type)
+
+    def _get_employees_enrolled_this_month(self, filters=None):
+        now = datetime.now()
+        start_of_month = datetime(now.year, now.month, 1)
+        return self._safe_count('slide.channel.partner', [
+            ('create_date', '>=', start_of_month),
+        ] + self._get_enrollment_domain(filters or {}))
+
+    def _get_completed_courses_count(self, stats=None, filters=None):
         """Get count of completed course enrollments"""
-        try:
-            completed = self.env['slide.channel.partner'].search_count([
-                ('completed', '=', True)
-            ])
-            return completed
-        except Exception:
-            return 0
+        if stats is None:
+            stats = self._get_enrollment_stats(filters)
+        return sum(course['completed'] for course in stats)
 
     # def _get_courses_by_category(self):
     #     """Get course distribution by category/tag"""
@@ -152,288 +840,193 @@ class ELearningDashboardService(models.AbstractModel):
     #             {'category': 'Marketing', 'count': 2},
     #         ]
 
-    def _get_course_progress_chart(self, courses=None):
-        """Get progress overview for instructor's courses"""
-        try:
-            if not courses:
-                courses = self.env['slide.channel'].search([])
-
-            data = []
-            for course in courses:
-                enrollments = course.channel_partner_ids
-                if enrollments:
-                    not_started = enrollments.filtered(lambda x: getattr(x, 'completion', 0) == 0)
-                    in_progress = enrollments.filtered(
-                        lambda x: 0 < getattr(x, 'completion', 0) < 100 and not getattr(x, 'completed', False))
-                    completed = enrollments.filtered(lambda x: getattr(x, 'completed', False))
-
-                    data.append({
-                        'course': course.name,
-                        'notStarted': len(not_started),
-                        'inProgress': len(in_progress),
-                        'completed': len(completed),
-                        'totalEnrolled': len(enrollments)
-                    })
-
-            return data
-        except Exception:
-            return [
-                {'course': 'Sample Course 1', 'notStarted': 5, 'inProgress': 12, 'completed': 8, 'totalEnrolled': 25},
-                {'course': 'Sample Course 2', 'notStarted': 3, 'inProgress': 8, 'completed': 7, 'totalEnrolled': 18}
-            ]
+    def _get_course_progress_chart(self, courses=None, stats=None, filters=None):
+        """First page of the courses with the most enrollments; further pages
+        and the other rankings are served by get_course_series"""
+        if stats is None:
+            stats = self._get_enrollment_stats(filters)
 
-    def _get_enrollments_by_month(self):
-        """Get enrollment trends by month for current year"""
-        try:
-            current_year = datetime.now().year
+        if courses:
+            course_ids = set(courses.ids)
+            stats = [course for course in stats if course['id'] in course_ids]
 
-            # Get enrollments from slide.channel.partner created this year
-            enrollments = self.env['slide.channel.partner'].search([
-                ('create_date', '>=', f'{current_year}-01-01'),
-                ('create_date', '<', f'{current_year + 1}-01-01')
-            ])
+        # Same order and cursor as the 'top_enrollment' series
+        ranked = sorted(
+            (course for course in stats if course['active'] and course['total']),
+            key=lambda course: (-course['total'], course['id']),
+        )
+        page = ranked[:COURSE_SERIES_PAGE_SIZE]
+        return {
+            'series': 'top_enrollment',
+            'items': self._get_course_series_items(page),
+            'next': [-page[-1]['total'], page[-1]['id']] if len(ranked) > len(page) else False,
+        }
 
-            # Group by month
-            month_data = {}
-            for enrollment in enrollments:
-                month = enrollment.create_date.month
-                month_name = enrollment.create_date.strftime('%B')
-                month_data[month_name] = month_data.get(month_name, 0) + 1
-
-            # Convert to list and ensure all months are represented
-            month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                           'July', 'August', 'September', 'October', 'November', 'December']
-
-            data = []
-            for month in month_names:
-                data.append({
-                    'month': month,
-                    'enrollments': month_data.get(month, 0)
-                })
+    def _get_month_buckets(self, filters):
+        """First day of every month covered by the monthly series.
+
+        Without a date filter the series cover the current calendar year.
+        """
+        if filters.get('date_from') or filters.get('date_to'):
+            end = filters.get('date_to') or fields.Date.today()
+            start = filters.get('date_from') or date(end.year, 1, 1)
+        else:
+            start = date(datetime.now().year, 1, 1)
+            end = date(start.year, 12, 31)
+
+        buckets = []
+        month = start.replace(day=1)
+        while month <= end:
+            buckets.append(month)
+            month = (month + timedelta(days=32)).replace(day=1)
+        return buckets
+
+    def _get_month_label(self, month, buckets):
+        if buckets and buckets[0].year != buckets[-1].year:
+            return month.strftime('%B %Y')
+        return month.strftime('%B')
 
-            # If no data, return sample data
-            if not any(item['enrollments'] for item in data):
-                data = [
-                    {'month': 'January', 'enrollments': 25},
-                    {'month': 'February', 'enrollments': 32},
-                    {'month': 'March', 'enrollments': 28},
-                    {'month': 'April', 'enrollments': 45},
-                    {'month': 'May', 'enrollments': 38},
-                    {'month': 'June', 'enrollments': 52},
-                    {'month': 'July', 'enrollments': 41},
-                    {'month': 'August', 'enrollments': 35},
-                    {'month': 'September', 'enrollments': 48},
-                    {'month': 'October', 'enrollments': 0},
-                    {'month': 'November', 'enrollments': 0},
-                    {'month': 'December', 'enrollments': 0},
-                ]
-
-            return data
-
-        except Exception as e:
-            _logger.error(f"Error in _get_enrollments_by_month: {e}")
-            return [
-                {'month': 'January', 'enrollments': 25},
-                {'month': 'February', 'enrollments': 32},
-                {'month': 'March', 'enrollments': 28},
-                {'month': 'April', 'enrollments': 45},
-                {'month': 'May', 'enrollments': 38},
-                {'month': 'June', 'enrollments': 52},
-            ]
-
-    def _get_attendance_by_month(self):
+    def _get_enrollments_by_month(self, filters=None):
+        """Get enrollment trends by month for current year, or for the filtered period"""
+        filters = filters or {}
+        buckets = self._get_month_buckets(filters)
+        if not buckets:
+            return []
+
+        # Count enrollments created in the period, grouped by month
+        self.env['slide.channel.partner'].flush_model()
+        member_active = SQL("scp.active") if self._has_column('slide.channel.partner', 'active') else SQL("TRUE")
+        month_counts = dict(self._fetchall(SQL("""
+            SELECT date_trunc('month', scp.create_date)::date, COUNT(*)
+              FROM slide_channel_partner scp
+             WHERE scp.create_date >= %(start)s AND scp.create_date < %(end)s
+               AND %(member_active)s AND %(filter)s
+          GROUP BY 1
+            """,
+            start=buckets[0],
+            end=(buckets[-1] + timedelta(days=32)).replace(day=1),
+            member_active=member_active,
+            filter=self._get_filter_sql(
+                filters, channel=('scp', 'channel_id'), partner=('scp', 'partner_id'), date=('scp', 'create_date')),
+        )))
+
+        # Ensure all months are represented
+        return [{
+            'month': self._get_month_label(month, buckets),
+            'enrollments': month_counts.get(month, 0)
+        } for month in buckets]
+
+    def _get_attendance_by_month(self, filters=None):
         """Get attendance statistics by month"""
-        try:
-            current_year = datetime.now().year
+        filters = filters or {}
+        buckets = self._get_month_buckets(filters)
+        if not buckets:
+            return []
 
-            attendance_records = self.env['slide.attendance'].search([
-                ('date', '>=', f'{current_year}-01-01'),
-                ('date', '<', f'{current_year + 1}-01-01')
-            ])
+        # Group by month and count total/present rows, detailed and archived
+        for model in ('slide.attendance', 'slide.attendance.summary'):
+            self.env[model].flush_model()
+        rows = self._fetchall(SQL("""
+            SELECT history.month, SUM(history.total), SUM(history.present)
+              FROM (%s) history
+          GROUP BY history.month
+            """,
+            self._get_attendance_history_sql(
+                filters, date_from=buckets[0], date_to=(buckets[-1] + timedelta(days=32)).replace(day=1)),
+        ))
+        month_data = {month: (total, present) for month, total, present in rows}
 
-            # Group by month and calculate attendance rates
-            month_data = {}
-            for record in attendance_records:
-                month_name = record.date.strftime('%B')
-                if month_name not in month_data:
-                    month_data[month_name] = {'total': 0, 'present': 0}
-
-                month_data[month_name]['total'] += 1
-                if record.present:
-                    month_data[month_name]['present'] += 1
-
-            # Calculate percentages and prepare data
-            month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                           'July', 'August', 'September', 'October', 'November', 'December']
-
-            data = []
-            for month in month_names:
-                if month in month_data:
-                    total = month_data[month]['total']
-                    present = month_data[month]['present']
-                    rate = (present / total * 100) if total > 0 else 0
-                    data.append({
-                        'month': month,
-                        'attendanceRate': round(rate, 1),
-                        'totalSessions': total,
-                        'presentCount': present
-                    })
-                else:
-                    data.append({
-                        'month': month,
-                        'attendanceRate': 0,
-                        'totalSessions': 0,
-                        'presentCount': 0
-                    })
-
-            # If no data, return sample data
-            if not any(item['totalSessions'] for item in data):
-                data = [
-                    {'month': 'January', 'attendanceRate': 85.5, 'totalSessions': 120, 'presentCount': 103},
-                    {'month': 'February', 'attendanceRate': 88.2, 'totalSessions': 145, 'presentCount': 128},
-                    {'month': 'March', 'attendanceRate': 92.1, 'totalSessions': 156, 'presentCount': 144},
-                    {'month': 'April', 'attendanceRate': 89.7, 'totalSessions': 134, 'presentCount': 120},
-                    {'month': 'May', 'attendanceRate': 91.3, 'totalSessions': 142, 'presentCount': 130},
-                    {'month': 'June', 'attendanceRate': 87.9, 'totalSessions': 128, 'presentCount': 112},
-                ]
-
-            return data
-
-        except Exception as e:
-            _logger.error(f"Error in _get_attendance_by_month: {e}")
-            return [
-                {'month': 'January', 'attendanceRate': 85.5, 'totalSessions': 120, 'presentCount': 103},
-                {'month': 'February', 'attendanceRate': 88.2, 'totalSessions': 145, 'presentCount': 128},
-                {'month': 'March', 'attendanceRate': 92.1, 'totalSessions': 156, 'presentCount': 144},
-            ]
-
-    def _get_completion_rates(self):
-        """Get course completion rates"""
-        try:
-            courses = self.env['slide.channel'].search([
-                ('channel_partner_ids', '!=', False)
-            ])
+        # Calculate percentages and prepare data
+        data = []
+        for month in buckets:
+            total, present = month_data.get(month, (0, 0))
+            rate = (present / total * 100) if total > 0 else 0
+            data.append({
+                'month': self._get_month_label(month, buckets),
+                'attendanceRate': round(rate, 1),
+                'totalSessions': total,
+                'presentCount': present
+            })
 
-            data = []
-            for course in courses:
-                total_enrolled = len(course.channel_partner_ids)
-                completed = len(course.channel_partner_ids.filtered('completed'))
-                completion_rate = (completed / total_enrolled * 100) if total_enrolled > 0 else 0
-
-                data.append({
-                    'courseName': course.name,
-                    'totalEnrolled': total_enrolled,
-                    'completed': completed,
-                    'completionRate': round(completion_rate, 1)
-                })
+        return data
 
-            # Sort by completion rate descending
-            data.sort(key=lambda x: x['completionRate'], reverse=True)
+    def _get_completion_rates(self, stats=None, filters=None):
+        """Get course completion rates"""
+        if stats is None:
+            stats = self._get_enrollment_stats(filters)
 
-            # Limit to top 10 courses
-            data = data[:10]
+        data = []
+        for course in stats:
+            if not course['active'] or not course['total']:
+                continue
+            total_enrolled = course['total']
+            completed = course['completed']
+            completion_rate = (completed / total_enrolled * 100) if total_enrolled > 0 else 0
 
-            # If no data, return sample data
-            if not data:
-                data = [
-                    {'courseName': 'Python Basics', 'totalEnrolled': 45, 'completed': 38, 'completionRate': 84.4},
-                    {'courseName': 'Data Analysis', 'totalEnrolled': 32, 'completed': 25, 'completionRate': 78.1},
-                    {'courseName': 'Web Development', 'totalEnrolled': 28, 'completed': 21, 'completionRate': 75.0},
-                    {'courseName': 'Digital Marketing', 'totalEnrolled': 35, 'completed': 24, 'completionRate': 68.6},
-                    {'courseName': 'Project Management', 'totalEnrolled': 29, 'completed': 18, 'completionRate': 62.1},
-                ]
+            data.append({
+                'courseName': course['name'],
+                'totalEnrolled': total_enrolled,
+                'completed': completed,
+                'completionRate': round(completion_rate, 1)
+            })
 
-            return data
+        # Sort by completion rate descending
+        data.sort(key=lambda x: x['completionRate'], reverse=True)
 
-        except Exception as e:
-            _logger.error(f"Error in _get_completion_rates: {e}")
-            return [
-                {'courseName': 'Python Basics', 'totalEnrolled': 45, 'completed': 38, 'completionRate': 84.4},
-                {'courseName': 'Data Analysis', 'totalEnrolled': 32, 'completed': 25, 'completionRate': 78.1},
-                {'courseName': 'Web Development', 'totalEnrolled': 28, 'completed': 21, 'completionRate': 75.0},
-            ]
+        # Limit to top 10 courses
+        return data[:10]
 
     def _get_course_ratings(self, courses=None):
         """Get average ratings and review counts for instructor's courses"""
-        try:
-            if not courses:
-                return []
-
-            data = []
-            for course in courses:
-                # slide.slide has rating, linked via rating_ids
-                ratings = course.rating_ids.filtered(lambda r: r.consumed)  # only finalized ratings
-                if ratings:
-                    avg_rating = round(sum(ratings.mapped("rating")) / len(ratings), 2)
-                    total_reviews = len(ratings)
-                else:
-                    avg_rating = 0
-                    total_reviews = 0
-
-                data.append({
-                    'course': course.name,
-                    'avgRating': avg_rating,
-                    'totalReviews': total_reviews,
-                })
+        if not courses:
+            return []
 
-            return data
-        except Exception:
-            # Fallback sample data
-            return [
-                {'course': 'Sample Course 1', 'avgRating': 4.2, 'totalReviews': 15},
-                {'course': 'Sample Course 2', 'avgRating': 3.8, 'totalReviews': 8},
-            ]
+        ratings_by_course = self._get_ratings_by_course(courses.ids)
+        data = []
+        for course in courses:
+            avg_rating, total_reviews = ratings_by_course.get(course.id, (0, 0))
+            data.append({
+                'course': course.name,
+                'avgRating': round(avg_rating or 0, 2),
+                'totalReviews': total_reviews,
+            })
+
+        return data
 
-    def _get_student_progress_distribution(self):
+    def _get_ratings_by_course(self, course_ids):
+        """{course id: (average rating, review count)} of the finalized ratings, in one grouped query"""
+        if not course_ids:
+            return {}
+        rating_groups = self.env['rating.rating'].sudo()._read_group(
+            [('res_model', '=', 'slide.channel'), ('res_id', 'in', list(course_ids)), ('consumed', '=', True)],
+            ['res_id'],
+            ['rating:avg', '__count'],
+        )
+        self._add_fetched_rows(len(rating_groups))
+        return {res_id: (avg, count) for res_id, avg, count in rating_groups}
+
+    def _get_student_progress_distribution(self, stats=None, filters=None):
         """Get distribution of student progress levels"""
-        try:
-            # Get all enrolled students with their progress
-            enrollments = self.env['slide.channel.partner'].search([])
-
-            # Categorize by progress/completion
-            progress_data = {
-                'not_started': 0,
-                'in_progress': 0,
-                'completed': 0,
-                'certified': 0
-            }
+        if stats is None:
+            stats = self._get_enrollment_stats(filters)
+
+        # Categorize by progress/completion, summing the per-course counters
+        progress_data = {
+            'not_started': 0,
+            'in_progress': 0,
+            'completed': 0,
+            'certified': 0
+        }
+
+        for course in stats:
+            progress_data['certified'] += course['certified']
+            progress_data['completed'] += course['completed'] - course['certified']
+            progress_data['in_progress'] += course['started']
+            progress_data['not_started'] += course['total'] - course['completed'] - course['started']
 
-            for enrollment in enrollments:
-                if hasattr(enrollment, 'completed') and enrollment.completed:
-                    # Check if they have certification
-                    if hasattr(enrollment, 'survey_scoring_success') and enrollment.survey_scoring_success:
-                        progress_data['certified'] += 1
-                    else:
-                        progress_data['completed'] += 1
-                elif hasattr(enrollment, 'completion') and enrollment.completion > 0:
-                    progress_data['in_progress'] += 1
-                else:
-                    progress_data['not_started'] += 1
-
-            # Convert to list format
-            data = [
-                {'status': 'Not Started', 'count': progress_data['not_started']},
-                {'status': 'In Progress', 'count': progress_data['in_progress']},
-                {'status': 'Completed', 'count': progress_data['completed']},
-                {'status': 'Certified', 'count': progress_data['certified']},
-            ]
-
-            # If no data, return sample data
-            if not any(item['count'] for item in data):
-                data = [
-                    {'status': 'Not Started', 'count': 28},
-                    {'status': 'In Progress', 'count': 45},
-                    {'status': 'Completed', 'count': 32},
-                    {'status': 'Certified', 'count': 18},
-                ]
-
-            return data
-
-        except Exception as e:
-            _logger.error(f"Error in _get_student_progress_distribution: {e}")
-            return [
-                {'status': 'Not Started', 'count': 28},
-                {'status': 'In Progress', 'count': 45},
-                {'status': 'Completed', 'count': 32},
-                {'status': 'Certified', 'count': 18},
-            ]
\ No newline at end of file
+        return [
+            {'status': 'Not Started', 'count': progress_data['not_started']},
+            {'status': 'In Progress', 'count': progress_data['in_progress']},
+            {'status': 'Completed', 'count': progress_data['completed']},
+            {'status': 'Certified', 'count': progress_data['certified']},
+        ]
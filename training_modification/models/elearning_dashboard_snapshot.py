@@ -0,0 +1,220 @@
+from odoo import models, fields, api
+from odoo.tools import SQL
+import logging
+
+from .elearning_dashboard_service import DASHBOARD_SECTIONS, UNTRACKED_SOURCE_MODELS
+
+_logger = logging.getLogger(__name__)
+
+# Bus channel of a company's dashboard, followed by its company id; see ir.websocket
+DASHBOARD_BUS_CHANNEL_PREFIX = 'elearning_dashboard_'
+
+SOURCE_MODELS = sorted({model_name for _method, model_names, _stats in DASHBOARD_SECTIONS.values() for model_name in model_names})
+
+
+class ELearningDashboardSnapshot(models.Model):
+    _name = "elearning.dashboard.snapshot"
+    _description = "eLearning Dashboard Snapshot"
+    _order = "company_id, section"
+
+    company_id = fields.Many2one('res.company', string='Company', required=True, ondelete='cascade')
+    section = fields.Char(string='Section', required=True)
+    data = fields.Json(string='Data')
+    version = fields.Char(string='Version', help='Content hash of the data, used by clients to skip unchanged sections')
+    source_stamp = fields.Char(string='Source Stamp', help='Fingerprint of the source tables when the section was computed')
+    refresh_date = fields.Datetime(string='Refreshed On')
+
+    _sql_constraints = [
+        ('unique_company_section', 'unique(company_id, section)',
+         'A snapshot already exists for this dashboard section!'),
+    ]
+
+    def init(self):
+        # One change counter per source model, bumped by _bump_source_counters
+        for model_name in SOURCE_MODELS:
+            if model_name not in UNTRACKED_SOURCE_MODELS:
+                self.env.cr.execute(SQL("CREATE SEQUENCE IF NOT EXISTS %s", SQL.identifier(self._get_source_sequence(model_name))))
+
+    @api.model
+    def _get_source_sequence(self, model_name):
+        return f"elearning_dashboard_source_{model_name.replace('.', '_')}_seq"
+
+    @api.model
+    def _get_sections(self, company, names=None):
+        """Return {section: {'data', 'version', 'refresh_date'}} for the company.
+
+        Sections that were never computed for this company are computed and
+        stored on the spot; everything else is served as stored, the cron keeps
+        it up to date.
+        """
+        names = list(names or DASHBOARD_SECTIONS)
+        snapshots = self.search([('company_id', '=', company.id), ('section', 'in', names)])
+        missing = set(names) - set(snapshots.mapped('section'))
+        if missing:
+            self._refresh(company, missing)
+            snapshots = self.search([('company_id', '=', company.id), ('section', 'in', names)])
+
+        return {
+            snapshot.section: {
+                'data': snapshot.data,
+                'version': snapshot.version,
+                'refresh_date': fields.Datetime.to_string(snapshot.refresh_date),
+            }
+            for snapshot in snapshots
+        }
+
+    @api.model
+    def _refresh(self, company, names=None, force=False):
+        """Recompute the sections whose source tables changed since their last refresh.
+
+        Returns the names of the sections that were recomputed.
+        """
+        names = list(names or DASHBOARD_SECTIONS)
+        fingerprints = self._get_source_fingerprints(names)
+        stored = {
+            snapshot.section: snapshot.source_stamp
+            for snapshot in self.search([('company_id', '=', company.id), ('section', 'in', names)])
+        }
+
+        stamps = {name: self._get_section_stamp(name, fingerprints) for name in names}
+        stale = [name for name in names if force or stored.get(name) != stamps[name]]
+        if not stale:
+            return []
+
+        service = self.env['elearning.dashboard.service'].with_company(company)
+        values = service._compute_sections(stale)
+        now = fields.Datetime.now()
+        for name in stale:
+            data = service._serialize_section(values[name])
+            self.env.cr.execute("""
+                INSERT INTO elearning_dashboard_snapshot
+                       (company_id, section, data, version, source_stamp, refresh_date,
+                        create_uid, create_date, write_uid, write_date)
+                VALUES (%(company)s, %(section)s, %(data)s, %(version)s, %(stamp)s, %(now)s,
+                        %(uid)s, %(now)s, %(uid)s, %(now)s)
+           ON CONFLICT (company_id, section) DO UPDATE
+                   SET data = EXCLUDED.data,
+                       version = EXCLUDED.version,
+                       source_stamp = EXCLUDED.source_stamp,
+                       refresh_date = EXCLUDED.refresh_date,
+                       write_uid = EXCLUDED.write_uid,
+                       write_date = EXCLUDED.write_date
+            """, {
+                'company': company.id,
+                'section': name,
+                'data': data,
+                'version': service._get_section_version(values[name]),
+                'stamp': stamps[name],
+                'now': now,
+                'uid': self.env.uid,
+            })
+        self.invalidate_model()
+        return stale
+
+    @api.model
+    def _bump_source_counters(self):
+        """Post-commit hook of _schedule_dashboard_update: count one change of
+        every source model changed by the committed transaction.
+
+        The counters are bumped once the changes are visible, in a cursor of
+        their own: a refresh that read the previous value recomputes again.
+        Sequences are not transactional, so concurrent transactions never wait
+        on each other.
+        """
+        model_names = self.env.cr.postcommit.data.pop('training_dashboard_sources', None)
+        sequences = [
+            self._get_source_sequence(model_name)
+            for model_name in sorted(set(model_names or ()) & set(SOURCE_MODELS))
+            if model_name not in UNTRACKED_SOURCE_MODELS
+        ]
+        if not sequences:
+            return
+        with self.env.registry.cursor() as cr:
+            cr.execute("SELECT nextval(name::regclass) FROM unnest(%s) AS name", [sequences])
+
+    def _get_source_fingerprints(self, names):
+        """Change counter of every source model, in a single query.
+
+        The counters are maintained by _schedule_dashboard_update, which every
+        change to the source tables goes through, so reading them scans
+        nothing. Models in UNTRACKED_SOURCE_MODELS fall back to their row count
+        and last write date.
+        """
+        model_names = sorted({
+            model_name
+            for name in names
+            for model_name in DASHBOARD_SECTIONS[name][1]
+            if model_name in self.env
+        })
+        if not model_names:
+            return {}
+
+        queries = []
+        for model_name in model_names:
+            if model_name in UNTRACKED_SOURCE_MODELS:
+                self.env[model_name].flush_model()
+                queries.append(SQL(
+                    "SELECT %s, COUNT(*) || '@' || COALESCE(MAX(write_date)::varchar, '') FROM %s",
+                    model_name, SQL.identifier(self.env[model_name]._table),
+                ))
+            else:
+                queries.append(SQL(
+                    "SELECT %s, CASE WHEN is_called THEN last_value ELSE 0 END::varchar FROM %s",
+                    model_name, SQL.identifier(self._get_source_sequence(model_name)),
+                ))
+        self.env.cr.execute(SQL(" UNION ALL ").join(queries))
+        return dict(self.env.cr.fetchall())
+
+    def _get_section_stamp(self, name, fingerprints):
+        # The current month is part of the stamp since the KPIs and monthly
+        # series are relative to today
+        period = fields.Date.today().strftime('%Y-%m')
+        sources = [f"{model_name}={fingerprints.get(model_name, '')}" for model_name in DASHBOARD_SECTIONS[name][1]]
+        return ";".join([period] + sources)
+
+    @api.model
+    def _cron_refresh_snapshots(self):
+        """Refresh the stored dashboard sections of every company that has a snapshot,
+        and push the changed sections to the open dashboards"""
+        companies = self.search([]).mapped('company_id')
+        for company in companies:
+            previous = {
+                snapshot.section: (snapshot.version, snapshot.data)
+                for snapshot in self.search([('company_id', '=', company.id)])
+            }
+            refreshed = self._refresh(company)
+            if refreshed:
+                _logger.info("Refreshed dashboard sections %s for company %s", refreshed, company.name)
+                self._publish_update(company, refreshed, previous)
+
+    def _publish_update(self, company, names, previous):
+        """Send the sections whose content changed on the company dashboard bus channel.
+
+        The KPI section only carries the KPIs that changed, along with the version
+        it applies to; clients holding another version refetch the section.
+        """
+        current = self._get_sections(company, names)
+        sections = {}
+        for name in names:
+            old_version, old_data = previous.get(name, (False, None))
+            section = current[name]
+            if section['version'] == old_version:
+                continue
+            update = {'version': section['version'], 'refreshedAt': section['refresh_date']}
+            if name == 'kpis' and isinstance(old_data, dict):
+                update['previousVersion'] = old_version
+                update['data'] = {
+                    key: value for key, value in section['data'].items()
+                    if old_data.get(key) != value
+                }
+            else:
+                update['data'] = section['data']
+            sections[name] = update
+
+        if sections:
+            self.env['bus.bus']._sendone(
+                self._get_bus_channel(company), 'elearning_dashboard/update', {'sections': sections})
+
+    @api.model
+    def _get_bus_channel(self, company):
+        return f"{DASHBOARD_BUS_CHANNEL_PREFIX}{company.id}"
@@ -0,0 +1,63 @@
+from odoo import models, api
+
+# Counters of slide.slide bumped by every view, which the dashboard does not show
+SLIDE_VIEW_COUNTER_FIELDS = ('slide_views', 'public_views', 'total_views', 'embed_count')
+
+
+class ELearningDashboardSource(models.AbstractModel):
+    """Source model of the dashboard snapshots: its changes bump its change
+    counter (see elearning.dashboard.snapshot._get_source_fingerprints)."""
+    _name = 'elearning.dashboard.source'
+    _description = 'eLearning Dashboard Source'
+
+    # Fields whose changes alone leave the dashboard as it is
+    _dashboard_ignored_fields = ()
+
+    def _filter_dashboard_records(self):
+        """Records of ``self`` the dashboard depends on"""
+        return self
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if records._filter_dashboard_records():
+            self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
+        return records
+
+    def write(self, vals):
+        if set(vals) <= set(self._dashboard_ignored_fields):
+            return super().write(vals)
+        # Records may enter or leave the scope of the dashboard
+        counted = self._filter_dashboard_records()
+        result = super().write(vals)
+        if counted or self._filter_dashboard_records():
+            self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
+        return result
+
+    def unlink(self):
+        counted = self._filter_dashboard_records()
+        result = super().unlink()
+        if counted:
+            self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
+        return result
+
+
+class SlideSlide(models.Model):
+    _name = 'slide.slide'
+    _inherit = ['slide.slide', 'elearning.dashboard.source']
+
+    _dashboard_ignored_fields = SLIDE_VIEW_COUNTER_FIELDS
+
+
+class SlideQuestion(models.Model):
+    _name = 'slide.question'
+    _inherit = ['slide.question', 'elearning.dashboard.source']
+
+
+class RatingRating(models.Model):
+    _name = 'rating.rating'
+    _inherit = ['rating.rating', 'elearning.dashboard.source']
+
+    def _filter_dashboard_records(self):
+        # Only course ratings are shown
+        return self.filtered(lambda rating: rating.res_model == 'slide.channel')
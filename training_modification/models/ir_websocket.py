@@ -0,0 +1,22 @@
+from odoo import models
+
+from .elearning_dashboard_snapshot import DASHBOARD_BUS_CHANNEL_PREFIX
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = 'ir.websocket'
+
+    def _build_bus_channel_list(self, channels):
+        """Only let eLearning officers listen to the dashboards of their companies"""
+        channels = [channel for channel in channels if self._is_allowed_dashboard_channel(channel)]
+        return super()._build_bus_channel_list(channels)
+
+    def _is_allowed_dashboard_channel(self, channel):
+        if not isinstance(channel, str) or not channel.startswith(DASHBOARD_BUS_CHANNEL_PREFIX):
+            return True
+        company_id = channel[len(DASHBOARD_BUS_CHANNEL_PREFIX):]
+        return (
+            company_id.isdigit()
+            and int(company_id) in self.env.user.company_ids.ids
+            and self.env.user.has_group('website_slides.group_website_slides_officer')
+        )
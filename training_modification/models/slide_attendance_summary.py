@@ -0,0 +1,92 @@
+from odoo import models, fields, api
+from dateutil.relativedelta import relativedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Detailed attendance older than this many months is rolled into the summary
+ARCHIVE_HORIZON_PARAM = 'training_modification.attendance_archive_months'
+ARCHIVE_HORIZON_DEFAULT = 12
+# Months archived per cron run; the cron retriggers itself while some remain
+ARCHIVE_MONTHS_PER_RUN = 6
+
+
+class SlideAttendanceSummary(models.Model):
+    _name = 'slide.attendance.summary'
+    _description = 'Archived Attendance Summary'
+    _order = 'month desc, channel_id'
+
+    partner_id = fields.Many2one('res.partner', string='Attendee', required=True, ondelete='cascade', index=True)
+    channel_id = fields.Many2one('slide.channel', string='Course', required=True, ondelete='cascade')
+    month = fields.Date(string='Month', required=True, index=True, help='First day of the month')
+    total_count = fields.Integer(string='Sessions')
+    present_count = fields.Integer(string='Present')
+
+    _sql_constraints = [
+        ('unique_partner_channel_month', 'unique(channel_id, month, partner_id)',
+         'Attendance is already summarized for this attendee, course and month!'),
+    ]
+
+    @api.model
+    def _get_archive_cutoff(self):
+        """First day of the oldest month whose detailed attendance is kept"""
+        months = int(self.env['ir.config_parameter'].sudo().get_param(ARCHIVE_HORIZON_PARAM, ARCHIVE_HORIZON_DEFAULT))
+        return fields.Date.today().replace(day=1) - relativedelta(months=max(months, 1))
+
+    @api.model
+    def _cron_archive_attendance(self):
+        """Roll the detailed attendance older than the horizon into the summary, month by month"""
+        cutoff = self._get_archive_cutoff()
+        self.env['slide.attendance'].flush_model()
+        self.env.cr.execute("""
+            SELECT DISTINCT date_trunc('month', date)::date
+              FROM slide_attendance
+             WHERE date < %s
+          ORDER BY 1
+             LIMIT %s
+        """, [cutoff, ARCHIVE_MONTHS_PER_RUN + 1])
+        months = [row[0] for row in self.env.cr.fetchall()]
+
+        for month in months[:ARCHIVE_MONTHS_PER_RUN]:
+            archived = self._archive_month(month)
+            _logger.info("Archived %s attendance records of %s", archived, month.strftime('%Y-%m'))
+
+        if months:
+            self.env['slide.attendance'].invalidate_model()
+            self.invalidate_model()
+            self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.attendance', self._name)
+        if len(months) > ARCHIVE_MONTHS_PER_RUN:
+            self.env.ref('training_modification.ir_cron_archive_attendance')._trigger()
+
+    @api.model
+    def _archive_month(self, month):
+        """Move the detailed attendance of a month into the summary, in one statement.
+
+        Deleting the rows directly keeps the enrollments: SlideAttendance.unlink
+        would remove the members left without attendance. Returns the number
+        of archived rows.
+        """
+        self.env.cr.execute("""
+            WITH archived AS (
+                DELETE FROM slide_attendance sa
+                      USING slide_channel_partner scp
+                      WHERE sa.name = scp.id
+                        AND sa.date >= %(month)s
+                        AND sa.date < %(next_month)s
+                  RETURNING scp.partner_id, sa.channel_id, sa.present
+            ), inserted AS (
+                INSERT INTO slide_attendance_summary (partner_id, channel_id, month, total_count, present_count,
+                                                      create_uid, create_date, write_uid, write_date)
+                     SELECT partner_id, channel_id, %(month)s, COUNT(*), COUNT(*) FILTER (WHERE present),
+                            %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+                       FROM archived
+                   GROUP BY partner_id, channel_id
+                ON CONFLICT (channel_id, month, partner_id) DO UPDATE
+                        SET total_count = slide_attendance_summary.total_count + EXCLUDED.total_count,
+                            present_count = slide_attendance_summary.present_count + EXCLUDED.present_count,
+                            write_uid = EXCLUDED.write_uid,
+                            write_date = EXCLUDED.write_date
+            )
+            SELECT COUNT(*) FROM archived
+        """, {'month': month, 'next_month': month + relativedelta(months=1), 'uid': self.env.uid})
+        return self.env.cr.fetchone()[0]
@@ -1,10 +1,50 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, _
+from odoo.exceptions import AccessError, UserError
+from odoo.osv import expression
+from odoo.tools import SQL, consteq
+from odoo.tools.image import binary_to_image, image_apply_opt, image_fix_orientation, image_process
+from odoo.tools.mimetypes import guess_mimetype
+from odoo.tools.misc import hmac
+from odoo.tools.sql import create_index
+import base64
+import filecmp
+import hashlib
 import logging
+import os
+import tempfile
+import time
 from datetime import timedelta
+from urllib.parse import quote
 _logger = logging.getLogger(__name__)
 
+# Lifetime (seconds) of the check-in tokens shown as QR codes during a session
+CHECKIN_TOKEN_TTL = 300
+
+# Attendance register pages: members per page and sessions per date window
+REGISTER_MEMBER_LIMIT = 50
+REGISTER_SESSION_LIMIT = 20
+REGISTER_MAX_LIMIT = 200
+
+# Proof uploads: size limits (MB) per file and per request, and copy chunk size
+PROOF_MAX_FILE_SIZE_PARAM = 'training_modification.proof_max_file_size'
+PROOF_MAX_FILE_SIZE_DEFAULT = 10
+PROOF_MAX_REQUEST_SIZE_PARAM = 'training_modification.proof_max_request_size'
+PROOF_MAX_REQUEST_SIZE_DEFAULT = 50
+PROOF_UPLOAD_CHUNK_SIZE = 64 * 1024
+# Longest side (px) of the stored proof images, JPEG quality of the recompressed
+# files and size of the thumbnails shown in lists
+PROOF_IMAGE_MAX_SIZE_PARAM = 'training_modification.proof_image_max_size'
+PROOF_IMAGE_MAX_SIZE_DEFAULT = 1920
+PROOF_IMAGE_QUALITY = 80
+PROOF_THUMBNAIL_SIZE = 256
+
+# Proof review queue pages
+REVIEW_QUEUE_PAGE_SIZE = 50
+REVIEW_QUEUE_MAX_PAGE_SIZE = 200
+
 class SlideChannel(models.Model):
-    _inherit = 'slide.channel'
+    _name = 'slide.channel'
+    _inherit = ['slide.channel', 'elearning.dashboard.source']
 
     attendance_ids = fields.One2many('slide.attendance', 'channel_id', string='Attendance')
     duration = fields.Float(string='Duration (Hours)', help='Training duration in hours')
@@ -27,91 +67,152 @@ class SlideChannel(models.Model):
         """Override write to update attendance when members change"""
         result = super().write(vals)
 
-        # If channel_partner_ids were modified, update today's attendance
+        # If channel_partner_ids were modified, update the upcoming sessions' attendance
         if 'channel_partner_ids' in vals:
-            self._update_today_attendance()
+            self.env['slide.attendance']._queue_session_sync(channel_ids=self.ids)
 
         return result
 
-    def _update_today_attendance(self):
-        """Update today's attendance when members change"""
-        today = fields.Date.today()
-
-        for record in self:
-            # Get current attendance records for today
-            existing_attendance = self.env['slide.attendance'].search([
-                ('channel_id', '=', record.id),
-                ('date', '=', today)
-            ])
-
-            # Get current enrolled partners
-            current_partner_ids = record.channel_partner_ids.ids
-            existing_partner_ids = existing_attendance.mapped('name.id')
-
-            # Remove attendance for partners no longer enrolled
-            to_remove = existing_attendance.filtered(
-                lambda x: x.name.id not in current_partner_ids
-            )
-            if to_remove:
-                to_remove.unlink()
-
-            # Add attendance for new partners
-            new_partner_ids = set(current_partner_ids) - set(existing_partner_ids)
-            if new_partner_ids:
-                attendance_vals = []
-                for partner_id in new_partner_ids:
-                    attendance_vals.append({
-                        'name': partner_id,
-                        'channel_id': record.id,
-                        'date': today,
-                        'present': False
-                    })
-
-                if attendance_vals:
-                    self.env['slide.attendance'].create(attendance_vals)
-
-    def _ensure_today_attendance(self):
-        """Ensure attendance records exist for today"""
-        if not self.id:
-            return
-
-        today = fields.Date.today()
-
-        # Check if attendance already exists for today
-        existing_attendance = self.env['slide.attendance'].search([
-            ('channel_id', '=', self.id),
-            ('date', '=', today)
-        ])
-
-        existing_partner_ids = existing_attendance.mapped('name.id')
-        current_partner_ids = self.channel_partner_ids.ids
+    def web_read(self, specification):
+        # A single course read by the web client is a course opened in a form
+        if len(self) == 1:
+            self.env['slide.channel.recent']._record_visit(self.id)
+        return super().web_read(specification)
 
-        # Create attendance for partners who don't have records for today
-        missing_partner_ids = set(current_partner_ids) - set(existing_partner_ids)
+    def action_open_attendance_register(self):
+        self.ensure_one()
+        self.env['slide.channel.recent']._record_visit(self.id)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'training_modification.attendance_register',
+            'name': _("Attendance Register: %s", self.name),
+            'params': {'channel_id': self.id},
+            'context': {'active_id': self.id},
+        }
 
-        if missing_partner_ids:
-            attendance_vals = []
-            for partner_id in missing_partner_ids:
-                attendance_vals.append({
-                    'name': partner_id,
-                    'channel_id': self.id,
-                    'date': today,
-                    'present': False
-                })
+    def get_attendance_register(self, after=None, member_limit=REGISTER_MEMBER_LIMIT,
+                                date_from=None, date_to=None, session_limit=REGISTER_SESSION_LIMIT):
+        """One page of the members x sessions attendance matrix of the course.
+
+        Members are ordered by name and paged with the ``next`` cursor
+        (``after``). Sessions form a date window: the first ``session_limit``
+        sessions from ``date_from``, or else the last ones up to ``date_to``
+        (today by default); ``older`` and ``newer`` are the dates to move the
+        window to. Each member carries two bitsets as hex strings, bit i
+        standing for the i-th session of the window: ``present`` and
+        ``recorded`` (an attendance record exists).
+        """
+        self.ensure_one()
+        self.check_access('read')
+        self.env['slide.attendance'].check_access('read')
+        member_limit = max(1, min(int(member_limit), REGISTER_MAX_LIMIT))
+        session_limit = max(1, min(int(session_limit), REGISTER_MAX_LIMIT))
+        for model in ('training.calendar', 'slide.channel.partner', 'slide.attendance'):
+            self.env[model].flush_model()
+
+        sessions = self._get_register_sessions(date_from, date_to, session_limit)
+        members, next_cursor = self._get_register_members(after, member_limit)
+
+        bits = {member['id']: [0, 0] for member in members}
+        if sessions and members:
+            index = {session['id']: position for position, session in enumerate(sessions)}
+            self.env.cr.execute("""
+                SELECT name, session_id, present
+                  FROM slide_attendance
+                 WHERE session_id = ANY(%s) AND name = ANY(%s)
+            """, [list(index), list(bits)])
+            for member_id, session_id, present in self.env.cr.fetchall():
+                bit = 1 << index[session_id]
+                bits[member_id][1] |= bit
+                if present:
+                    bits[member_id][0] |= bit
+
+        older = newer = False
+        if sessions:
+            self.env.cr.execute("""
+                SELECT (SELECT MAX(training_date) FROM training_calendar WHERE course_id = %(course)s AND training_date < %(first)s),
+                       (SELECT MIN(training_date) FROM training_calendar WHERE course_id = %(course)s AND training_date > %(last)s)
+            """, {'course': self.id, 'first': sessions[0]['date'], 'last': sessions[-1]['date']})
+            older, newer = self.env.cr.fetchone()
+
+        for member in members:
+            present, recorded = bits[member['id']]
+            member['present'] = format(present, 'x')
+            member['recorded'] = format(recorded, 'x')
+        return {
+            'sessions': [dict(session, date=fields.Date.to_string(session['date'])) for session in sessions],
+            'members': members,
+            'next': next_cursor,
+            'older': fields.Date.to_string(older) if older else False,
+            'newer': fields.Date.to_string(newer) if newer else False,
+        }
 
-            if attendance_vals:
-                self.env['slide.attendance'].create(attendance_vals)
+    def _get_register_sessions(self, date_from, date_to, limit):
+        if date_from:
+            self.env.cr.execute("""
+                SELECT id, training_date FROM training_calendar
+                 WHERE course_id = %s AND training_date >= %s AND training_date <= COALESCE(%s, 'infinity'::date)
+              ORDER BY training_date
+                 LIMIT %s
+            """, [self.id, date_from, date_to or None, limit])
+            rows = self.env.cr.fetchall()
+        else:
+            self.env.cr.execute("""
+                SELECT id, training_date FROM training_calendar
+                 WHERE course_id = %s AND training_date <= %s
+              ORDER BY training_date DESC
+                 LIMIT %s
+            """, [self.id, date_to or fields.Date.today(), limit])
+            rows = self.env.cr.fetchall()[::-1]
+        return [{'id': session_id, 'date': training_date} for session_id, training_date in rows]
+
+    def _get_register_members(self, after, limit):
+        """A page of active members ordered by name, and the cursor of the next page"""
+        member_active = SQL("scp.active") if 'active' in self.env['slide.channel.partner']._fields else SQL("TRUE")
+        after_condition = SQL("(rp.name, scp.id) > (%s, %s)", after[0], int(after[1])) if after else SQL("TRUE")
+        self.env.cr.execute(SQL("""
+            SELECT scp.id, scp.partner_id, rp.name
+              FROM slide_channel_partner scp
+              JOIN res_partner rp ON rp.id = scp.partner_id
+             WHERE scp.channel_id = %(course)s AND %(member_active)s AND %(after)s
+          ORDER BY rp.name, scp.id
+             LIMIT %(limit)s
+            """,
+            course=self.id,
+            member_active=member_active,
+            after=after_condition,
+            limit=limit + 1,
+        ))
+        rows = self.env.cr.fetchall()
+        members = [{'id': member_id, 'partnerId': partner_id, 'name': name} for member_id, partner_id, name in rows[:limit]]
+        next_cursor = [members[-1]['name'], members[-1]['id']] if len(rows) > limit else False
+        return members, next_cursor
+
+    def action_generate_session_attendance(self):
+        """On-demand variant of the daily generator: every session of the selected courses"""
+        self.training_calendar_ids._generate_attendance()
+        return True
 
     @api.model
-    def read(self, fields=None, load='_classic_read'):
-        """Auto-generate attendance when form is loaded"""
-        result = super().read(fields, load)
-
-        # Auto-generate attendance for today when accessing the record
-        for record in self:
-            record._ensure_today_attendance()
+    def _cron_generate_daily_attendance(self):
+        """Create the attendance rows of today's sessions.
+
+        Rows are normally created when a session is scheduled or members join;
+        this catches anything that went around the ORM.
+        """
+        created = self.browse()._generate_attendance()
+        _logger.info("Generated %s attendance records for %s", created, fields.Date.today())
+
+    def _generate_attendance(self, date=None):
+        """Create the missing attendance rows of the sessions held on ``date``
+        (today by default) by the courses of the recordset, or by every active
+        course when the recordset is empty. Returns the number of rows created.
+        """
+        domain = [('training_date', '=', date or fields.Date.today()), ('course_id.active', '=', True)]
+        if self:
+            domain.append(('course_id', 'in', self.ids))
+        return self.env['training.calendar'].search(domain)._generate_attendance()
 
-        return result
 
 class SlideChannelPartner(models.Model):
     _inherit = 'slide.channel.partner'
@@ -120,22 +221,31 @@ class SlideChannelPartner(models.Model):
         """Override create to update attendance when new members join"""
         result = super().create(vals_list)
 
-        # Update attendance for affected channels
-        channels = result.mapped('channel_id')
-        for channel in channels:
-            channel._update_today_attendance()
+        # Add the new members to the upcoming sessions of their courses
+        self.env['slide.attendance']._queue_session_sync(member_ids=result.ids)
 
+        self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.channel.partner')
         return result
 
-    def unlink(self):
-        """Override unlink to update attendance when members leave"""
-        channels = self.mapped('channel_id')
-        result = super().unlink()
+    def init(self):
+        # Dashboard date-range filters on enrollments
+        create_index(self._cr, 'slide_channel_partner_create_date_channel_index',
+                     self._table, ['create_date', 'channel_id'])
 
-        # Update attendance for affected channels
-        for channel in channels:
-            channel._update_today_attendance()
+    def write(self, vals):
+        """Override write to refresh the dashboard when progress changes"""
+        result = super().write(vals)
+        if {'active', 'channel_id'} & set(vals):
+            # Members archived, reactivated or moved to another course
+            self.env['slide.attendance']._queue_session_sync(member_ids=self.ids)
+        self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.channel.partner')
+        return result
 
+    def unlink(self):
+        """Override unlink to refresh the dashboard when members leave"""
+        # Their attendance rows are deleted by the ondelete cascade
+        result = super().unlink()
+        self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.channel.partner', 'slide.attendance')
         return result
 
 class SlideAttendance(models.Model):
@@ -145,6 +255,7 @@ class SlideAttendance(models.Model):
     name = fields.Many2one('slide.channel.partner', string='Employee', required=True, ondelete='cascade')
     partner_name = fields.Char(related='name.partner_id.name', string='Employee Name', readonly=True)
     channel_id = fields.Many2one('slide.channel', string='Course', required=True, ondelete='cascade')
+    session_id = fields.Many2one('training.calendar', string='Session', ondelete='set null', index=True)
     date = fields.Date('Date', default=fields.Date.today)
     present = fields.Boolean('Attendance', default=False)
 
@@ -153,73 +264,226 @@ class SlideAttendance(models.Model):
          'Attendance record already exists for this employee on this date!'),
     ]
 
-    def unlink(self):
-        """Override unlink to remove from slide.channel.partner when attendance is deleted"""
+    def init(self):
+        # Dashboard date-range filters, optionally restricted to some courses
+        create_index(self._cr, 'slide_attendance_date_channel_index', self._table, ['date', 'channel_id'])
+        # Per-course lookups over a period: session sync, register, bulk marking,
+        # attendance rates. Lookups by member (name, channel_id) use the
+        # unique_attendance index. See tests/test_query_plans.py.
+        create_index(self._cr, 'slide_attendance_channel_date_index', self._table, ['channel_id', 'date'])
 
-        # Store the channel partners that will be affected
-        channel_partners_to_remove = []
+    @api.model
+    def _queue_session_sync(self, channel_ids=(), member_ids=()):
+        """Have the upcoming sessions' attendance aligned with the enrollments before commit.
+
+        ``channel_ids`` are courses whose members changed in any way,
+        ``member_ids`` the slide.channel.partner records that were created or
+        changed. Everything queued in a transaction is reconciled at once by
+        _run_session_sync.
+        """
+        data = self.env.cr.precommit.data
+        queued = data.get('training_attendance_sync')
+        if queued is None:
+            queued = data['training_attendance_sync'] = {'channel_ids': set(), 'member_ids': set()}
+            self.env.cr.precommit.add(self._run_session_sync)
+        queued['channel_ids'].update(channel_ids)
+        queued['member_ids'].update(member_ids)
 
-        for record in self:
-            # Check if this is the only attendance record for this partner in this channel
-            other_attendance = self.env['slide.attendance'].search([
-                ('name', '=', record.name.id),
-                ('channel_id', '=', record.channel_id.id),
-                ('id', '!=', record.id)  # Exclude current record
-            ])
-
-            _logger.info(
-                f"Checking attendance for partner {record.name.partner_id.name} in channel {record.channel_id.name}")
-            _logger.info(f"Other attendance records found: {len(other_attendance)}")
-
-            # If no other attendance records, mark for removal from channel
-            if not other_attendance:
-                channel_partners_to_remove.append(record.name)
-                _logger.info(f"Marking {record.name.partner_id.name} for removal from channel")
+    @api.model
+    def _run_session_sync(self):
+        queued = self.env.cr.precommit.data.pop('training_attendance_sync', None)
+        if not queued:
+            return
+        self._sync_session_rows(queued['channel_ids'], queued['member_ids'])
+        # Precommit hooks run after the last flush
+        self.env.flush_all()
 
-        # Perform the unlink operation first
-        result = super().unlink()
+    @api.model
+    def _sync_session_rows(self, channel_ids, member_ids):
+        """Reconcile the attendance of the upcoming sessions for the given courses and enrollments.
 
-        # Now remove from slide.channel.partner
-        for channel_partner in channel_partners_to_remove:
-            try:
-                # Double check the record still exists before unlinking
-                if channel_partner.exists():
-                    _logger.info(
-                        f"Removing {channel_partner.partner_id.name} from channel {channel_partner.channel_id.name}")
-                    channel_partner.unlink()
-                    _logger.info("Successfully removed from channel")
-            except Exception as e:
-                _logger.error(f"Error removing channel partner: {e}")
+        One DELETE drops the unfilled rows of members who left their course or
+        were archived, one INSERT creates the missing rows.
+        """
+        if not channel_ids and not member_ids:
+            return
+        today = fields.Date.today()
+        self.env['slide.channel.partner'].flush_model()
+        self.flush_model()
+
+        member_active = SQL("scp.active") if 'active' in self.env['slide.channel.partner']._fields else SQL("TRUE")
+        self.env.cr.execute(SQL("""
+            DELETE FROM slide_attendance sa
+                  USING slide_channel_partner scp
+                  WHERE sa.name = scp.id
+                    AND (sa.channel_id = ANY(%(channels)s) OR sa.name = ANY(%(members)s))
+                    AND sa.date >= %(today)s
+                    AND sa.session_id IS NOT NULL
+                    AND NOT sa.present
+                    AND (scp.channel_id != sa.channel_id OR NOT %(member_active)s)
+            """,
+            channels=list(channel_ids),
+            members=list(member_ids),
+            today=today,
+            member_active=member_active,
+        ))
+        changed = self.env.cr.rowcount
+
+        changed += self._create_session_rows(SQL(
+            "tc.training_date >= %s AND (scp.channel_id = ANY(%s) OR scp.id = ANY(%s))",
+            today, list(channel_ids), list(member_ids),
+        ))
+        if changed:
+            self.invalidate_model()
+            self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
 
-        return result
+    @api.model
+    def _create_session_rows(self, condition):
+        """Create the missing rows of the (session, active member) pairs matching ``condition``.
+
+        ``condition`` applies to ``training_calendar tc`` joined with the
+        ``slide_channel_partner scp`` of its course. A single INSERT ... SELECT;
+        rows that already exist for the member and date are linked to the
+        session. Returns the number of rows created or linked.
+        """
+        member_active = SQL("scp.active") if 'active' in self.env['slide.channel.partner']._fields else SQL("TRUE")
+        self.env.cr.execute(SQL("""
+            INSERT INTO slide_attendance (name, channel_id, session_id, date, present,
+                                          create_uid, create_date, write_uid, write_date)
+                 SELECT scp.id, tc.course_id, tc.id, tc.training_date, FALSE,
+                        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+                   FROM training_calendar tc
+                   JOIN slide_channel_partner scp ON scp.channel_id = tc.course_id
+                  WHERE %(member_active)s AND %(condition)s
+            ON CONFLICT (name, channel_id, date) DO UPDATE
+                    SET session_id = EXCLUDED.session_id
+                  WHERE slide_attendance.session_id IS DISTINCT FROM EXCLUDED.session_id
+            """,
+            uid=self.env.uid,
+            member_active=member_active,
+            condition=condition,
+        ))
+        return self.env.cr.rowcount
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
+        return records
 
-    # Alternative approach - remove immediately when attendance is deleted
-    def unlink_and_remove_from_channel(self):
-        """Custom method to remove attendance and optionally remove from channel"""
-        channel_partners_to_remove = []
+    def write(self, vals):
+        result = super().write(vals)
+        self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
+        return result
 
-        for record in self:
-            # Check if this partner has other attendance records in this channel
-            other_attendance_count = self.env['slide.attendance'].search_count([
-                ('name', '=', record.name.id),
-                ('channel_id', '=', record.channel_id.id),
-                ('id', '!=', record.id)
-            ])
+    @api.model
+    def mark_attendance(self, channel_id, date, partner_ids, present=True):
+        """Mark partners present (or absent) for a course and date in one statement.
+
+        Enrolled partners without a record for that date get one, linked to the
+        session of the day if any. Returns the number of enrolled partners
+        matched.
+        """
+        self.check_access('write')
+        self.check_access('create')
+        if not partner_ids:
+            return 0
+        self.flush_model()
+        self.env['slide.channel.partner'].flush_model()
+
+        member_active = SQL("scp.active") if 'active' in self.env['slide.channel.partner']._fields else SQL("TRUE")
+        self.env.cr.execute(SQL("""
+            INSERT INTO slide_attendance (name, channel_id, session_id, date, present,
+                                          create_uid, create_date, write_uid, write_date)
+                 SELECT scp.id, scp.channel_id, tc.id, %(date)s, %(present)s,
+                        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+                   FROM slide_channel_partner scp
+              LEFT JOIN training_calendar tc ON tc.course_id = scp.channel_id AND tc.training_date = %(date)s
+                  WHERE scp.channel_id = %(channel)s AND scp.partner_id = ANY(%(partners)s) AND %(member_active)s
+            ON CONFLICT (name, channel_id, date) DO UPDATE
+                    SET present = EXCLUDED.present,
+                        write_uid = EXCLUDED.write_uid,
+                        write_date = EXCLUDED.write_date
+            """,
+            date=fields.Date.to_date(date),
+            present=bool(present),
+            uid=self.env.uid,
+            channel=int(channel_id),
+            partners=[int(partner_id) for partner_id in partner_ids],
+            member_active=member_active,
+        ))
+        matched = self.env.cr.rowcount
+        if matched:
+            self.invalidate_model(['present', 'session_id'])
+            self.env['slide.channel'].invalidate_model(['attendance_ids'])
+            self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
+        return matched
+
+    def action_mark_present(self):
+        self._set_present(True)
+
+    def action_mark_absent(self):
+        self._set_present(False)
+
+    def _set_present(self, present):
+        """Set the presence of all the records with one UPDATE"""
+        if not self:
+            return
+        self.check_access('write')
+        self.env.cr.execute("""
+            UPDATE slide_attendance
+               SET present = %(present)s, write_uid = %(uid)s, write_date = NOW() AT TIME ZONE 'UTC'
+             WHERE id = ANY(%(ids)s) AND present IS DISTINCT FROM %(present)s
+        """, {'present': present, 'uid': self.env.uid, 'ids': self.ids})
+        if self.env.cr.rowcount:
+            self.invalidate_recordset(['present', 'write_uid', 'write_date'])
+            self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
 
-            # If this is the only attendance record, mark channel partner for removal
-            if other_attendance_count == 0:
-                channel_partners_to_remove.append(record.name)
+    def unlink(self):
+        """Override unlink to remove from slide.channel.partner when attendance is deleted"""
+        # Members whose last attendance records are being deleted leave the course
+        channel_partners = self._get_members_without_other_attendance()
 
-        # Remove attendance records
-        result = self.unlink()
+        # Perform the unlink operation first
+        result = super().unlink()
+        self.env['elearning.dashboard.service']._schedule_dashboard_update(self._name)
 
-        # Remove from channel
-        for cp in channel_partners_to_remove:
-            if cp.exists():
-                cp.unlink()
+        # Now remove from slide.channel.partner, in one batch
+        channel_partners = channel_partners.exists()
+        if channel_partners:
+            _logger.info("Removing %s members from their course after deleting their last attendance records",
+                         len(channel_partners))
+            channel_partners.unlink()
 
         return result
 
+    def _get_members_without_other_attendance(self):
+        """Enrollments of ``self`` that have no attendance record outside ``self``,
+        archived attendance (slide.attendance.summary) included.
+
+        One grouped query for the whole recordset, whatever its size.
+        """
+        if not self:
+            return self.env['slide.channel.partner']
+        self.flush_model(['name'])
+        self.env['slide.attendance.summary'].flush_model(['partner_id', 'channel_id'])
+        self.env.cr.execute("""
+            SELECT sa.name
+              FROM slide_attendance sa
+              JOIN slide_channel_partner scp ON scp.id = sa.name
+             WHERE sa.name IN (SELECT name FROM slide_attendance WHERE id = ANY(%(ids)s))
+               AND NOT EXISTS (SELECT 1 FROM slide_attendance_summary sas
+                                WHERE sas.channel_id = scp.channel_id AND sas.partner_id = scp.partner_id)
+          GROUP BY sa.name
+            HAVING bool_and(sa.id = ANY(%(ids)s))
+        """, {'ids': self.ids})
+        return self.env['slide.channel.partner'].browse(row[0] for row in self.env.cr.fetchall())
+
+    # Alternative approach - remove immediately when attendance is deleted
+    def unlink_and_remove_from_channel(self):
+        """Remove attendance and the members left without any attendance record"""
+        return self.unlink()
+
     def unlink_and_refresh(self):
         self.unlink()
         return {
@@ -228,7 +492,8 @@ class SlideAttendance(models.Model):
         }
 
 class MailingMailing(models.Model):
-    _inherit = 'mailing.mailing'
+    _name = 'mailing.mailing'
+    _inherit = ['mailing.mailing', 'elearning.dashboard.source']
 
     attendees_ids = fields.Many2many(
         'res.partner', string='Attendees',
@@ -238,6 +503,13 @@ class MailingMailing(models.Model):
     )
 
     course_id = fields.Many2one('slide.channel', string='Course')
+    attendee_target = fields.Selection([
+        ('course', 'All Course Members'),
+        ('selection', 'Selected Attendees'),
+    ], string='Send To', default='selection', required=True,
+        help='All Course Members: the current members of the course, resolved when the mailing is sent.\n'
+             'Selected Attendees: the attendees picked below, enrolled in the course.')
+    attendee_count = fields.Integer(string='Attendee Count', compute='_compute_attendee_count')
     training_duration = fields.Float(string='Training Duration')
     training_start_time = fields.Datetime(string='Training Start Time')
     training_end_time = fields.Datetime(string='Training End Time')
@@ -248,49 +520,155 @@ class MailingMailing(models.Model):
         if self.training_start_time and self.training_duration:
             self.training_end_time = self.training_start_time + timedelta(hours=self.training_duration)
 
+    @api.depends('attendee_target', 'course_id', 'attendees_ids')
+    def _compute_attendee_count(self):
+        course_mailings = self.filtered(lambda mailing: mailing.attendee_target == 'course')
+        member_counts = dict(self.env['slide.channel.partner']._read_group(
+            [('channel_id', 'in', course_mailings.course_id._origin.ids)], ['channel_id'], ['__count'],
+        )) if course_mailings.course_id else {}
+        for mailing in self:
+            if mailing.attendee_target == 'course':
+                mailing.attendee_count = member_counts.get(mailing.course_id._origin, 0)
+            else:
+                mailing.attendee_count = len(mailing.attendees_ids)
+
+    @api.onchange('attendee_target')
+    def _onchange_attendee_target(self):
+        """Start a hand-picked selection from the current members of the course"""
+        if self.attendee_target == 'selection' and self.course_id and not self.attendees_ids:
+            self.attendees_ids = self.env['slide.channel.partner'].search([
+                ('channel_id', '=', self.course_id._origin.id),
+            ]).partner_id
+
     def write(self, vals):
         """Override write to sync attendees with slide.channel.partner immediately."""
+        if vals.get('attendee_target') == 'selection' and 'attendees_ids' not in vals:
+            # Switched without picking anyone: the selection starts from the members
+            self.filtered(lambda mailing: mailing.attendee_target != 'selection')._prefill_attendees()
         result = super().write(vals)
-
-        for record in self:
-            if not record.course_id:
-                continue
-
-            # Fetch original channel partners from DB (not cached)
-            existing_channel_partners = self.env['slide.channel.partner'].search([
-                ('channel_id', '=', record.course_id.id)
-            ])
-            existing_partner_ids = set(existing_channel_partners.mapped('partner_id').ids)
-
-            # Current attendees after write
-            current_attendee_ids = set(record.attendees_ids.ids)
-
-            # Determine removed and added attendees
-            removed_partner_ids = existing_partner_ids - current_attendee_ids
-            added_partner_ids = current_attendee_ids - existing_partner_ids
-
-            # Remove partners from slide.channel.partner and schedule attendance update
-            if removed_partner_ids:
-                channel_partners_to_remove = existing_channel_partners.filtered(
-                    lambda cp: cp.partner_id.id in removed_partner_ids
-                )
-                if channel_partners_to_remove:
-                    _logger.info(f"Removing partners {removed_partner_ids} from course {record.course_id.name}")
-                    channel_partners_to_remove.unlink()
-                    # Attendance will be updated automatically via post-commit hook in SlideChannelPartner.unlink()
-
-            # Add new partners to slide.channel.partner
-            if added_partner_ids:
-                channel_partner_vals = [{
-                    'channel_id': record.course_id.id,
-                    'partner_id': pid
-                } for pid in added_partner_ids]
-                if channel_partner_vals:
-                    self.env['slide.channel.partner'].create(channel_partner_vals)
-                    _logger.info(f"Added new partners {added_partner_ids} to course {record.course_id.name}")
-
+        if {'attendees_ids', 'course_id'} & set(vals):
+            # Course-wide mailings target the members as they are: nothing to sync
+            self.filtered(lambda mailing: mailing.course_id and mailing.attendee_target == 'selection')._sync_course_members()
         return result
 
+    def _prefill_attendees(self):
+        """Add the current members of their course to the mailings without attendees, in one INSERT"""
+        mailings = self.filtered('course_id')
+        if not mailings:
+            return
+        mailings.flush_recordset(['course_id', 'attendees_ids'])
+        self.env['slide.channel.partner'].flush_model(['channel_id', 'partner_id'])
+        self.env.cr.execute(SQL("""
+            INSERT INTO mailing_attendees_partner_rel (mailing_id, partner_id)
+                 SELECT mm.id, scp.partner_id
+                   FROM mailing_mailing mm
+                   JOIN slide_channel_partner scp ON scp.channel_id = mm.course_id
+                  WHERE mm.id IN %(ids)s
+                    AND %(member_active)s
+                    AND NOT EXISTS (SELECT 1 FROM mailing_attendees_partner_rel rel WHERE rel.mailing_id = mm.id)
+            ON CONFLICT DO NOTHING
+            """, ids=tuple(mailings.ids), member_active=self._get_member_active_sql()))
+        mailings.invalidate_recordset(['attendees_ids'])
+
+    def _get_member_active_sql(self):
+        return SQL("scp.active") if 'active' in self.env['slide.channel.partner']._fields else SQL("TRUE")
+
+    def _get_recipients_domain(self):
+        """Restrict the partner and contact mailings of a course to its attendees.
+
+        Course-wide mailings are filtered by a subquery on the memberships,
+        resolved when the mailing is sent; mailing contacts are matched on
+        the normalized email of the members.
+        """
+        domain = super()._get_recipients_domain()
+        if not self.course_id or self.mailing_model_real not in ('res.partner', 'mailing.contact'):
+            return domain
+        if self.attendee_target == 'selection':
+            if not self.attendees_ids:
+                # Nobody picked yet: the mailing keeps its usual audience
+                return domain
+            if self.mailing_model_real == 'res.partner':
+                return expression.AND([domain, [('id', 'in', self.attendees_ids.ids)]])
+            emails = [email for email in self.attendees_ids.mapped('email_normalized') if email]
+            return expression.AND([domain, [('email_normalized', 'in', emails)]])
+
+        self.env['slide.channel.partner'].flush_model(['channel_id', 'partner_id'])
+        recipients = self.env[self.mailing_model_real]._search([])
+        recipient_id = SQL.identifier(recipients.table, 'id')
+        if self.mailing_model_real == 'res.partner':
+            members = SQL("""
+                EXISTS (SELECT 1 FROM slide_channel_partner scp
+                         WHERE scp.partner_id = %(recipient)s AND scp.channel_id = %(course)s AND %(member_active)s)
+                """, recipient=recipient_id, course=self.course_id.id, member_active=self._get_member_active_sql())
+        else:
+            self.env['res.partner'].flush_model(['email_normalized'])
+            members = SQL("""
+                EXISTS (SELECT 1 FROM slide_channel_partner scp
+                          JOIN res_partner rp ON rp.id = scp.partner_id
+                         WHERE rp.email_normalized = %(email)s AND scp.channel_id = %(course)s AND %(member_active)s)
+                """, email=SQL.identifier(recipients.table, 'email_normalized'), course=self.course_id.id,
+                member_active=self._get_member_active_sql())
+        recipients.add_where(members)
+        return expression.AND([domain, [('id', 'in', recipients)]])
+
+    def _sync_course_members(self):
+        """Align the members of the mailings' courses with their attendees.
+
+        Attendees without enrollment are added (archived members are
+        reactivated), members who are no longer attendees are removed. The
+        differences are computed in SQL, so unchanged attendee lists cost two
+        queries whatever their size, and applied as one batched create, write
+        and unlink.
+        """
+        if not self:
+            return
+        self.flush_recordset(['course_id', 'attendees_ids'])
+        ChannelPartner = self.env['slide.channel.partner'].with_context(active_test=False)
+        ChannelPartner.flush_model(['channel_id', 'partner_id'])
+        member_active = self._get_member_active_sql()
+
+        # Attendees of each mailing that are not (or no longer) members of its course
+        self.env.cr.execute(SQL("""
+            SELECT DISTINCT mm.course_id, rel.partner_id, scp.id
+              FROM mailing_mailing mm
+              JOIN mailing_attendees_partner_rel rel ON rel.mailing_id = mm.id
+         LEFT JOIN slide_channel_partner scp ON scp.channel_id = mm.course_id AND scp.partner_id = rel.partner_id
+             WHERE mm.id IN %(ids)s
+               AND (scp.id IS NULL OR NOT %(member_active)s)
+            """, ids=tuple(self.ids), member_active=member_active))
+        added = self.env.cr.fetchall()
+
+        # Members of each course that are not attendees of its mailing; an empty
+        # selection is not a request to unenroll everyone
+        self.env.cr.execute(SQL("""
+            SELECT DISTINCT scp.id
+              FROM mailing_mailing mm
+              JOIN slide_channel_partner scp ON scp.channel_id = mm.course_id
+             WHERE mm.id IN %(ids)s
+               AND %(member_active)s
+               AND EXISTS (SELECT 1 FROM mailing_attendees_partner_rel rel WHERE rel.mailing_id = mm.id)
+               AND NOT EXISTS (SELECT 1
+                                 FROM mailing_attendees_partner_rel rel
+                                WHERE rel.mailing_id = mm.id AND rel.partner_id = scp.partner_id)
+            """, ids=tuple(self.ids), member_active=member_active))
+        removed_ids = [row[0] for row in self.env.cr.fetchall()]
+
+        if removed_ids:
+            _logger.info("Removing %s members from the courses of mailings %s", len(removed_ids), self.ids)
+            ChannelPartner.browse(removed_ids).unlink()
+
+        archived_ids = [member_id for _course_id, _partner_id, member_id in added if member_id]
+        if archived_ids:
+            ChannelPartner.browse(archived_ids).write({'active': True})
+
+        new_members = [
+            {'channel_id': course_id, 'partner_id': partner_id}
+            for course_id, partner_id, member_id in added if not member_id
+        ]
+        if new_members:
+            _logger.info("Adding %s members to the courses of mailings %s", len(new_members), self.ids)
+            ChannelPartner.create(new_members)
+
     def _remove_partners_from_course(self, course_id, partner_ids):
         """Remove partners from slide.channel.partner (attendance cascades automatically)"""
         _logger.info(f"Removing partners {partner_ids} from course {course_id}")
@@ -342,41 +720,27 @@ class MailingMailing(models.Model):
 
     @api.model
     def default_get(self, fields):
-        """Auto-populate attendees based on context"""
+        """Target the members of the course the mailing is created from.
+
+        Only an explicit course (default_course_id, or created from a course)
+        restricts the recipients; other mailings keep their usual audience.
+        """
         defaults = super().default_get(fields)
 
-        # Check if we have course context from URL or previous action
         if self.env.context.get('default_course_id'):
             course_id = self.env.context.get('default_course_id')
         elif self.env.context.get('active_model') == 'slide.channel' and self.env.context.get('active_id'):
             course_id = self.env.context.get('active_id')
         else:
-            # Look for course in current session or user preferences
-            course_id = self._get_current_course()
+            course_id = False
 
         if course_id:
             defaults['course_id'] = course_id
-            channel_partners = self.env['slide.channel.partner'].search([
-                ('channel_id', '=', course_id)
-            ])
-            defaults['attendees_ids'] = [(6, 0, channel_partners.mapped('partner_id').ids)]
+            # Members are resolved when sending; the form only shows their count
+            defaults['attendee_target'] = 'course'
 
         return defaults
 
-    def _get_current_course(self):
-        """Get the most recent or relevant course for the user"""
-        # Option 1: Get the most recently accessed course by current user
-        recent_course = self.env['slide.channel'].search([
-            ('channel_partner_ids.partner_id', '=', self.env.user.partner_id.id)
-        ], limit=1, order='write_date desc')
-
-        if recent_course:
-            return recent_course.id
-
-        # Option 2: Get the most popular/active course
-        active_course = self.env['slide.channel'].search([], limit=1, order='total_views desc')
-        return active_course.id if active_course else False
-
 
 class AttendanceProof(models.Model):
     _name = 'attendance.proof'
@@ -393,8 +757,13 @@ class AttendanceProof(models.Model):
         store=True
     )
 
-    proof_image = fields.Binary(string='Proof of Attendance', required=True, attachment=True)
+    # Required in the views: uploads link the stored attachment after create
+    proof_image = fields.Binary(string='Proof of Attendance', attachment=True)
+    # Generated in the background by the attendance.proof.job worker
+    proof_thumbnail = fields.Image(string='Thumbnail', attachment=True, readonly=True)
     proof_filename = fields.Char(string='Filename')
+    # SHA-1 of the uploaded file, before normalization: copies share their stored files
+    content_hash = fields.Char(string='Content Hash', readonly=True, index=True, copy=False)
     upload_date = fields.Datetime(string='Upload Date', default=fields.Datetime.now, readonly=True)
     notes = fields.Text(string='Notes')
     status = fields.Selection([
@@ -408,6 +777,318 @@ class AttendanceProof(models.Model):
          'You have already uploaded proof for this training date!'),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        if not self.env.su and any(vals.get('status', 'pending') != 'pending' for vals in vals_list):
+            self._check_reviewer()
+        vals_list = [self._add_content_hash(vals) for vals in vals_list]
+        records = super().create(vals_list)
+        # Uploads link their image after create: queue every new proof
+        self.env['attendance.proof.job']._enqueue(records)
+        records.filtered(lambda proof: proof.status != 'pending')._sync_attendance_presence()
+        self.env['elearning.dashboard.service']._schedule_dashboard_update()
+        return records
+
+    def write(self, vals):
+        if 'status' in vals and not self.env.su:
+            # The review status drives the attendance presence
+            self._check_reviewer()
+        if not self.env.context.get('proof_image_processed'):
+            vals = self._add_content_hash(vals)
+        result = super().write(vals)
+        if 'proof_image' in vals and not self.env.context.get('proof_image_processed'):
+            self.env['attendance.proof.job']._enqueue(self)
+        if 'status' in vals:
+            self._sync_attendance_presence()
+        self.env['elearning.dashboard.service']._schedule_dashboard_update()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env['elearning.dashboard.service']._schedule_dashboard_update()
+        return result
+
+    def init(self):
+        # Lookups by member (partner_id, course_id) use the unique_training_proof index
+        # Proofs of a training session
+        create_index(self._cr, 'attendance_proof_course_date_index', self._table, ['course_id', 'training_date'])
+        # Review queue: pending proofs, oldest first
+        create_index(self._cr, 'attendance_proof_pending_index', self._table,
+                     ['upload_date', 'id'], where="status = 'pending'")
+
+    @api.model
+    def _check_reviewer(self):
+        if not self.env.user.has_group('website_slides.group_website_slides_officer'):
+            raise AccessError(_("Only eLearning officers can review attendance proofs."))
+
+    @api.model
+    def get_review_queue(self, after=None, limit=REVIEW_QUEUE_PAGE_SIZE, course_id=False):
+        """Page of pending proofs, oldest first, for the review queue.
+
+        ``after`` is the ``next`` key of the previous page ([upload_date, id]):
+        pages are read in order from the partial index on pending proofs.
+        Proofs come with the URL of their thumbnail, never with their files.
+        """
+        self._check_reviewer()
+        limit = max(1, min(int(limit), REVIEW_QUEUE_MAX_PAGE_SIZE))
+        self.flush_model(['partner_id', 'course_id', 'training_date', 'proof_filename', 'notes',
+                          'upload_date', 'status'])
+
+        conditions = [SQL("proof.status = 'pending'")]
+        if after:
+            conditions.append(SQL("(proof.upload_date, proof.id) > (%s, %s)", after[0], after[1]))
+        if course_id:
+            conditions.append(SQL("proof.course_id = %s", course_id))
+        self.env.cr.execute(SQL("""
+            SELECT proof.id, proof.upload_date, proof.training_date, proof.proof_filename, proof.notes,
+                   rp.name, COALESCE(sc.name->>%(lang)s, sc.name->>'en_US'),
+                   EXISTS(SELECT 1 FROM ir_attachment attachment
+                           WHERE attachment.res_model = 'attendance.proof'
+                             AND attachment.res_field = 'proof_thumbnail'
+                             AND attachment.res_id = proof.id)
+              FROM attendance_proof proof
+              JOIN res_partner rp ON rp.id = proof.partner_id
+              JOIN slide_channel sc ON sc.id = proof.course_id
+             WHERE %(conditions)s
+          ORDER BY proof.upload_date, proof.id
+             LIMIT %(limit)s
+            """,
+            lang=self.env.lang or 'en_US',
+            conditions=SQL(" AND ").join(conditions),
+            limit=limit + 1,
+        ))
+        rows = self.env.cr.fetchall()
+
+        proofs = [{
+            'id': proof_id,
+            'uploadDate': fields.Datetime.to_string(upload_date),
+            'trainingDate': fields.Date.to_string(training_date),
+            'filename': filename,
+            'notes': notes or '',
+            'partnerName': partner_name,
+            'courseName': course_name,
+            # The full image resized on the fly until the thumbnail is generated
+            'thumbnailUrl': (f'/web/image/attendance.proof/{proof_id}/proof_thumbnail' if has_thumbnail
+                             else f'/web/image/attendance.proof/{proof_id}/proof_image/{PROOF_THUMBNAIL_SIZE}x{PROOF_THUMBNAIL_SIZE}'),
+            'imageUrl': f'/web/image/attendance.proof/{proof_id}/proof_image',
+        } for proof_id, upload_date, training_date, filename, notes, partner_name, course_name, has_thumbnail
+            in rows[:limit]]
+        next_key = [proofs[-1]['uploadDate'], proofs[-1]['id']] if len(rows) > limit else False
+        return {'proofs': proofs, 'next': next_key}
+
+    def action_set_status(self, status):
+        """Set the review status of all the proofs with one UPDATE.
+
+        The presence of the matching attendance records follows, in one
+        more UPDATE. Returns the number of proofs whose status changed.
+        """
+        if status not in dict(self._fields['status'].selection):
+            raise ValueError(f"Unknown proof status: {status}")
+        self._check_reviewer()
+        if not self:
+            return 0
+        self.flush_recordset(['status'])
+        self.env.cr.execute(SQL("""
+            UPDATE attendance_proof
+               SET status = %(status)s, write_uid = %(uid)s, write_date = NOW() AT TIME ZONE 'UTC'
+             WHERE id = ANY(%(ids)s) AND status IS DISTINCT FROM %(status)s
+         RETURNING id
+            """, status=status, uid=self.env.uid, ids=self.ids))
+        changed = self.browse(row[0] for row in self.env.cr.fetchall())
+        if changed:
+            self.invalidate_recordset(['status', 'write_uid', 'write_date'])
+            changed._sync_attendance_presence()
+            self.env['elearning.dashboard.service']._schedule_dashboard_update()
+        return len(changed)
+
+    def _sync_attendance_presence(self):
+        """Mark the attendance of approved proofs present and of rejected ones
+        absent, with one UPDATE; pending proofs leave the attendance as it is."""
+        if not self:
+            return
+        self.flush_recordset(['status', 'partner_id', 'course_id', 'training_date'])
+        self.env['slide.channel.partner'].flush_model(['channel_id', 'partner_id'])
+        self.env['slide.attendance'].flush_model(['name', 'channel_id', 'date', 'present'])
+        self.env.cr.execute(SQL("""
+            UPDATE slide_attendance sa
+               SET present = (proof.status = 'approved'),
+                   write_uid = %(uid)s, write_date = NOW() AT TIME ZONE 'UTC'
+              FROM attendance_proof proof
+              JOIN slide_channel_partner scp ON scp.channel_id = proof.course_id AND scp.partner_id = proof.partner_id
+             WHERE proof.id = ANY(%(ids)s)
+               AND proof.status IN ('approved', 'rejected')
+               AND sa.name = scp.id AND sa.channel_id = proof.course_id AND sa.date = proof.training_date
+               AND sa.present IS DISTINCT FROM (proof.status = 'approved')
+            """, uid=self.env.uid, ids=self.ids))
+        if self.env.cr.rowcount:
+            self.env['slide.attendance'].invalidate_model(['present', 'write_uid', 'write_date'])
+            self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.attendance')
+
+    @api.model
+    def _add_content_hash(self, vals):
+        """Values with the content_hash of the proof_image they set"""
+        if 'proof_image' not in vals or 'content_hash' in vals:
+            return vals
+        image = vals['proof_image']
+        content_hash = hashlib.sha1(base64.b64decode(image)).hexdigest() if image else False
+        return dict(vals, content_hash=content_hash)
+
+    @api.model
+    def _get_upload_limits(self):
+        """Maximum size in bytes of an uploaded proof and of a whole upload request"""
+        get_param = self.env['ir.config_parameter'].sudo().get_param
+        file_size = int(get_param(PROOF_MAX_FILE_SIZE_PARAM, PROOF_MAX_FILE_SIZE_DEFAULT))
+        request_size = int(get_param(PROOF_MAX_REQUEST_SIZE_PARAM, PROOF_MAX_REQUEST_SIZE_DEFAULT))
+        return file_size * 1024 * 1024, request_size * 1024 * 1024
+
+    @api.model
+    def _create_from_uploads(self, vals, uploads):
+        """Create one proof per uploaded file (werkzeug FileStorage).
+
+        The files are copied chunk by chunk into the attachment storage and
+        linked to the proofs as their proof_image, so no upload is ever held
+        in memory or base64-encoded.
+        """
+        max_file_size, max_request_size = self._get_upload_limits()
+        stored = []
+        total_size = 0
+        for upload in uploads:
+            content = self._store_upload(upload, max_file_size)
+            total_size += content['file_size']
+            if total_size > max_request_size:
+                raise UserError(_("The uploaded files exceed %s MB in total.", max_request_size // (1024 * 1024)))
+            stored.append(content)
+
+        proofs = self.create([
+            dict(vals, proof_filename=upload.filename, content_hash=content['checksum'])
+            for upload, content in zip(uploads, stored)
+        ])
+        attachments = self.env['ir.attachment'].sudo().create([{
+            'name': proof.proof_filename or 'proof_image',
+            'res_model': self._name,
+            'res_field': 'proof_image',
+            'res_id': proof.id,
+            'type': 'binary',
+            'mimetype': content['mimetype'],
+            **({'raw': content['raw']} if 'raw' in content else {}),
+        } for proof, content in zip(proofs, stored)])
+
+        # ir.attachment drops the storage columns from create(): set them directly
+        filestore_rows = [
+            SQL("(%s, %s, %s, %s)", attachment.id, content['store_fname'], content['checksum'], content['file_size'])
+            for attachment, content in zip(attachments, stored) if 'store_fname' in content
+        ]
+        if filestore_rows:
+            self.env.cr.execute(SQL("""
+                UPDATE ir_attachment a
+                   SET store_fname = v.store_fname, checksum = v.checksum, file_size = v.file_size
+                  FROM (VALUES %s) AS v(id, store_fname, checksum, file_size)
+                 WHERE a.id = v.id
+                """, SQL(", ").join(filestore_rows)))
+            attachments.invalidate_recordset(['store_fname', 'checksum', 'file_size'])
+        return proofs
+
+    @api.model
+    def _store_upload(self, upload, max_size):
+        """Copy an uploaded file into the filestore in chunks.
+
+        Returns the storage values of its attachment; with database storage
+        the content itself (``raw``) is returned instead.
+        """
+        Attachment = self.env['ir.attachment'].sudo()
+        stream = upload.stream
+        head = stream.read(PROOF_UPLOAD_CHUNK_SIZE)
+        mimetype = guess_mimetype(head, default=upload.mimetype or 'application/octet-stream')
+        too_large = _("%(file)s is larger than %(size)s MB.", file=upload.filename, size=max_size // (1024 * 1024))
+
+        if Attachment._storage() != 'file':
+            raw = head + stream.read(max_size + 1 - len(head))
+            if len(raw) > max_size:
+                raise UserError(too_large)
+            return {'raw': raw, 'checksum': hashlib.sha1(raw).hexdigest(), 'file_size': len(raw), 'mimetype': mimetype}
+
+        sha = hashlib.sha1()
+        size = 0
+        chunk = head
+        with tempfile.NamedTemporaryFile(dir=Attachment._filestore(), prefix='upload-', delete=False) as tmp:
+            try:
+                while chunk:
+                    size += len(chunk)
+                    if size > max_size:
+                        raise UserError(too_large)
+                    sha.update(chunk)
+                    tmp.write(chunk)
+                    chunk = stream.read(PROOF_UPLOAD_CHUNK_SIZE)
+            except Exception:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+        checksum = sha.hexdigest()
+        # Same layout as ir.attachment._get_path, whose collision check needs the content in memory
+        fname = f'{checksum[:2]}/{checksum}'
+        full_path = Attachment._full_path(fname)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if os.path.isfile(full_path):
+            same_content = filecmp.cmp(tmp.name, full_path, shallow=False)
+            os.unlink(tmp.name)
+            if not same_content:
+                raise UserError(_("The attachment collides with an existing file."))
+        else:
+            os.replace(tmp.name, full_path)
+        # Collected by the attachment garbage collector if the transaction fails
+        Attachment._mark_for_gc(fname)
+        return {'store_fname': fname, 'checksum': checksum, 'file_size': size, 'mimetype': mimetype}
+
+    def _process_image(self):
+        """Strip the metadata of the proof image, downsize and recompress it, and
+        generate its thumbnail. Files that are not images are left untouched."""
+        self.ensure_one()
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'proof_image'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+        if not attachment or not (attachment.mimetype or '').startswith('image/'):
+            return
+
+        # The same upload was already processed: share its files instead
+        twin = self.content_hash and self.search([
+            ('content_hash', '=', self.content_hash),
+            ('proof_thumbnail', '!=', False),
+            ('id', '!=', self.id),
+        ], limit=1)
+        if twin:
+            self.sudo().with_context(proof_image_processed=True).write({
+                'proof_image': twin.proof_image,
+                'proof_thumbnail': twin.proof_thumbnail,
+            })
+            return
+
+        max_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            PROOF_IMAGE_MAX_SIZE_PARAM, PROOF_IMAGE_MAX_SIZE_DEFAULT))
+        # Re-encoding drops the EXIF data. JPEGs are recompressed; image_process
+        # leaves other formats untouched unless resized, so they are saved again
+        # in their own format
+        source = attachment.raw
+        if attachment.mimetype == 'image/jpeg':
+            image = image_process(source, size=(max_size, max_size), quality=PROOF_IMAGE_QUALITY)
+        else:
+            image = self._reencode_image(image_process(source, size=(max_size, max_size)))
+        thumbnail = image_process(image, size=(PROOF_THUMBNAIL_SIZE, PROOF_THUMBNAIL_SIZE), quality=PROOF_IMAGE_QUALITY)
+
+        vals = {'proof_thumbnail': base64.b64encode(thumbnail)}
+        if image != source:
+            vals['proof_image'] = base64.b64encode(image)
+        self.sudo().with_context(proof_image_processed=True).write(vals)
+        _logger.info("Processed the image of proof %s: %s -> %s bytes", self.id, len(source), len(image))
+
+    @api.model
+    def _reencode_image(self, data):
+        """``data`` saved again in its own format, upright and without its metadata"""
+        image = binary_to_image(data)
+        return image_apply_opt(image_fix_orientation(image), image.format)
+
     @api.depends('course_id', 'training_date')
     def _compute_training_schedule(self):
         """Link to the corresponding training schedule"""
@@ -434,6 +1115,8 @@ class TrainingCalendar(models.Model):
     description = fields.Text(string='Description')
     location = fields.Char(string='Location')
 
+    attendance_ids = fields.One2many('slide.attendance', 'session_id', string='Attendance')
+
     # New field for number of participants
     participant_count = fields.Integer(
         string='No. of Participants',
@@ -446,6 +1129,149 @@ class TrainingCalendar(models.Model):
          'Training date already exists for this course!'),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Override create to add the course members to the new sessions"""
+        sessions = super().create(vals_list)
+        sessions._generate_attendance()
+        return sessions
+
+    def write(self, vals):
+        """Override write to follow the session when it is moved"""
+        result = super().write(vals)
+        if 'course_id' in vals:
+            # Members of another course: start over, keeping the attendance
+            # already recorded, no longer linked to the session
+            self.flush_recordset(['course_id', 'training_date'])
+            self.env['slide.attendance'].flush_model()
+            self.env.cr.execute(SQL("""
+                DELETE FROM slide_attendance WHERE session_id IN %(ids)s AND date >= %(today)s AND NOT present;
+                UPDATE slide_attendance
+                   SET session_id = NULL, write_uid = %(uid)s, write_date = NOW() AT TIME ZONE 'UTC'
+                 WHERE session_id IN %(ids)s
+                """, ids=tuple(self.ids), today=fields.Date.today(), uid=self.env.uid))
+            self.env['slide.attendance'].invalidate_model()
+            self._generate_attendance()
+            self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.attendance')
+        elif 'training_date' in vals:
+            self.flush_recordset(['training_date'])
+            self.env['slide.attendance'].flush_model()
+            # Rows of the new date without a session (e.g. check-ins on a day
+            # without session) are merged into the session rows of the same
+            # member, the others join the session
+            self.env.cr.execute(SQL("""
+                UPDATE slide_attendance sa
+                   SET present = TRUE,
+                       write_uid = %(uid)s,
+                       write_date = NOW() AT TIME ZONE 'UTC'
+                  FROM training_calendar tc, slide_attendance other
+                 WHERE tc.id IN %(ids)s
+                   AND sa.session_id = tc.id
+                   AND NOT sa.present
+                   AND other.session_id IS NULL
+                   AND other.present
+                   AND other.name = sa.name
+                   AND other.channel_id = tc.course_id
+                   AND other.date = tc.training_date;
+                DELETE FROM slide_attendance other
+                      USING training_calendar tc, slide_attendance sa
+                      WHERE tc.id IN %(ids)s
+                        AND other.session_id IS NULL
+                        AND other.channel_id = tc.course_id
+                        AND other.date = tc.training_date
+                        AND sa.session_id = tc.id
+                        AND sa.name = other.name;
+                UPDATE slide_attendance sa
+                   SET date = tc.training_date,
+                       write_uid = %(uid)s,
+                       write_date = NOW() AT TIME ZONE 'UTC'
+                  FROM training_calendar tc
+                 WHERE sa.session_id = tc.id AND tc.id IN %(ids)s;
+                UPDATE slide_attendance sa
+                   SET session_id = tc.id,
+                       write_uid = %(uid)s,
+                       write_date = NOW() AT TIME ZONE 'UTC'
+                  FROM training_calendar tc
+                 WHERE tc.id IN %(ids)s
+                   AND sa.session_id IS NULL
+                   AND sa.channel_id = tc.course_id
+                   AND sa.date = tc.training_date
+                """, ids=tuple(self.ids), uid=self.env.uid))
+            self.env['slide.attendance'].invalidate_model()
+            self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.attendance')
+        return result
+
+    def unlink(self):
+        """Drop the unfilled rows of the upcoming sessions; the recorded attendance is kept"""
+        if self.ids:
+            self.env['slide.attendance'].flush_model()
+            self.env.cr.execute(SQL(
+                "DELETE FROM slide_attendance WHERE session_id IN %s AND date >= %s AND NOT present",
+                tuple(self.ids), fields.Date.today(),
+            ))
+            if self.env.cr.rowcount:
+                self.env['slide.attendance'].invalidate_model()
+                self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.attendance')
+        return super().unlink()
+
+    def action_show_checkin_qr(self):
+        """Open the check-in QR code of the session, valid for CHECKIN_TOKEN_TTL seconds"""
+        self.ensure_one()
+        checkin_url = f"{self.get_base_url()}/training/checkin/{self._get_checkin_token()}"
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f"/report/barcode/?barcode_type=QR&width=400&height=400&value={quote(checkin_url, safe='')}",
+            'target': 'new',
+        }
+
+    def _get_checkin_token(self, ttl=CHECKIN_TOKEN_TTL):
+        """Signed, time-limited check-in token: session, course, date and expiry, HMAC-signed
+        with the database secret"""
+        self.ensure_one()
+        payload = f"{self.id}:{self.course_id.id}:{self.training_date}:{int(time.time()) + ttl}"
+        signature = hmac(self.env(su=True), 'training_checkin', payload)
+        return f"{base64.urlsafe_b64encode(payload.encode()).decode()}.{signature}"
+
+    @api.model
+    def _verify_checkin_token(self, token):
+        """Decode a check-in token without reading the session.
+
+        The signature only depends on the (cached) database secret, so tokens
+        are verified in memory. Returns a dict with a ``status`` ('ok',
+        'invalid' or 'expired') and, when valid, the session, course and date.
+        """
+        try:
+            encoded, signature = (token or '').rsplit('.', 1)
+            payload = base64.urlsafe_b64decode(encoded.encode()).decode()
+            session_id, channel_id, date, expires = payload.split(':')
+            session_id, channel_id, expires = int(session_id), int(channel_id), int(expires)
+        except ValueError:
+            return {'status': 'invalid'}
+        if not consteq(hmac(self.env(su=True), 'training_checkin', payload), signature):
+            return {'status': 'invalid'}
+        if expires < time.time():
+            return {'status': 'expired'}
+        return {'status': 'ok', 'session_id': session_id, 'channel_id': channel_id, 'date': date}
+
+    def _generate_attendance(self):
+        """Create the missing attendance rows of the sessions for the course members.
+
+        Returns the number of rows created (or linked to the session).
+        """
+        if not self:
+            return 0
+        self.flush_recordset(['course_id', 'training_date'])
+        self.env['slide.channel.partner'].flush_model()
+        self.env['slide.attendance'].flush_model()
+
+        created = self.env['slide.attendance']._create_session_rows(SQL("tc.id IN %s", tuple(self.ids)))
+        if created:
+            self.env['slide.attendance'].invalidate_model()
+            self.env['slide.channel'].invalidate_model(['attendance_ids'])
+            self.invalidate_recordset(['attendance_ids'])
+            self.env['elearning.dashboard.service']._schedule_dashboard_update('slide.attendance')
+        return created
+
     @api.depends('start_time', 'end_time')
     def _compute_duration(self):
         for record in self:
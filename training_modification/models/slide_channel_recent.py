@@ -0,0 +1,74 @@
+from odoo import models, fields, api
+from odoo.tools import SQL
+from odoo.tools.sql import create_index
+
+# Courses remembered per user
+RECENT_COURSES_LIMIT = 10
+# A visit within this many seconds of the previous one is not written again
+RECENT_VISIT_THROTTLE = 300
+
+
+class SlideChannelRecent(models.Model):
+    _name = 'slide.channel.recent'
+    _description = 'Recently Visited Course'
+    _order = 'last_visit desc'
+
+    user_id = fields.Many2one('res.users', string='User', required=True, ondelete='cascade')
+    channel_id = fields.Many2one('slide.channel', string='Course', required=True, ondelete='cascade')
+    last_visit = fields.Datetime(string='Last Visit', required=True)
+
+    _sql_constraints = [
+        ('unique_user_channel', 'unique(user_id, channel_id)', 'The course is already recorded for this user!'),
+    ]
+
+    def init(self):
+        # Latest course of a user: a single index probe
+        create_index(self._cr, 'slide_channel_recent_user_visit_index', self._table, ['user_id', 'last_visit DESC'])
+
+    @api.model
+    def _record_visit(self, channel_id):
+        """Remember that the current user opened a course.
+
+        One upsert, skipped while the previous visit is recent; the oldest
+        courses beyond RECENT_COURSES_LIMIT are forgotten when a new one is
+        added.
+        """
+        if not channel_id or self.env.user._is_public():
+            return
+        self.env.cr.execute(SQL("""
+            INSERT INTO slide_channel_recent AS recent (user_id, channel_id, last_visit,
+                                                        create_uid, create_date, write_uid, write_date)
+                 VALUES (%(uid)s, %(channel)s, NOW() AT TIME ZONE 'UTC',
+                         %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC')
+            ON CONFLICT (user_id, channel_id) DO UPDATE
+                    SET last_visit = EXCLUDED.last_visit,
+                        write_date = EXCLUDED.write_date
+                  WHERE recent.last_visit < EXCLUDED.last_visit - make_interval(secs => %(throttle)s)
+              RETURNING xmax = 0
+            """, uid=self.env.uid, channel=channel_id, throttle=RECENT_VISIT_THROTTLE))
+        row = self.env.cr.fetchone()
+        if row and row[0]:
+            self.env.cr.execute(SQL("""
+                DELETE FROM slide_channel_recent
+                 WHERE user_id = %(uid)s
+                   AND id NOT IN (SELECT id FROM slide_channel_recent
+                                   WHERE user_id = %(uid)s
+                                ORDER BY last_visit DESC
+                                   LIMIT %(limit)s)
+                """, uid=self.env.uid, limit=RECENT_COURSES_LIMIT))
+        self.invalidate_model()
+
+    @api.model
+    def _get_last_course(self):
+        """Course the current user opened last, or an empty recordset"""
+        self.flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT recent.channel_id
+              FROM slide_channel_recent recent
+              JOIN slide_channel sc ON sc.id = recent.channel_id
+             WHERE recent.user_id = %s AND sc.active
+          ORDER BY recent.last_visit DESC
+             LIMIT 1
+            """, self.env.uid))
+        row = self.env.cr.fetchone()
+        return self.env['slide.channel'].browse(row[0] if row else ())
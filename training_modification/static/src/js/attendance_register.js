@@ -0,0 +1,125 @@
+/** @odoo-module **/
+
+import { _t } from "@web/core/l10n/translation";
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
+import { formatDate, deserializeDate } from "@web/core/l10n/dates";
+import { Component, onWillStart, useState } from "@odoo/owl";
+
+// Decode the hex bitsets of a register member into one state per session
+function decodeCells(member, sessionCount) {
+    const present = BigInt(`0x${member.present}`);
+    const recorded = BigInt(`0x${member.recorded}`);
+    const cells = [];
+    for (let index = 0; index < sessionCount; index++) {
+        const bit = 1n << BigInt(index);
+        cells.push((present & bit) ? "present" : (recorded & bit) ? "absent" : "none");
+    }
+    return cells;
+}
+
+class AttendanceRegister extends Component {
+    static template = "training_modification.AttendanceRegister";
+    static props = {
+        action: { type: Object, optional: true },
+        actionId: { type: Number, optional: true },
+        updateActionState: { type: Function, optional: true },
+        className: { type: String, optional: true },
+        "*": true,
+    };
+
+    setup() {
+        this.orm = useService("orm");
+        this.notification = useService("notification");
+        const action = this.props.action || {};
+        this.channelId = action.params?.channel_id || action.context?.active_id;
+        this.state = useState({
+            loading: true,
+            sessions: [],
+            members: [],
+            next: false,
+            older: false,
+            newer: false,
+            // Date window of the displayed sessions
+            window: {},
+        });
+        onWillStart(() => this.load());
+    }
+
+    async fetchPage(after = false) {
+        return this.orm.call("slide.channel", "get_attendance_register", [[this.channelId]], {
+            after,
+            date_from: this.state.window.date_from || false,
+            date_to: this.state.window.date_to || false,
+        });
+    }
+
+    async load() {
+        this.state.loading = true;
+        try {
+            const page = await this.fetchPage();
+            this.state.sessions = page.sessions.map((session) => ({
+                ...session,
+                label: formatDate(deserializeDate(session.date)),
+            }));
+            this.state.members = page.members.map((member) => this.toRow(member));
+            Object.assign(this.state, { next: page.next, older: page.older, newer: page.newer });
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    toRow(member) {
+        return { ...member, cells: decodeCells(member, this.state.sessions.length) };
+    }
+
+    loadMore = async () => {
+        if (!this.state.next) return;
+        const page = await this.fetchPage(this.state.next);
+        this.state.members.push(...page.members.map((member) => this.toRow(member)));
+        this.state.next = page.next;
+    }
+
+    showOlder = () => {
+        this.state.window = { date_to: this.state.older };
+        this.load();
+    }
+
+    showNewer = () => {
+        this.state.window = { date_from: this.state.newer };
+        this.load();
+    }
+
+    toggle = async (member, index) => {
+        const present = member.cells[index] !== "present";
+        await this.mark([member], index, present);
+    }
+
+    // Mark every loaded member of a session, in one call
+    markSession = async (index, present) => {
+        await this.mark(this.state.members, index, present);
+    }
+
+    async mark(members, index, present) {
+        const session = this.state.sessions[index];
+        const matched = await this.orm.call("slide.attendance", "mark_attendance", [
+            this.channelId,
+            session.date,
+            members.map((member) => member.partnerId),
+            present,
+        ]);
+        if (matched < members.length) {
+            this.notification.add(_t("Some members could not be marked; reload the register."), { type: "warning" });
+        }
+        for (const member of members) {
+            member.cells[index] = present ? "present" : "absent";
+        }
+    }
+
+    generateAttendance = async () => {
+        await this.orm.call("slide.channel", "action_generate_session_attendance", [[this.channelId]]);
+        await this.load();
+    }
+}
+
+registry.category("actions").add("training_modification.attendance_register", AttendanceRegister);
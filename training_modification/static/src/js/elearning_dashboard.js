@@ -2,7 +2,18 @@
 
 import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
-import { Component, onWillStart, useState, onMounted, onWillUnmount } from "@odoo/owl";
+import { deserializeDateTime, formatDateTime } from "@web/core/l10n/dates";
+import { Component, onWillStart, useState, useRef, onMounted, onWillUnmount } from "@odoo/owl";
+
+// Dashboard section name -> chart render method
+const CHART_RENDERERS = {
+    CourseProgressChart: "renderCourseProgressChart",
+    studentProgress: "renderProgressPieChart",
+    enrollmentsByMonth: "renderEnrollmentsChart",
+    attendanceByMonth: "renderAttendanceChart",
+    completionRates: "renderCompletionRatesChart",
+};
+const ALL_SECTIONS = ["kpis", ...Object.keys(CHART_RENDERERS)];
 
 class ELearningDashboard extends Component {
     static props = {
@@ -18,6 +29,14 @@ class ELearningDashboard extends Component {
         this.orm = useService("orm");
         this.actionService = useService("action");
         this.ui = useService("ui");
+        this.rootRef = useRef("root");
+        // Versions of the sections we hold, sent back so unchanged sections are skipped
+        this.sectionVersions = {};
+        this.sectionRefreshedAt = {};
+        this.visibleSections = new Set(ALL_SECTIONS);
+        // Live updates come from the bus; polling is only used while it is unavailable
+        this.busService = this.env.services.bus_service;
+        this.busChannel = `elearning_dashboard_${this.env.services.company.currentCompany.id}`;
         this.state = useState({
             loading: true,
             kpis: {
@@ -35,23 +54,32 @@ class ELearningDashboard extends Component {
                 pendingCourses: 0,
             },
             chartData: {},
+            // Course progress chart: ranked series, paged on demand ("load more")
+            courseSeries: { series: "top_enrollment", items: [], next: false, loadingMore: false },
+            refreshedAt: false,
+            exportDataset: "course_progress",
+            // Date range / published filters; tags and departments can be preset by the action context
+            filters: { ...(this.props.action?.context?.dashboard_filters || {}) },
         });
 
         onWillStart(() => this.fetchKPIs());
 
         onMounted(() => {
-            this._interval = setInterval(() => this.fetchKPIs(), 60000);
+            this.setupLiveUpdates();
             // Wait for Chart.js to load before rendering charts
             this.waitForChartJS().then(() => {
                 this.renderCharts();
             });
+            this.observeSections();
             this.updateClock();
             this._clockInterval = setInterval(() => this.updateClock(), 1000);
         });
 
         onWillUnmount(() => {
-            if (this._interval) clearInterval(this._interval);
+            this.stopPolling();
+            this.teardownLiveUpdates();
             if (this._clockInterval) clearInterval(this._clockInterval);
+            if (this._observer) this._observer.disconnect();
             if (this.CourseProgressChartInstance) this.CourseProgressChartInstance.destroy();
             if (this.enrollmentsChartInstance) this.enrollmentsChartInstance.destroy();
             if (this.attendanceChartInstance) this.attendanceChartInstance.destroy();
@@ -103,21 +131,184 @@ class ELearningDashboard extends Component {
     }
 
     async fetchKPIs() {
+        await this.fetchSections(ALL_SECTIONS);
+    }
+
+    // Only sections on screen are polled; the others are fetched when they scroll into view
+    observeSections() {
+        if (typeof IntersectionObserver === 'undefined' || !this.rootRef.el) return;
+
+        // A section may be shown by several elements (the KPI strip and the summary)
+        const visibleElements = new Set();
+        this._observer = new IntersectionObserver((entries) => {
+            for (const entry of entries) {
+                if (entry.isIntersecting) {
+                    visibleElements.add(entry.target);
+                } else {
+                    visibleElements.delete(entry.target);
+                }
+            }
+            const visible = new Set([...visibleElements].map((el) => el.dataset.section));
+            const appeared = [...visible].filter((section) => !this.visibleSections.has(section));
+            this.visibleSections = visible;
+            if (appeared.length) this.fetchSections(appeared);
+        });
+        for (const el of this.rootRef.el.querySelectorAll("[data-section]")) {
+            this._observer.observe(el);
+        }
+    }
+
+    setupLiveUpdates() {
+        const bus = this.busService;
+        if (!bus) {
+            this.startPolling();
+            return;
+        }
+        bus.addChannel(this.busChannel);
+        bus.subscribe("elearning_dashboard/update", this.onDashboardUpdate);
+        bus.addEventListener("connect", this.onBusConnect);
+        bus.addEventListener("reconnect", this.onBusConnect);
+        bus.addEventListener("disconnect", this.onBusDisconnect);
+        if (!bus.isActive) this.startPolling();
+    }
+
+    teardownLiveUpdates() {
+        const bus = this.busService;
+        if (!bus) return;
+        bus.unsubscribe("elearning_dashboard/update", this.onDashboardUpdate);
+        bus.removeEventListener("connect", this.onBusConnect);
+        bus.removeEventListener("reconnect", this.onBusConnect);
+        bus.removeEventListener("disconnect", this.onBusDisconnect);
+        bus.deleteChannel(this.busChannel);
+    }
+
+    startPolling() {
+        if (this._interval) return;
+        this._interval = setInterval(() => this.fetchSections([...this.visibleSections]), 60000);
+    }
+
+    stopPolling() {
+        if (this._interval) clearInterval(this._interval);
+        this._interval = null;
+    }
+
+    onBusConnect = () => {
+        this.stopPolling();
+        // Catch up on anything pushed while we were disconnected
+        this.fetchSections([...this.visibleSections]);
+    }
+
+    onBusDisconnect = () => {
+        this.startPolling();
+    }
+
+    hasFilters() {
+        return Object.values(this.state.filters).some((value) =>
+            Array.isArray(value) ? value.length : value !== undefined && value !== null && value !== ""
+        );
+    }
+
+    setFilter = (name, value) => {
+        if (name === "published") {
+            value = value === "" ? undefined : value === "1";
+        }
+        this.state.filters[name] = value || value === false ? value : undefined;
+        // Versions are only meaningful for the filters they were computed with
+        this.sectionVersions = {};
+        this.fetchKPIs();
+        if (this.state.courseSeries.series !== "top_enrollment") {
+            this.setCourseSeries(this.state.courseSeries.series);
+        }
+    }
+
+    // Streaming CSV/XLSX export of the selected dataset, with the current filters
+    exportUrl(format) {
+        const params = new URLSearchParams({ format });
+        for (const [name, value] of Object.entries(this.state.filters)) {
+            if (value === undefined || value === null || value === "") continue;
+            if (Array.isArray(value)) {
+                params.set(name, value.join(","));
+            } else if (typeof value === "boolean") {
+                params.set(name, value ? "1" : "0");
+            } else {
+                params.set(name, value);
+            }
+        }
+        return `/training/dashboard/export/${this.state.exportDataset}?${params}`;
+    }
+
+    setCourseSeries = async (series) => {
+        const page = await this.fetchCourseSeries(series);
+        Object.assign(this.state.courseSeries, { series, items: page.items, next: page.next });
+        this.renderCourseProgressChart();
+    }
+
+    loadMoreCourses = async () => {
+        const courseSeries = this.state.courseSeries;
+        if (!courseSeries.next || courseSeries.loadingMore) return;
+        courseSeries.loadingMore = true;
+        try {
+            const page = await this.fetchCourseSeries(courseSeries.series, courseSeries.next);
+            courseSeries.items = [...courseSeries.items, ...page.items];
+            courseSeries.next = page.next;
+        } finally {
+            courseSeries.loadingMore = false;
+        }
+        this.renderCourseProgressChart();
+    }
+
+    fetchCourseSeries(series, after = false) {
+        return this.orm.call(
+            "elearning.dashboard.service",
+            "get_course_series",
+            [series],
+            { after, filters: this.state.filters }
+        );
+    }
+
+    // Section updates only replace the course series while it shows the default first page
+    isDefaultCourseSeries() {
+        const { series, items } = this.state.courseSeries;
+        const first = this.state.chartData.CourseProgressChart;
+        return series === "top_enrollment" && (!first || items.length <= first.items.length);
+    }
+
+    onDashboardUpdate = (payload) => {
+        // Pushed sections are unfiltered; a filtered dashboard just rechecks what it shows
+        if (this.hasFilters()) {
+            this.fetchSections([...this.visibleSections]);
+            return;
+        }
+        const sections = {};
+        const outdated = [];
+        for (const [name, section] of Object.entries(payload.sections || {})) {
+            // KPI updates are deltas against a given version; refetch if we hold another one
+            if (section.previousVersion && section.previousVersion !== this.sectionVersions[name]) {
+                outdated.push(name);
+            } else {
+                sections[name] = section;
+            }
+        }
+        this.applySections(sections);
+        if (outdated.length) this.fetchSections(outdated);
+    }
+
+    async fetchSections(names) {
+        if (!names.length) return;
+        const versions = {};
+        for (const name of names) {
+            versions[name] = this.sectionVersions[name] || false;
+        }
         try {
-            this.state.loading = true;
             const result = await this.orm.call(
                 "elearning.dashboard.service",
-                "get_dashboard_data",
-                [],
-                {}
+                "get_dashboard_sections",
+                [versions],
+                { filters: this.state.filters }
             );
-            this.state.kpis = Object.assign(this.state.kpis, result.kpis || {});
-            this.state.chartData = result.chartData || {};
-
-            await this.waitForChartJS();
-            setTimeout(() => {
-                this.renderCharts();
-            }, 100);
+            // Per-computation timings, only sent in debug mode: visible in the RPC response
+            const { __debug__: _measurements, ...sections } = result;
+            await this.applySections(sections);
         } catch (e) {
             console.warn("eLearning Dashboard fetch failed", e);
         } finally {
@@ -125,6 +316,42 @@ class ELearningDashboard extends Component {
         }
     }
 
+    async applySections(sections) {
+        const changedCharts = [];
+        for (const [name, section] of Object.entries(sections)) {
+            this.sectionVersions[name] = section.version;
+            if (section.notModified) continue;
+
+            this.sectionRefreshedAt[name] = section.refreshedAt;
+            if (name === "kpis") {
+                this.state.kpis = Object.assign(this.state.kpis, section.data || {});
+            } else {
+                const showsSection = name !== "CourseProgressChart" || this.isDefaultCourseSeries();
+                this.state.chartData[name] = section.data;
+                if (!showsSection) continue;
+                if (name === "CourseProgressChart") {
+                    const { series, items, next } = section.data;
+                    Object.assign(this.state.courseSeries, { series, items, next });
+                }
+                changedCharts.push(name);
+            }
+        }
+        this.updateRefreshedAt();
+
+        // Initial load renders every chart once mounted; afterwards only changed charts are redrawn
+        if (changedCharts.length && !this.state.loading) {
+            await this.waitForChartJS();
+            for (const name of changedCharts) {
+                this[CHART_RENDERERS[name]]();
+            }
+        }
+    }
+
+    updateRefreshedAt() {
+        const dates = Object.values(this.sectionRefreshedAt).filter(Boolean).sort();
+        this.state.refreshedAt = dates.length ? formatDateTime(deserializeDateTime(dates[0])) : false;
+    }
+
     openModel = (model) => {
         this.actionService.doAction({
             type: "ir.actions.act_window",
@@ -156,7 +383,7 @@ class ELearningDashboard extends Component {
         if (!canvas || typeof Chart === 'undefined' || !this.state.chartData.CourseProgressChart) return;
 
         const ctx = canvas.getContext('2d');
-        const data = this.state.chartData.CourseProgressChart;
+        const data = this.state.courseSeries.items;
 
         if (this.CourseProgressChartInstance) {
             this.CourseProgressChartInstance.destroy();
@@ -0,0 +1,135 @@
+/** @odoo-module **/
+
+import { _t } from "@web/core/l10n/translation";
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
+import { formatDate, deserializeDate } from "@web/core/l10n/dates";
+import { Component, onWillStart, useExternalListener, useState } from "@odoo/owl";
+
+class ProofReview extends Component {
+    static template = "training_modification.ProofReview";
+    static props = {
+        action: { type: Object, optional: true },
+        actionId: { type: Number, optional: true },
+        updateActionState: { type: Function, optional: true },
+        className: { type: String, optional: true },
+        "*": true,
+    };
+
+    setup() {
+        this.orm = useService("orm");
+        this.notification = useService("notification");
+        this.state = useState({
+            loading: true,
+            proofs: [],
+            next: false,
+            // Index of the proof the keyboard acts on
+            cursor: 0,
+            selected: new Set(),
+            preview: false,
+        });
+        useExternalListener(window, "keydown", this.onKeydown);
+        onWillStart(() => this.load());
+    }
+
+    get current() {
+        return this.state.proofs[this.state.cursor];
+    }
+
+    toProof(proof) {
+        return { ...proof, trainingDateLabel: formatDate(deserializeDate(proof.trainingDate)) };
+    }
+
+    async load() {
+        this.state.loading = true;
+        try {
+            const page = await this.orm.call("attendance.proof", "get_review_queue", [], {});
+            this.state.proofs = page.proofs.map((proof) => this.toProof(proof));
+            this.state.next = page.next;
+            this.state.cursor = 0;
+            this.state.selected.clear();
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    loadMore = async () => {
+        if (!this.state.next) return;
+        const page = await this.orm.call("attendance.proof", "get_review_queue", [], { after: this.state.next });
+        this.state.proofs.push(...page.proofs.map((proof) => this.toProof(proof)));
+        this.state.next = page.next;
+    }
+
+    // Approve or reject the selected proofs, or the current one; reviewed proofs leave the queue
+    async review(status) {
+        const ids = this.state.selected.size ? [...this.state.selected] : this.current ? [this.current.id] : [];
+        if (!ids.length) return;
+        await this.orm.call("attendance.proof", "action_set_status", [ids, status]);
+        const reviewed = new Set(ids);
+        this.state.proofs = this.state.proofs.filter((proof) => !reviewed.has(proof.id));
+        this.state.selected.clear();
+        this.state.cursor = Math.min(this.state.cursor, Math.max(this.state.proofs.length - 1, 0));
+        const message = status === "approved"
+            ? _t("%(count)s proof(s) approved.", { count: ids.length })
+            : _t("%(count)s proof(s) rejected.", { count: ids.length });
+        this.notification.add(message, { type: "success" });
+        if (this.state.proofs.length < 10 && this.state.next) {
+            await this.loadMore();
+        }
+    }
+
+    approve = () => this.review("approved");
+    reject = () => this.review("rejected");
+
+    toggleSelect = (proof) => {
+        if (this.state.selected.has(proof.id)) {
+            this.state.selected.delete(proof.id);
+        } else {
+            this.state.selected.add(proof.id);
+        }
+    }
+
+    selectAll = () => {
+        for (const proof of this.state.proofs) {
+            this.state.selected.add(proof.id);
+        }
+    }
+
+    focus = (index) => {
+        this.state.cursor = index;
+    }
+
+    move(offset) {
+        const last = this.state.proofs.length - 1;
+        this.state.cursor = Math.max(0, Math.min(last, this.state.cursor + offset));
+        if (this.state.cursor === last) {
+            this.loadMore();
+        }
+    }
+
+    onKeydown(ev) {
+        if (ev.target.closest("input, textarea, select, [contenteditable]") || ev.ctrlKey || ev.metaKey || ev.altKey) {
+            return;
+        }
+        const actions = {
+            j: () => this.move(1),
+            arrowdown: () => this.move(1),
+            arrowright: () => this.move(1),
+            k: () => this.move(-1),
+            arrowup: () => this.move(-1),
+            arrowleft: () => this.move(-1),
+            a: () => this.approve(),
+            r: () => this.reject(),
+            x: () => this.current && this.toggleSelect(this.current),
+            " ": () => (this.state.preview = this.state.preview ? false : this.current?.imageUrl || false),
+            escape: () => (this.state.preview = false),
+        };
+        const action = actions[ev.key.toLowerCase()];
+        if (action) {
+            ev.preventDefault();
+            action();
+        }
+    }
+}
+
+registry.category("actions").add("training_modification.proof_review", ProofReview);
@@ -0,0 +1,11 @@
+from . import test_dashboard_benchmark
+from . import test_query_plans
+from . import test_mailing_attendees
+from . import test_attendance_proof
+from . import test_session_attendance
+from . import test_checkin
+from . import test_dashboard_snapshot
+from . import test_dashboard_bus
+from . import test_attendance_archive
+from . import test_attendance_register
+from . import test_dashboard_export
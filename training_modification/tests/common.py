@@ -0,0 +1,140 @@
+import random
+from datetime import timedelta
+
+from psycopg2.extras import execute_values
+
+from odoo import fields
+from odoo.tests import TransactionCase
+
+
+class TrainingDataCommon(TransactionCase):
+    """Synthetic training datasets for benchmarks and query-plan tests.
+
+    Courses and partners go through the ORM; the high-volume tables
+    (enrollments, sessions, attendance, proofs) are bulk inserted in SQL so
+    that datasets of ~100k enrollments can be built in seconds.
+    """
+
+    @classmethod
+    def _generate_dataset(cls, courses=50, partners=1000, enrollments=5000, sessions_per_course=8,
+                          proof_ratio=0.1, seed=42):
+        rng = random.Random(seed)
+        env = cls.env
+        today = fields.Date.today()
+
+        tag_group = env['slide.channel.tag.group'].create({'name': 'Benchmark Tags'})
+        tags = env['slide.channel.tag'].create([
+            {'name': f'Benchmark Tag {index}', 'group_id': tag_group.id}
+            for index in range(5)
+        ])
+        cls.channels = env['slide.channel'].create([{
+            'name': f'Benchmark Course {index}',
+            'is_published': index % 4 != 0,
+            'tag_ids': [(6, 0, rng.sample(tags.ids, 2))],
+        } for index in range(courses)])
+        cls.partners = env['res.partner'].create([
+            {'name': f'Benchmark Attendee {index}', 'email': f'attendee{index}@example.com'}
+            for index in range(partners)
+        ])
+
+        # Enrollments: unique (course, partner) pairs with a spread of progress
+        pairs = set()
+        enrollments = min(enrollments, courses * partners)
+        while len(pairs) < enrollments:
+            pairs.add((rng.choice(cls.channels.ids), rng.choice(cls.partners.ids)))
+        enrollment_rows = []
+        for channel_id, partner_id in sorted(pairs):
+            completion = rng.choice([0, 0, 25, 50, 75, 100])
+            row = {
+                'channel_id': channel_id,
+                'partner_id': partner_id,
+                'completion': completion,
+                'create_date': fields.Datetime.now() - timedelta(days=rng.randrange(365)),
+            }
+            if 'member_status' in env['slide.channel.partner']._fields:
+                row['member_status'] = 'completed' if completion == 100 else 'ongoing' if completion else 'joined'
+            enrollment_rows.append(row)
+        cls._bulk_insert('slide.channel.partner', enrollment_rows)
+
+        # Training sessions, spread over the last year for every course
+        session_rows = []
+        for channel_id in cls.channels.ids:
+            offsets = rng.sample(range(365), min(sessions_per_course, 365))
+            for offset in offsets:
+                session_rows.append({
+                    'course_id': channel_id,
+                    'training_date': today - timedelta(days=offset),
+                    'start_time': 9.0,
+                    'end_time': 17.0,
+                    'duration': 8.0,
+                })
+        cls._bulk_insert('training.calendar', session_rows)
+
+        # One attendance row per enrollment and session of its course
+        env.cr.execute("SELECT setseed(%s)", [rng.random() * 2 - 1])
+        env.cr.execute("""
+            INSERT INTO slide_attendance (name, channel_id, session_id, date, present,
+                                          create_uid, create_date, write_uid, write_date)
+                 SELECT scp.id, scp.channel_id, tc.id, tc.training_date, random() < 0.8,
+                        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+                   FROM slide_channel_partner scp
+                   JOIN training_calendar tc ON tc.course_id = scp.channel_id
+                  WHERE scp.channel_id IN %(channels)s
+        """, {'uid': env.uid, 'channels': tuple(cls.channels.ids)})
+
+        # Proofs for a share of the attended sessions (no image payload)
+        env.cr.execute("""
+            INSERT INTO attendance_proof (partner_id, course_id, training_date, training_schedule_id, status,
+                                          upload_date, create_uid, create_date, write_uid, write_date)
+                 SELECT scp.partner_id, sa.channel_id, sa.date, tc.id, 'pending',
+                        NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+                   FROM slide_attendance sa
+                   JOIN slide_channel_partner scp ON scp.id = sa.name
+                   JOIN training_calendar tc ON tc.course_id = sa.channel_id AND tc.training_date = sa.date
+                  WHERE sa.channel_id IN %(channels)s AND sa.present AND random() < %(ratio)s
+        """, {'uid': env.uid, 'channels': tuple(cls.channels.ids), 'ratio': proof_ratio})
+
+        env.cr.execute("ANALYZE slide_channel_partner, slide_attendance, attendance_proof, training_calendar")
+        env.invalidate_all()
+
+        return {
+            'courses': courses,
+            'partners': partners,
+            'enrollments': len(enrollment_rows),
+            'sessions': len(session_rows),
+            'attendance': env['slide.attendance'].search_count([('channel_id', 'in', cls.channels.ids)]),
+            'proofs': env['attendance.proof'].search_count([('course_id', 'in', cls.channels.ids)]),
+        }
+
+    @classmethod
+    def _bulk_insert(cls, model_name, rows, page_size=5000):
+        """Insert ``rows`` (dicts of column values) bypassing the ORM.
+
+        Required columns missing from the rows are filled with the model
+        defaults, and the usual log columns are set.
+        """
+        if not rows:
+            return
+        model = cls.env[model_name]
+        now = fields.Datetime.now()
+        log_values = {'create_uid': cls.env.uid, 'create_date': now, 'write_uid': cls.env.uid, 'write_date': now}
+
+        columns = list(rows[0])
+        missing_required = [
+            name for name, field in model._fields.items()
+            if field.required and field.store and field.column_type and name not in columns and name not in log_values
+        ]
+        defaults = model.default_get(missing_required)
+        extra = {name: defaults[name] for name in missing_required if name in defaults}
+        extra.update({name: value for name, value in log_values.items() if name not in columns})
+
+        all_columns = columns + list(extra)
+        values = [tuple(row[column] for column in columns) + tuple(extra.values()) for row in rows]
+        column_list = ", ".join(f'"{column}"' for column in all_columns)
+        execute_values(
+            cls.env.cr._obj,
+            f'INSERT INTO "{model._table}" ({column_list}) VALUES %s',
+            values,
+            page_size=page_size,
+        )
+        model.invalidate_model()
@@ -0,0 +1,103 @@
+from dateutil.relativedelta import relativedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import SQL
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceArchive(TransactionCase):
+    """Old detailed attendance rolled into slide.attendance.summary."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Summary = cls.env['slide.attendance.summary']
+        cls.course = cls.env['slide.channel'].create({'name': 'Archive Course'})
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Archive Attendee {index}'} for index in range(2)
+        ])
+        cls.members = cls.env['slide.channel.partner'].create([
+            {'channel_id': cls.course.id, 'partner_id': partner.id} for partner in cls.partners
+        ])
+        cutoff = Summary._get_archive_cutoff()
+        cls.first_month = cutoff - relativedelta(months=2)
+        cls.second_month = cutoff - relativedelta(months=1)
+        cls.recent_date = fields.Date.today()
+        cls.old_rows = cls.env['slide.attendance'].create([
+            {'name': cls.members[0].id, 'channel_id': cls.course.id, 'date': cls.first_month.replace(day=3), 'present': True},
+            {'name': cls.members[0].id, 'channel_id': cls.course.id, 'date': cls.first_month.replace(day=10), 'present': False},
+            {'name': cls.members[0].id, 'channel_id': cls.course.id, 'date': cls.second_month.replace(day=5), 'present': True},
+            {'name': cls.members[1].id, 'channel_id': cls.course.id, 'date': cls.first_month.replace(day=3), 'present': True},
+        ])
+        cls.recent_row = cls.env['slide.attendance'].create({
+            'name': cls.members[0].id, 'channel_id': cls.course.id, 'date': cls.recent_date, 'present': True,
+        })
+
+    def _archive(self):
+        # Month by month as the cron does, whatever other old attendance the database holds
+        Summary = self.env['slide.attendance.summary']
+        for month in (self.first_month, self.second_month):
+            Summary._archive_month(month)
+        self.env.invalidate_all()
+
+    def _get_summary(self):
+        """{(partner, month): (total, present)} of the course"""
+        summaries = self.env['slide.attendance.summary'].search([('channel_id', '=', self.course.id)])
+        return {(summary.partner_id, summary.month): (summary.total_count, summary.present_count) for summary in summaries}
+
+    def _get_dashboard_totals(self):
+        """(sessions, presences) of the course as counted by the dashboard"""
+        self.env.flush_all()
+        history = self.env['elearning.dashboard.service']._get_attendance_history_sql(
+            {}, date_from=self.first_month, date_to=self.recent_date + relativedelta(days=1))
+        self.env.cr.execute(SQL(
+            "SELECT SUM(history.total), SUM(history.present) FROM (%s) history WHERE history.channel_id = %s",
+            history, self.course.id,
+        ))
+        return self.env.cr.fetchone()
+
+    def test_archive_rollup(self):
+        totals = self._get_dashboard_totals()
+        self.assertEqual(totals, (5, 4))
+
+        self._archive()
+        self.assertFalse(self.old_rows.exists())
+        self.assertTrue(self.recent_row.exists())
+        # Archiving keeps the enrollments
+        self.assertEqual(self.members.exists(), self.members)
+        self.assertEqual(self._get_summary(), {
+            (self.partners[0], self.first_month): (2, 1),
+            (self.partners[0], self.second_month): (1, 1),
+            (self.partners[1], self.first_month): (1, 1),
+        })
+        self.assertEqual(self._get_dashboard_totals(), totals)
+
+    def test_archive_rerun(self):
+        self._archive()
+        summary = self._get_summary()
+        self._archive()
+        self.assertEqual(self._get_summary(), summary)
+        self.assertTrue(self.recent_row.exists())
+
+        # Late rows of an archived month are added to its summary
+        self.env['slide.attendance'].create({
+            'name': self.members[1].id, 'channel_id': self.course.id,
+            'date': self.first_month.replace(day=20), 'present': False,
+        })
+        self._archive()
+        self.assertEqual(self._get_summary()[self.partners[1], self.first_month], (2, 1))
+        self.assertEqual(self._get_dashboard_totals(), (6, 4))
+
+    def test_unlink_keeps_members_with_archived_attendance(self):
+        self._archive()
+        # Their only detailed row goes, their archived attendance stays
+        self.recent_row.unlink()
+        self.assertTrue(self.members[0].exists())
+
+        row = self.env['slide.attendance'].create({
+            'name': self.members[1].id, 'channel_id': self.course.id, 'date': self.recent_date,
+        })
+        self.env['slide.attendance.summary'].search([('partner_id', '=', self.partners[1].id)]).unlink()
+        row.unlink()
+        self.assertFalse(self.members[1].exists())
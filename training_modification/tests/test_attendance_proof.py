@@ -0,0 +1,215 @@
+import base64
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from odoo import fields
+from odoo.exceptions import AccessError, UserError
+from odoo.tests import TransactionCase, new_test_user, tagged
+
+from ..models.attendance_proof_job import PROOF_JOB_MAX_ATTEMPTS
+from ..models.slide_channel import PROOF_IMAGE_MAX_SIZE_PARAM, PROOF_THUMBNAIL_SIZE
+
+EXIF_MAKE = 0x010F
+
+
+def _png(color):
+    output = io.BytesIO()
+    Image.new('RGB', (8, 8), color).save(output, 'PNG')
+    return output.getvalue()
+
+
+def _photo(image_format, size=(8, 8), color='red'):
+    """An image carrying EXIF metadata (the camera make)"""
+    exif = Image.Exif()
+    exif[EXIF_MAKE] = 'Training Camera'
+    output = io.BytesIO()
+    Image.new('RGB', size, color).save(output, image_format, exif=exif)
+    return output.getvalue()
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceProof(TransactionCase):
+    """Proof uploads and their review."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.course = cls.env['slide.channel'].create({'name': 'Proof Course'})
+        cls.partner = cls.env['res.partner'].create({'name': 'Proof Attendee', 'email': 'proof.attendee@example.com'})
+        cls.env['slide.channel.partner'].create({'channel_id': cls.course.id, 'partner_id': cls.partner.id})
+        today = fields.Date.today()
+        cls.dates = [today - timedelta(days=offset) for offset in (3, 2, 1)]
+        cls.officer = new_test_user(cls.env, 'proof_officer', groups='base.group_user,website_slides.group_website_slides_officer')
+        cls.employee = new_test_user(cls.env, 'proof_employee', groups='base.group_user')
+
+    def _create_proofs(self):
+        """One pending proof per date, each with the (absent) attendance of its session"""
+        self.env['training.calendar'].create([
+            {'course_id': self.course.id, 'training_date': training_date} for training_date in self.dates
+        ])
+        return self.env['attendance.proof'].create([{
+            'partner_id': self.partner.id,
+            'course_id': self.course.id,
+            'training_date': training_date,
+            'proof_image': base64.b64encode(_png('green')),
+        } for training_date in self.dates])
+
+    def _get_presence(self):
+        """Presence of the partner per date, read from the table"""
+        self.env.flush_all()
+        self.env.cr.execute("""
+            SELECT sa.date, sa.present
+              FROM slide_attendance sa
+              JOIN slide_channel_partner scp ON scp.id = sa.name
+             WHERE sa.channel_id = %s AND scp.partner_id = %s
+        """, [self.course.id, self.partner.id])
+        return dict(self.env.cr.fetchall())
+
+    def _upload(self, content, training_date, filename='proof.png'):
+        upload = FileStorage(stream=io.BytesIO(content), filename=filename, content_type='image/png')
+        return self.env['attendance.proof']._create_from_uploads({
+            'partner_id': self.partner.id,
+            'course_id': self.course.id,
+            'training_date': training_date,
+        }, [upload])
+
+    def _get_attachment(self, proof):
+        return self.env['ir.attachment'].search([
+            ('res_model', '=', 'attendance.proof'), ('res_field', '=', 'proof_image'), ('res_id', '=', proof.id),
+        ])
+
+    def test_upload_same_content_twice(self):
+        content = _png('red')
+        first = self._upload(content, self.dates[0])
+        second = self._upload(content, self.dates[1], filename='copy.png')
+
+        self.assertEqual(first.content_hash, second.content_hash)
+        self.assertEqual(self._get_attachment(first).raw, content)
+        self.assertEqual(self._get_attachment(second).raw, content)
+        if self.env['ir.attachment']._storage() == 'file':
+            # The copies share one stored file
+            self.assertEqual(self._get_attachment(first).store_fname, self._get_attachment(second).store_fname)
+
+        other = self._upload(_png('blue'), self.dates[2])
+        self.assertNotEqual(other.content_hash, first.content_hash)
+
+    def test_upload_size_limit(self):
+        self.env['ir.config_parameter'].sudo().set_param('training_modification.proof_max_file_size', 0)
+        with self.assertRaises(UserError):
+            self._upload(_png('red'), self.dates[0])
+        self.assertFalse(self.env['attendance.proof'].search([('partner_id', '=', self.partner.id)]))
+
+    def test_set_status_bulk(self):
+        proofs = self._create_proofs().with_user(self.officer)
+        self.assertEqual(self._get_presence(), dict.fromkeys(self.dates, False))
+
+        self.assertEqual(proofs[:2].action_set_status('approved'), 2)
+        self.assertEqual(proofs.mapped('status'), ['approved', 'approved', 'pending'])
+        self.assertEqual(self._get_presence(), {self.dates[0]: True, self.dates[1]: True, self.dates[2]: False})
+
+        # Only the proofs whose status changes are counted
+        self.assertEqual(proofs.action_set_status('approved'), 1)
+        self.assertEqual(self._get_presence(), dict.fromkeys(self.dates, True))
+
+        self.assertEqual(proofs[1:].action_set_status('rejected'), 2)
+        self.assertEqual(proofs.mapped('status'), ['approved', 'rejected', 'rejected'])
+        self.assertEqual(self._get_presence(), {self.dates[0]: True, self.dates[1]: False, self.dates[2]: False})
+
+        # Back to pending: the attendance is left as it is
+        self.assertEqual(proofs[0].action_set_status('pending'), 1)
+        self.assertEqual(self._get_presence()[self.dates[0]], True)
+
+        with self.assertRaises(ValueError):
+            proofs.action_set_status('done')
+
+    def test_status_write_syncs_presence(self):
+        proofs = self._create_proofs()
+        proofs[0].with_user(self.officer).write({'status': 'approved'})
+        self.assertEqual(self._get_presence(), {self.dates[0]: True, self.dates[1]: False, self.dates[2]: False})
+        proofs[0].with_user(self.officer).write({'status': 'rejected'})
+        self.assertEqual(self._get_presence(), dict.fromkeys(self.dates, False))
+
+    def test_review_rights(self):
+        proofs = self._create_proofs().with_user(self.employee)
+        with self.assertRaises(AccessError):
+            proofs.write({'status': 'approved'})
+        with self.assertRaises(AccessError):
+            proofs.action_set_status('approved')
+        with self.assertRaises(AccessError):
+            proofs.get_review_queue()
+
+        # Nor can they create reviewed proofs
+        reviewed_vals = {
+            'partner_id': self.partner.id,
+            'course_id': self.course.id,
+            'training_date': self.dates[0] - timedelta(days=1),
+            'status': 'approved',
+        }
+        with self.assertRaises(AccessError):
+            self.env['attendance.proof'].with_user(self.employee).create(reviewed_vals)
+        self.assertEqual(
+            self.env['attendance.proof'].with_user(self.employee).create(dict(reviewed_vals, status='pending')).status,
+            'pending')
+
+        # Other fields stay writable, and trusted code may set the status
+        proofs[0].write({'notes': 'Signed by the trainer'})
+        proofs[0].sudo().write({'status': 'approved'})
+        self.assertEqual(proofs[0].status, 'approved')
+        self.assertEqual(proofs[1:].mapped('status'), ['pending', 'pending'])
+        self.assertTrue(self._get_presence()[self.dates[0]])
+
+    def _process(self):
+        self.env['attendance.proof.job']._cron_process_jobs()
+        self.env.invalidate_all()
+
+    def _open(self, data):
+        return Image.open(io.BytesIO(data))
+
+    def test_process_resizes(self):
+        self.env['ir.config_parameter'].sudo().set_param(PROOF_IMAGE_MAX_SIZE_PARAM, 300)
+        proof = self._upload(_photo('PNG', size=(600, 300)), self.dates[0])
+        self.assertFalse(proof.proof_thumbnail)
+        self._process()
+
+        image = self._open(self._get_attachment(proof).raw)
+        self.assertEqual((image.format, image.size), ('PNG', (300, 150)))
+        thumbnail = self._open(base64.b64decode(proof.proof_thumbnail))
+        self.assertLessEqual(max(thumbnail.size), PROOF_THUMBNAIL_SIZE)
+        self.assertFalse(self.env['attendance.proof.job'].search([('proof_id', '=', proof.id)]))
+
+    def test_process_strips_metadata(self):
+        for training_date, image_format in zip(self.dates, ('JPEG', 'PNG', 'WEBP')):
+            content = _photo(image_format)
+            self.assertEqual(self._open(content).getexif()[EXIF_MAKE], 'Training Camera')
+            proof = self._upload(content, training_date, filename=f'proof.{image_format.lower()}')
+            self._process()
+            image = self._open(self._get_attachment(proof).raw)
+            # Small images are not resized: they are re-encoded all the same
+            self.assertEqual((image.format, image.size), (image_format, (8, 8)))
+            self.assertNotIn(EXIF_MAKE, image.getexif(), image_format)
+            self.assertTrue(proof.proof_thumbnail)
+
+    def test_job_retry_and_failure(self):
+        proof = self._upload(_png('red'), self.dates[0])
+        job = self.env['attendance.proof.job'].search([('proof_id', '=', proof.id)])
+        self.assertEqual((job.state, job.attempts), ('pending', 0))
+
+        with patch.object(self.registry['attendance.proof'], '_process_image', side_effect=ValueError("Broken image")):
+            for attempt in range(1, PROOF_JOB_MAX_ATTEMPTS + 1):
+                self._process()
+                expected_state = 'failed' if attempt == PROOF_JOB_MAX_ATTEMPTS else 'pending'
+                self.assertEqual((job.state, job.attempts, job.error), (expected_state, attempt, "Broken image"))
+            # Failed jobs are not retried
+            self._process()
+            self.assertEqual(job.attempts, PROOF_JOB_MAX_ATTEMPTS)
+        self.assertFalse(proof.proof_thumbnail)
+
+        # Queued again, the proof gets a new job, which succeeds; the failed one stays for review
+        self.env['attendance.proof.job']._enqueue(proof)
+        self._process()
+        self.assertTrue(proof.proof_thumbnail)
+        self.assertEqual(self.env['attendance.proof.job'].search([('proof_id', '=', proof.id)]), job)
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceRegister(TransactionCase):
+    """Pages of the members x sessions attendance register of a course."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        today = fields.Date.today()
+        cls.course = cls.env['slide.channel'].create({'name': 'Register Course'})
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Register Attendee {index}'} for index in range(5)
+        ])
+        cls.members = cls.env['slide.channel.partner'].create([
+            {'channel_id': cls.course.id, 'partner_id': partner.id} for partner in cls.partners
+        ])
+        cls.dates = [today + timedelta(days=offset) for offset in (-40, -30, -20, -10, 10)]
+        cls.sessions = cls.env['training.calendar'].create([
+            {'course_id': cls.course.id, 'training_date': training_date} for training_date in cls.dates
+        ])
+
+    def _get_register(self, **kwargs):
+        return self.course.get_attendance_register(**kwargs)
+
+    def test_member_paging(self):
+        self.members[2].write({'active': False})
+        pages = []
+        after = None
+        while True:
+            register = self._get_register(after=after, member_limit=2)
+            pages.append([member['id'] for member in register['members']])
+            after = register['next']
+            if not after:
+                break
+        # Ordered by name, each active member exactly once
+        self.assertEqual(pages, [
+            [self.members[0].id, self.members[1].id],
+            [self.members[3].id, self.members[4].id],
+        ])
+        self.assertEqual(register['members'][-1]['partnerId'], self.partners[4].id)
+
+    def test_session_window(self):
+        date_string = fields.Date.to_string
+        # Up to today by default: the last sessions before the upcoming one
+        register = self._get_register(session_limit=2)
+        self.assertEqual([session['date'] for session in register['sessions']], [date_string(self.dates[2]), date_string(self.dates[3])])
+        self.assertEqual((register['older'], register['newer']), (date_string(self.dates[1]), date_string(self.dates[4])))
+
+        # Older sessions, up to the date given by the previous window
+        register = self._get_register(session_limit=2, date_to=register['older'])
+        self.assertEqual([session['id'] for session in register['sessions']], self.sessions[:2].ids)
+        self.assertEqual((register['older'], register['newer']), (False, date_string(self.dates[2])))
+
+        # Newer sessions, from the given date
+        register = self._get_register(session_limit=2, date_from=date_string(self.dates[3]))
+        self.assertEqual([session['id'] for session in register['sessions']], self.sessions[3:].ids)
+        self.assertEqual((register['older'], register['newer']), (date_string(self.dates[2]), False))
+
+    def test_bitsets(self):
+        Attendance = self.env['slide.attendance']
+        Attendance.mark_attendance(self.course.id, self.dates[3], self.partners[:1].ids)
+        Attendance.mark_attendance(self.course.id, self.dates[2], self.partners[1:2].ids)
+        Attendance.mark_attendance(self.course.id, self.dates[3], self.partners[1:2].ids)
+        Attendance.search([('name', '=', self.members[2].id), ('session_id', '=', self.sessions[2].id)]).unlink()
+
+        # Window of the sessions 2 and 3: bit 0 for session 2, bit 1 for session 3
+        register = self._get_register(session_limit=2, member_limit=3)
+        bitsets = {member['id']: (member['present'], member['recorded']) for member in register['members']}
+        self.assertEqual(bitsets, {
+            self.members[0].id: ('2', '3'),
+            self.members[1].id: ('3', '3'),
+            self.members[2].id: ('0', '2'),
+        })
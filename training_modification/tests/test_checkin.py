@@ -0,0 +1,119 @@
+import base64
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestCheckin(TransactionCase):
+    """Session check-in tokens and the attendance they record."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        today = fields.Date.today()
+        cls.course = cls.env['slide.channel'].create({'name': 'Check-in Course'})
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Check-in Attendee {index}', 'email': f'checkin.attendee{index}@example.com'}
+            for index in range(3)
+        ])
+        cls.members = cls.env['slide.channel.partner'].create([
+            {'channel_id': cls.course.id, 'partner_id': partner.id} for partner in cls.partners[:2]
+        ])
+        cls.outsider = cls.partners[2]
+        cls.session, cls.other_session = cls.env['training.calendar'].create([
+            {'course_id': cls.course.id, 'training_date': today},
+            {'course_id': cls.course.id, 'training_date': today + timedelta(days=1)},
+        ])
+
+    def _verify(self, token):
+        return self.env['training.calendar']._verify_checkin_token(token)
+
+    def _get_presence(self, date):
+        """{partner: (present, session id)} of the course's attendance on ``date``, read from the table"""
+        self.env.flush_all()
+        self.env.cr.execute("""
+            SELECT scp.partner_id, sa.present, sa.session_id
+              FROM slide_attendance sa
+              JOIN slide_channel_partner scp ON scp.id = sa.name
+             WHERE sa.channel_id = %s AND sa.date = %s
+        """, [self.course.id, date])
+        return {self.env['res.partner'].browse(partner_id): (present, session_id)
+                for partner_id, present, session_id in self.env.cr.fetchall()}
+
+    def test_valid_token(self):
+        result = self._verify(self.session._get_checkin_token())
+        self.assertEqual(result, {
+            'status': 'ok',
+            'session_id': self.session.id,
+            'channel_id': self.course.id,
+            'date': str(self.session.training_date),
+        })
+
+    def test_expired_token(self):
+        self.assertEqual(self._verify(self.session._get_checkin_token(ttl=-1)), {'status': 'expired'})
+
+    def test_tampered_token(self):
+        token = self.session._get_checkin_token()
+        encoded, signature = token.rsplit('.', 1)
+        tampered_signature = signature[:-1] + ('1' if signature.endswith('0') else '0')
+        self.assertEqual(self._verify(f"{encoded}.{tampered_signature}"), {'status': 'invalid'})
+        for token in (False, '', 'garbage', f"{encoded}", f"{encoded[:-2]}.{signature}", f"!!.{signature}"):
+            self.assertEqual(self._verify(token), {'status': 'invalid'}, token)
+
+    def test_token_of_other_session(self):
+        """The signature covers the session, course and date: none can be swapped"""
+        token = self.session._get_checkin_token()
+        other_token = self.other_session._get_checkin_token()
+        self.assertEqual(self._verify(other_token)['session_id'], self.other_session.id)
+        self.assertEqual(self._verify(other_token)['date'], str(self.other_session.training_date))
+
+        signature = token.rsplit('.', 1)[1]
+        session_id, channel_id, date, expires = base64.urlsafe_b64decode(token.rsplit('.', 1)[0]).decode().split(':')
+        forged_payloads = [
+            f"{self.other_session.id}:{channel_id}:{date}:{expires}",
+            f"{session_id}:{channel_id}:{self.other_session.training_date}:{expires}",
+            f"{session_id}:{self.env['slide.channel'].create({'name': 'Other Course'}).id}:{date}:{expires}",
+            f"{session_id}:{channel_id}:{date}:{int(expires) + 3600}",
+        ]
+        for payload in forged_payloads:
+            forged = f"{base64.urlsafe_b64encode(payload.encode()).decode()}.{signature}"
+            self.assertEqual(self._verify(forged), {'status': 'invalid'}, payload)
+
+    def test_mark_attendance(self):
+        date = self.session.training_date
+        Attendance = self.env['slide.attendance']
+        self.assertEqual(Attendance.mark_attendance(self.course.id, date, self.partners[:1].ids), 1)
+        self.assertEqual(self._get_presence(date), {
+            self.partners[0]: (True, self.session.id),
+            self.partners[1]: (False, self.session.id),
+        })
+
+        # Checking in twice changes nothing
+        self.assertEqual(Attendance.mark_attendance(self.course.id, date, self.partners[:1].ids), 1)
+        self.assertEqual(self._get_presence(date)[self.partners[0]], (True, self.session.id))
+
+        self.assertEqual(Attendance.mark_attendance(self.course.id, date, self.partners[:1].ids, present=False), 1)
+        self.assertEqual(self._get_presence(date)[self.partners[0]], (False, self.session.id))
+
+        # Days without a session get a row of their own
+        other_date = date - timedelta(days=1)
+        self.assertEqual(Attendance.mark_attendance(self.course.id, other_date, self.partners.ids), 2)
+        self.assertEqual(self._get_presence(other_date), {
+            self.partners[0]: (True, None),
+            self.partners[1]: (True, None),
+        })
+        self.assertEqual(Attendance.mark_attendance(self.course.id, date, []), 0)
+
+    def test_mark_attendance_non_member(self):
+        date = self.session.training_date
+        before = self._get_presence(date)
+        self.assertEqual(self.env['slide.attendance'].mark_attendance(self.course.id, date, self.outsider.ids), 0)
+        self.assertEqual(self._get_presence(date), before)
+        self.assertNotIn(self.outsider, before)
+
+        # Archived members cannot check in either
+        self.members[1].write({'active': False})
+        self.assertEqual(self.env['slide.attendance'].mark_attendance(self.course.id, date, self.partners[1].ids), 0)
+        self.assertFalse(self._get_presence(date)[self.partners[1]][0])
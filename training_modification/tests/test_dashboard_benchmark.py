@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import TrainingDataCommon
+
+_logger = logging.getLogger(__name__)
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+@tagged('benchmark', '-standard', 'post_install', '-at_install')
+class TestDashboardBenchmark(TrainingDataCommon):
+    """Time the dashboard service on a synthetic dataset.
+
+    Not part of the standard test run; use ``--test-tags benchmark``. The
+    dataset and report are configured through environment variables:
+
+    - TRAINING_BENCH_COURSES, TRAINING_BENCH_PARTNERS, TRAINING_BENCH_ENROLLMENTS,
+      TRAINING_BENCH_SESSIONS (sessions per course), TRAINING_BENCH_PROOF_RATIO
+    - TRAINING_BENCH_REPEAT: runs per measurement (default 3)
+    - TRAINING_BENCH_REPORT: JSON report path, TRAINING_BENCH_LABEL: free label
+      (e.g. the commit) stored in the report so runs can be compared
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        start = time.perf_counter()
+        cls.dataset = cls._generate_dataset(
+            courses=_env_int('TRAINING_BENCH_COURSES', 200),
+            partners=_env_int('TRAINING_BENCH_PARTNERS', 5000),
+            enrollments=_env_int('TRAINING_BENCH_ENROLLMENTS', 20000),
+            sessions_per_course=_env_int('TRAINING_BENCH_SESSIONS', 8),
+            proof_ratio=float(os.environ.get('TRAINING_BENCH_PROOF_RATIO', 0.1)),
+        )
+        cls.dataset['generation_seconds'] = round(time.perf_counter() - start, 2)
+        cls.repeat = _env_int('TRAINING_BENCH_REPEAT', 3)
+        cls.service = cls.env['elearning.dashboard.service']
+        cls.snapshot = cls.env['elearning.dashboard.snapshot']
+
+    def _measure(self, func):
+        """Wall time (ms) and query count of ``func`` over ``self.repeat`` cold-cache runs"""
+        timings = []
+        queries = []
+        for _run in range(self.repeat):
+            self.env.invalidate_all()
+            queries_before = self.env.cr.sql_log_count
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+            queries.append(self.env.cr.sql_log_count - queries_before)
+        return {
+            'min_ms': round(min(timings), 2),
+            'median_ms': round(statistics.median(timings), 2),
+            'max_ms': round(max(timings), 2),
+            'queries': max(queries),
+        }
+
+    def _write_report(self, results):
+        path = os.environ.get('TRAINING_BENCH_REPORT') or os.path.join(
+            tempfile.gettempdir(), 'training_dashboard_benchmark.json')
+        report = {
+            'label': os.environ.get('TRAINING_BENCH_LABEL', ''),
+            'date': fields.Datetime.to_string(fields.Datetime.now()),
+            'dataset': self.dataset,
+            'repeat': self.repeat,
+            'results': results,
+        }
+        with open(path, 'w') as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+        _logger.info("Dashboard benchmark report written to %s", path)
+
+    def test_dashboard_benchmark(self):
+        service = self.service
+        company = self.env.company
+        benchmarks = {
+            '_get_enrollment_stats': service._get_enrollment_stats,
+            '_get_kpis': service._get_kpis,
+            '_get_attendance_percentage': service._get_attendance_percentage,
+            '_get_completed_courses_count': service._get_completed_courses_count,
+            '_get_employees_enrolled_this_month': service._get_employees_enrolled_this_month,
+            '_get_course_progress_chart': service._get_course_progress_chart,
+            '_get_enrollments_by_month': service._get_enrollments_by_month,
+            '_get_attendance_by_month': service._get_attendance_by_month,
+            '_get_completion_rates': service._get_completion_rates,
+            '_get_course_ratings': lambda: service._get_course_ratings(self.channels),
+            'get_course_series (worst_completion)': lambda: service.get_course_series('worst_completion'),
+            'get_course_series (all, page 2)': lambda: service.get_course_series(
+                'all', after=service.get_course_series('all')['next']),
+            '_get_student_progress_distribution': service._get_student_progress_distribution,
+            '_compute_dashboard_data': service._compute_dashboard_data,
+            'get_dashboard_data (snapshot refresh)': lambda: self.snapshot._refresh(company, force=True),
+            'get_dashboard_data (from snapshot)': service.get_dashboard_data,
+        }
+
+        results = {name: self._measure(func) for name, func in benchmarks.items()}
+        self._write_report(results)
+
+        for name, result in results.items():
+            _logger.info("%-40s median %9.2f ms  min %9.2f ms  %4d queries",
+                         name, result['median_ms'], result['min_ms'], result['queries'])
+
+        # The query count of a full refresh must not grow with the dataset
+        self.assertLess(results['_compute_dashboard_data']['queries'], 50)
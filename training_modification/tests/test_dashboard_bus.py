@@ -0,0 +1,31 @@
+from odoo.tests import TransactionCase, new_test_user, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardBus(TransactionCase):
+    """Dashboard updates only reach the eLearning officers of the company."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.channel = cls.env['elearning.dashboard.snapshot']._get_bus_channel(cls.env.company)
+        cls.officer = new_test_user(cls.env, 'bus_officer', groups='base.group_user,website_slides.group_website_slides_officer')
+        cls.employee = new_test_user(cls.env, 'bus_employee', groups='base.group_user')
+        cls.portal = new_test_user(cls.env, 'bus_portal', groups='base.group_portal')
+        cls.other_company = cls.env['res.company'].create({'name': 'Other Training Company'})
+
+    def _is_allowed(self, user, channel):
+        return self.env['ir.websocket'].with_user(user)._is_allowed_dashboard_channel(channel)
+
+    def test_officer_subscribes(self):
+        self.assertTrue(self._is_allowed(self.officer, self.channel))
+
+    def test_others_cannot_subscribe(self):
+        for user in (self.employee, self.portal):
+            self.assertFalse(self._is_allowed(user, self.channel), user.login)
+        other_channel = self.env['elearning.dashboard.snapshot']._get_bus_channel(self.other_company)
+        for channel in (other_channel, 'elearning_dashboard_', 'elearning_dashboard_x'):
+            self.assertFalse(self._is_allowed(self.officer, channel), channel)
+        # Other channels are left alone
+        self.assertTrue(self._is_allowed(self.portal, 'some_channel'))
+        self.assertTrue(self._is_allowed(self.portal, ('res.partner', self.portal.partner_id.id)))
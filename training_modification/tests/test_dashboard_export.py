@@ -0,0 +1,98 @@
+import csv
+import io
+import zipfile
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import HttpCase, new_test_user, tagged
+
+from ..models.elearning_dashboard_service import EXPORT_DATASETS
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardExport(HttpCase):
+    """CSV and XLSX exports of the dashboard datasets."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.officer = new_test_user(cls.env, 'export_officer', groups='base.group_user,website_slides.group_website_slides_officer')
+        cls.employee = new_test_user(cls.env, 'export_employee', groups='base.group_user')
+        tag_group = cls.env['slide.channel.tag.group'].create({'name': 'Export Tags'})
+        cls.tag = cls.env['slide.channel.tag'].create({'name': 'Export Tag', 'group_id': tag_group.id})
+        cls.course, cls.draft_course = cls.env['slide.channel'].create([
+            {'name': 'Export Course', 'is_published': True, 'tag_ids': [(6, 0, cls.tag.ids)]},
+            {'name': 'Export Draft Course', 'is_published': False},
+        ])
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Export Attendee {index}', 'email': f'export.attendee{index}@example.com'}
+            for index in range(2)
+        ])
+        cls.env['slide.channel.partner'].create([
+            {'channel_id': course.id, 'partner_id': partner.id}
+            for course, partner in zip(cls.course | cls.draft_course, cls.partners)
+        ])
+        cls.session_date = fields.Date.today() - timedelta(days=1)
+        cls.env['training.calendar'].create({'course_id': cls.course.id, 'training_date': cls.session_date})
+        cls.env['slide.attendance'].mark_attendance(cls.course.id, cls.session_date, cls.partners[:1].ids)
+
+    def _export(self, dataset, login='export_officer', **params):
+        self.authenticate(login, login)
+        query = '&'.join(f'{name}={value}' for name, value in params.items())
+        return self.url_open(f'/training/dashboard/export/{dataset}?{query}')
+
+    def _export_rows(self, dataset, **params):
+        response = self._export(dataset, **params)
+        self.assertEqual(response.status_code, 200)
+        return list(csv.reader(io.StringIO(response.content.decode('utf-8-sig'))))
+
+    def test_export_datasets(self):
+        for dataset in EXPORT_DATASETS:
+            with self.subTest(dataset=dataset):
+                response = self._export(dataset)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.headers['Content-Type'], 'text/csv; charset=utf-8')
+                self.assertIn(f'{dataset}_', response.headers['Content-Disposition'])
+                headers, _query = self.env['elearning.dashboard.service'].with_user(self.officer)._get_export_query(dataset)
+                rows = list(csv.reader(io.StringIO(response.content.decode('utf-8-sig'))))
+                self.assertEqual(rows[0], headers)
+
+                response = self._export(dataset, format='xlsx')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.headers['Content-Type'], XLSX_CONTENT_TYPE)
+                with zipfile.ZipFile(io.BytesIO(response.content)) as workbook:
+                    self.assertIn('xl/worksheets/sheet1.xml', workbook.namelist())
+
+        self.assertEqual(self._export('unknown').status_code, 404)
+        self.assertEqual(self._export('enrollments', format='pdf').status_code, 404)
+
+    def test_export_filters(self):
+        courses = {row[0] for row in self._export_rows('course_progress')[1:]}
+        self.assertTrue({'Export Course', 'Export Draft Course'} <= courses)
+
+        courses = {row[0] for row in self._export_rows('course_progress', published=1)[1:]}
+        self.assertIn('Export Course', courses)
+        self.assertNotIn('Export Draft Course', courses)
+
+        rows = self._export_rows('enrollments', tag_ids=self.tag.id)[1:]
+        self.assertEqual([(row[0], row[1], row[6], row[7]) for row in rows],
+                         [('Export Course', 'Export Attendee 0', '1', '1')])
+
+        tomorrow = fields.Date.to_string(fields.Date.today() + timedelta(days=1))
+        self.assertEqual(self._export_rows('enrollments', tag_ids=self.tag.id, date_from=tomorrow)[1:], [])
+
+        session_date = fields.Date.to_string(self.session_date)
+        rows = self._export_rows('monthly_attendance', tag_ids=self.tag.id, date_from=session_date, date_to=session_date)
+        self.assertEqual(rows[1:], [[self.session_date.strftime('%Y-%m'), '1', '1', '100.0']])
+
+    def test_malformed_filters(self):
+        for params in ({'date_from': '2024-13-01'}, {'date_to': 'yesterday'}, {'tag_ids': 'abc'}, {'department_ids': '1,x'}):
+            with self.subTest(params=params):
+                self.assertEqual(self._export('enrollments', **params).status_code, 400)
+
+    def test_export_requires_officer(self):
+        for dataset in EXPORT_DATASETS:
+            with self.subTest(dataset=dataset):
+                self.assertEqual(self._export(dataset, login='export_employee').status_code, 403)
@@ -0,0 +1,81 @@
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardSnapshot(TransactionCase):
+    """Stored dashboard sections are recomputed when their source models change."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.snapshot = cls.env['elearning.dashboard.snapshot']
+        cls.course = cls.env['slide.channel'].create({'name': 'Snapshot Course'})
+        cls.partner = cls.env['res.partner'].create({'name': 'Snapshot Attendee'})
+        cls.member = cls.env['slide.channel.partner'].create({'channel_id': cls.course.id, 'partner_id': cls.partner.id})
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(self.env.cr.postcommit.clear)
+        self._commit()
+        self.snapshot._refresh(self.env.company, force=True)
+
+    def _commit(self):
+        """Run the post-commit hooks, as a commit of the test transaction would"""
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.env.cr.postcommit.run()
+
+    def test_refresh_unchanged(self):
+        self.assertEqual(self.snapshot._refresh(self.env.company), [])
+
+    def test_refresh_changed_sources(self):
+        self.env['slide.attendance'].create({'name': self.member.id, 'channel_id': self.course.id, 'present': True})
+        # Not counted before the transaction is committed
+        self.assertEqual(self.snapshot._refresh(self.env.company), [])
+        self._commit()
+        self.assertEqual(sorted(self.snapshot._refresh(self.env.company)), ['attendanceByMonth', 'kpis'])
+        self.assertEqual(self.snapshot._refresh(self.env.company), [])
+
+    def test_refresh_raw_update(self):
+        """Changes made in SQL count too, even when they keep row counts and write dates"""
+        attendance = self.env['slide.attendance'].create({
+            'name': self.member.id, 'channel_id': self.course.id, 'date': fields.Date.today(),
+        })
+        self._commit()
+        self.snapshot._refresh(self.env.company)
+        self.env.cr.execute("SELECT write_date FROM slide_attendance WHERE id = %s", [attendance.id])
+        write_date = self.env.cr.fetchone()[0]
+
+        attendance._set_present(True)
+        self.env.cr.execute("UPDATE slide_attendance SET write_date = %s WHERE id = %s", [write_date, attendance.id])
+        self._commit()
+        self.assertIn('attendanceByMonth', self.snapshot._refresh(self.env.company))
+
+    def _is_scheduled(self, model_name):
+        return model_name in self.env.cr.postcommit.data.get('training_dashboard_sources', ())
+
+    def test_unrelated_changes_not_counted(self):
+        self.env.cr.postcommit.clear()
+        partner_rating = self.env['rating.rating'].create({
+            'res_model_id': self.env['ir.model']._get_id('res.partner'),
+            'res_id': self.partner.id,
+            'rating': 5,
+        })
+        self.assertFalse(self._is_scheduled('rating.rating'))
+        partner_rating.write({'feedback': 'Fine'})
+        self.assertFalse(self._is_scheduled('rating.rating'))
+
+        slide = self.env['slide.slide'].create({'name': 'Snapshot Slide', 'channel_id': self.course.id})
+        self.env.cr.postcommit.clear()
+        slide.write({'public_views': 10})
+        self.assertFalse(self._is_scheduled('slide.slide'))
+        slide.write({'is_published': True})
+        self.assertTrue(self._is_scheduled('slide.slide'))
+
+        self.env['rating.rating'].create({
+            'res_model_id': self.env['ir.model']._get_id('slide.channel'),
+            'res_id': self.course.id,
+            'rating': 4,
+        })
+        self.assertTrue(self._is_scheduled('rating.rating'))
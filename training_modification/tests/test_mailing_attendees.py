@@ -0,0 +1,116 @@
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestMailingAttendees(TransactionCase):
+    """Course mailings: attendee targeting and the enrollment sync."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.course = cls.env['slide.channel'].create({'name': 'Mailing Course'})
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Mailing Attendee {index}', 'email': f'mailing.attendee{index}@example.com'}
+            for index in range(5)
+        ])
+        cls.members = cls.partners[:3]
+        cls.env['slide.channel.partner'].create([
+            {'channel_id': cls.course.id, 'partner_id': partner.id} for partner in cls.members
+        ])
+
+    def _create_mailing(self, model='res.partner', **vals):
+        return self.env['mailing.mailing'].create({
+            'subject': 'Training reminder',
+            'mailing_model_id': self.env['ir.model']._get_id(model),
+            'course_id': self.course.id,
+            **vals,
+        })
+
+    def _get_course_partners(self, course=None):
+        return self.env['slide.channel.partner'].search([('channel_id', '=', (course or self.course).id)]).partner_id
+
+    def test_course_target_partner_recipients(self):
+        mailing = self._create_mailing(attendee_target='course')
+        self.assertEqual(mailing.attendee_count, 3)
+        recipients = self.env['res.partner'].search(mailing._get_recipients_domain())
+        self.assertEqual(recipients & self.partners, self.members)
+
+        # Resolved when sending: later members are included
+        self.env['slide.channel.partner'].create({'channel_id': self.course.id, 'partner_id': self.partners[3].id})
+        recipients = self.env['res.partner'].search(mailing._get_recipients_domain())
+        self.assertEqual(recipients & self.partners, self.partners[:4])
+
+    def test_course_target_contact_recipients(self):
+        contacts = self.env['mailing.contact'].create([
+            {'name': partner.name, 'email': partner.email} for partner in self.partners
+        ])
+        mailing = self._create_mailing(model='mailing.contact', attendee_target='course')
+        recipients = self.env['mailing.contact'].search(mailing._get_recipients_domain())
+        self.assertEqual(recipients & contacts, contacts[:3])
+
+    def test_switch_to_selection_keeps_members(self):
+        mailing = self._create_mailing(attendee_target='course')
+        mailing.write({'attendee_target': 'selection'})
+        self.assertEqual(mailing.attendees_ids, self.members)
+        self.assertEqual(self._get_course_partners(), self.members)
+
+    def test_selection_recipients(self):
+        mailing = self._create_mailing(attendee_target='selection')
+        mailing.write({'attendees_ids': [(6, 0, self.members[:2].ids)]})
+        recipients = self.env['res.partner'].search(mailing._get_recipients_domain())
+        self.assertEqual(recipients & self.partners, self.members[:2])
+
+    def test_sync_adds_and_removes_members(self):
+        mailing = self._create_mailing(attendee_target='selection')
+        mailing.write({'attendees_ids': [(6, 0, (self.members[1:] | self.partners[3]).ids)]})
+        self.assertEqual(self._get_course_partners(), self.members[1:] | self.partners[3])
+
+    def test_sync_noop_keeps_enrollments(self):
+        mailing = self._create_mailing(attendee_target='selection')
+        enrollments = self.env['slide.channel.partner'].search([('channel_id', '=', self.course.id)])
+        mailing.write({'attendees_ids': [(6, 0, self.members.ids)]})
+        mailing.write({'subject': 'Updated reminder'})
+        self.assertEqual(self.env['slide.channel.partner'].search([('channel_id', '=', self.course.id)]), enrollments)
+
+    def test_sync_several_mailings_one_course(self):
+        mailings = self._create_mailing(attendee_target='selection') | self._create_mailing(attendee_target='selection')
+        mailings.write({'attendees_ids': [(6, 0, (self.members[:2] | self.partners[4]).ids)]})
+        enrollments = self.env['slide.channel.partner'].search([('channel_id', '=', self.course.id)])
+        # One enrollment per partner, even though both mailings add the same one
+        self.assertEqual(len(enrollments), 3)
+        self.assertEqual(enrollments.partner_id, self.members[:2] | self.partners[4])
+
+    def test_empty_selection_keeps_members(self):
+        mailing = self._create_mailing(attendee_target='selection')
+        mailing.write({'attendees_ids': [(5, 0, 0)]})
+        self.assertEqual(self._get_course_partners(), self.members)
+        mailing.write({'course_id': self.course.id})
+        self.assertEqual(self._get_course_partners(), self.members)
+
+    def test_default_course_from_context(self):
+        defaults = self.env['mailing.mailing'].with_context(
+            active_model='slide.channel', active_id=self.course.id,
+        ).default_get(['course_id', 'attendee_target'])
+        self.assertEqual(defaults.get('course_id'), self.course.id)
+        self.assertEqual(defaults.get('attendee_target'), 'course')
+
+    def test_no_course_keeps_audience(self):
+        # A course opened or joined earlier does not restrict an unrelated mailing
+        self.course.web_read({'name': {}})
+        self.env['slide.channel.partner'].create({'channel_id': self.course.id, 'partner_id': self.env.user.partner_id.id})
+        defaults = self.env['mailing.mailing'].default_get(['course_id', 'attendee_target'])
+        self.assertFalse(defaults.get('course_id'))
+        self.assertNotEqual(defaults.get('attendee_target'), 'course')
+
+        mailing = self.env['mailing.mailing'].create({
+            'subject': 'Newsletter',
+            'mailing_model_id': self.env['ir.model']._get_id('res.partner'),
+        })
+        recipients = self.env['res.partner'].search(mailing._get_recipients_domain())
+        self.assertEqual(recipients & self.partners, self.partners)
+
+    def test_empty_selection_keeps_audience(self):
+        mailing = self._create_mailing(attendee_target='selection')
+        mailing.write({'attendees_ids': [(5, 0, 0)]})
+        recipients = self.env['res.partner'].search(mailing._get_recipients_domain())
+        self.assertEqual(recipients & self.partners, self.partners)
@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+from odoo.tools import SQL
+
+from .common import TrainingDataCommon
+
+# Tables whose hot queries must be served by an index
+INDEXED_TABLES = ('slide_attendance', 'attendance_proof', 'training_calendar', 'slide_channel_partner')
+
+
+@tagged('post_install', '-at_install')
+class TestQueryPlans(TrainingDataCommon):
+    """EXPLAIN the module's hot queries on a seeded dataset.
+
+    The dataset is large enough (~100k attendance rows) for the planner to
+    prefer an index whenever one matches, so a sequential scan on one of the
+    INDEXED_TABLES means an index is missing or no longer usable.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._generate_dataset(courses=100, partners=3000, enrollments=12000, sessions_per_course=8)
+        # Most proofs have been reviewed; the queue only holds a few
+        cls.env.cr.execute("""
+            UPDATE attendance_proof
+               SET status = CASE WHEN id %% 20 = 0 THEN 'pending' ELSE 'approved' END
+             WHERE course_id IN %s
+        """, [tuple(cls.channels.ids)])
+        cls.env.cr.execute("ANALYZE attendance_proof")
+
+        cls.channel = cls.channels[len(cls.channels) // 2]
+        cls.env.cr.execute("""
+            SELECT scp.id, scp.partner_id, tc.id, tc.training_date
+              FROM slide_channel_partner scp
+              JOIN training_calendar tc ON tc.course_id = scp.channel_id
+             WHERE scp.channel_id = %s
+             LIMIT 1
+        """, [cls.channel.id])
+        cls.member_id, cls.partner_id, cls.session_id, cls.session_date = cls.env.cr.fetchone()
+
+    def _get_seq_scans(self, query, tables=INDEXED_TABLES):
+        """Tables of ``tables`` read by a sequential scan in the plan of ``query``"""
+        self.env.cr.execute(SQL("EXPLAIN (FORMAT JSON) %s", query))
+        plan = self.env.cr.fetchone()[0][0]['Plan']
+        seq_scans = set()
+        nodes = [plan]
+        while nodes:
+            node = nodes.pop()
+            if node['Node Type'] == 'Seq Scan' and node.get('Relation Name') in tables:
+                seq_scans.add(node['Relation Name'])
+            nodes.extend(node.get('Plans', []))
+        return seq_scans
+
+    def assertIndexed(self, query, tables=INDEXED_TABLES):
+        seq_scans = self._get_seq_scans(query, tables)
+        self.assertFalse(seq_scans, f"Sequential scan on {', '.join(sorted(seq_scans))}:\n{query.code}")
+
+    def _search_query(self, model, domain, **kwargs):
+        return self.env[model].with_context(active_test=False)._search(domain, **kwargs).select()
+
+    def test_attendance_queries(self):
+        today = fields.Date.today()
+        # Attendance of a course over a period (dashboard, register)
+        self.assertIndexed(self._search_query('slide.attendance', [
+            ('channel_id', '=', self.channel.id),
+            ('date', '>=', today - timedelta(days=30)),
+        ]))
+        # Attended sessions of a course
+        self.assertIndexed(SQL(
+            "SELECT COUNT(*) FROM slide_attendance WHERE present AND channel_id = %s AND date <= %s",
+            self.channel.id, today,
+        ))
+        # Attendance of a member (unenrollment, exports)
+        self.assertIndexed(self._search_query('slide.attendance', [
+            ('name', '=', self.member_id), ('channel_id', '=', self.channel.id),
+        ]))
+        # Marking a member for a session
+        self.assertIndexed(self._search_query('slide.attendance', [
+            ('name', '=', self.member_id), ('channel_id', '=', self.channel.id), ('date', '=', self.session_date),
+        ]))
+        # Attendance register of a session
+        self.assertIndexed(self._search_query('slide.attendance', [('session_id', '=', self.session_id)]))
+        service = self.env['elearning.dashboard.service']
+        # Dashboard history of all courses over a period (monthly series, exports).
+        # Joining all the members of the period may rightly scan the enrollments.
+        self.assertIndexed(SQL("SELECT COUNT(*) FROM (%s) history", service._get_attendance_history_sql(
+            {}, date_from=today - timedelta(days=7), date_to=today)), tables=('slide_attendance',))
+        # Dashboard history of an attendee
+        self.assertIndexed(SQL("SELECT COUNT(*) FROM (%s) history", service._get_attendance_history_sql(
+            {'partner_ids': [self.partner_id]}, date_from=today - timedelta(days=90), date_to=today)))
+
+    def test_calendar_queries(self):
+        today = fields.Date.today()
+        # Sessions of a course, by date
+        self.assertIndexed(self._search_query('training.calendar', [
+            ('course_id', '=', self.channel.id), ('training_date', '>=', today - timedelta(days=60)),
+        ], order='training_date'))
+        self.assertIndexed(self._search_query('training.calendar', [
+            ('course_id', '=', self.channel.id), ('training_date', '=', self.session_date),
+        ], limit=1))
+        # Members of a course
+        self.assertIndexed(self._search_query('slide.channel.partner', [('channel_id', '=', self.channel.id)]))
+
+    def test_proof_queries(self):
+        # Proofs of a member for a course (upload page, calendar)
+        self.assertIndexed(self._search_query('attendance.proof', [
+            ('partner_id', '=', self.partner_id), ('course_id', '=', self.channel.id),
+        ], order='upload_date desc'))
+        self.assertIndexed(self._search_query('attendance.proof', [
+            ('partner_id', '=', self.partner_id),
+            ('course_id', '=', self.channel.id),
+            ('training_date', '=', self.session_date),
+        ], limit=1))
+        # Proofs of a session
+        self.assertIndexed(self._search_query('attendance.proof', [
+            ('course_id', '=', self.channel.id), ('training_date', '=', self.session_date),
+        ]))
+        # Review queue
+        self.assertIndexed(self._search_query('attendance.proof', [
+            ('status', '=', 'pending'),
+        ], order='upload_date, id', limit=50))
@@ -0,0 +1,182 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestSessionAttendance(TransactionCase):
+    """Attendance rows of the training sessions, kept aligned with the enrollments."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.today = fields.Date.today()
+        cls.course = cls.env['slide.channel'].create({'name': 'Session Course'})
+        cls.partners = cls.env['res.partner'].create([
+            {'name': f'Session Attendee {index}', 'email': f'session.attendee{index}@example.com'}
+            for index in range(4)
+        ])
+        cls.members = cls.env['slide.channel.partner'].create([
+            {'channel_id': cls.course.id, 'partner_id': partner.id} for partner in cls.partners[:2]
+        ])
+        cls.past_session, cls.session = cls.env['training.calendar'].create([
+            {'course_id': cls.course.id, 'training_date': cls.today - timedelta(days=7)},
+            {'course_id': cls.course.id, 'training_date': cls.today + timedelta(days=7)},
+        ])
+        cls.env.flush_all()
+        cls.env.cr.precommit.run()
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(self.env.cr.precommit.clear)
+
+    def _run_precommit(self):
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+
+    def _get_rows(self, session=None):
+        """{(member id, date): (session id, present)} of the course's attendance rows, read from the table"""
+        self.env.flush_all()
+        self.env.cr.execute("SELECT name, date, session_id, present FROM slide_attendance WHERE channel_id = %s",
+                            [self.course.id])
+        return {
+            (member_id, date): (session_id, present)
+            for member_id, date, session_id, present in self.env.cr.fetchall()
+            if not session or session_id == session.id
+        }
+
+    def _get_session_members(self, session):
+        return {member_id for member_id, _date in self._get_rows(session)}
+
+    def test_session_created(self):
+        session = self.env['training.calendar'].create({
+            'course_id': self.course.id,
+            'training_date': self.today + timedelta(days=14),
+        })
+        rows = self._get_rows(session)
+        self.assertEqual(rows, {
+            (member.id, session.training_date): (session.id, False) for member in self.members
+        })
+
+    def test_member_added(self):
+        member = self.env['slide.channel.partner'].create({'channel_id': self.course.id, 'partner_id': self.partners[2].id})
+        # Reconciled before commit, not on create
+        self.assertNotIn(member.id, self._get_session_members(self.session))
+        self._run_precommit()
+        self.assertEqual(self._get_session_members(self.session), set((self.members | member).ids))
+        # Past sessions are left as recorded
+        self.assertNotIn(member.id, self._get_session_members(self.past_session))
+
+    def test_member_removed(self):
+        member = self.members[0]
+        self.env['slide.attendance'].mark_attendance(self.course.id, self.past_session.training_date, member.partner_id.ids)
+        member.write({'active': False})
+        self._run_precommit()
+        self.assertEqual(self._get_session_members(self.session), set(self.members[1:].ids))
+        # The attendance already recorded is kept
+        self.assertEqual(self._get_rows()[member.id, self.past_session.training_date], (self.past_session.id, True))
+
+        member.write({'active': True})
+        self._run_precommit()
+        self.assertEqual(self._get_session_members(self.session), set(self.members.ids))
+
+    def test_course_members_written(self):
+        self.course.write({'channel_partner_ids': [(0, 0, {'partner_id': self.partners[3].id})]})
+        self._run_precommit()
+        member = self.course.channel_partner_ids.filtered(lambda scp: scp.partner_id == self.partners[3])
+        self.assertIn(member.id, self._get_session_members(self.session))
+
+    def test_session_moved(self):
+        new_date = self.today + timedelta(days=10)
+        # A row of the new date without a session carries no information
+        self.env['slide.attendance'].create({'name': self.members[0].id, 'channel_id': self.course.id, 'date': new_date})
+        self.env['slide.attendance'].mark_attendance(self.course.id, self.session.training_date, self.members[1].partner_id.ids)
+        self.env.cr.execute("UPDATE slide_attendance SET write_date = write_date - interval '1 day' WHERE session_id = %s",
+                            [self.session.id])
+
+        self.session.write({'training_date': new_date})
+        self.assertEqual(self._get_rows(self.session), {
+            (self.members[0].id, new_date): (self.session.id, False),
+            (self.members[1].id, new_date): (self.session.id, True),
+        })
+        # Moved rows are seen as changed by the dashboard snapshot
+        self.env.cr.execute("SELECT bool_and(write_date >= NOW() AT TIME ZONE 'UTC' - interval '1 hour') FROM slide_attendance WHERE session_id = %s",
+                            [self.session.id])
+        self.assertTrue(self.env.cr.fetchone()[0])
+
+    def test_session_moved_onto_checkins(self):
+        new_date = self.today + timedelta(days=10)
+        partners = self.members.partner_id
+        # Checked in on a day without session, then the session is moved there
+        self.env['slide.attendance'].mark_attendance(self.course.id, new_date, partners[:1].ids)
+        late_member = self.env['slide.channel.partner'].create({'channel_id': self.course.id, 'partner_id': self.partners[2].id})
+        self.env['slide.attendance'].mark_attendance(self.course.id, new_date, self.partners[2:3].ids)
+
+        self.session.write({'training_date': new_date})
+        rows = self._get_rows()
+        self.assertEqual({key: value for key, value in rows.items() if key[1] == new_date}, {
+            (self.members[0].id, new_date): (self.session.id, True),
+            (self.members[1].id, new_date): (self.session.id, False),
+            (late_member.id, new_date): (self.session.id, True),
+        })
+
+    def test_session_course_changed(self):
+        member = self.members[0]
+        self.env['slide.attendance'].mark_attendance(self.course.id, self.past_session.training_date, member.partner_id.ids)
+        other_course = self.env['slide.channel'].create({'name': 'Other Session Course'})
+        (self.past_session | self.session).write({'course_id': other_course.id})
+        rows = self._get_rows()
+        # The recorded attendance stays with the course it was taken for
+        self.assertEqual(rows[member.id, self.past_session.training_date], (None, True))
+        self.assertEqual(rows[self.members[1].id, self.past_session.training_date], (None, False))
+        self.assertFalse([key for key in rows if key[1] == self.session.training_date])
+
+    def test_session_deleted(self):
+        member = self.members[0]
+        self.env['slide.attendance'].mark_attendance(self.course.id, self.past_session.training_date, member.partner_id.ids)
+        (self.past_session | self.session).unlink()
+        rows = self._get_rows()
+        # Recorded attendance outlives the session; the upcoming unfilled rows go
+        self.assertEqual(rows[member.id, self.past_session.training_date], (None, True))
+        self.assertFalse([key for key in rows if key[1] == self.session.training_date])
+
+    def test_sync_queued_once_per_transaction(self):
+        self.env.cr.precommit.clear()
+        members = self.env['slide.channel.partner'].create({'channel_id': self.course.id, 'partner_id': self.partners[2].id})
+        members |= self.env['slide.channel.partner'].create({'channel_id': self.course.id, 'partner_id': self.partners[3].id})
+        self.course.write({'channel_partner_ids': [(1, self.members[0].id, {})]})
+
+        hooks = [func for func in self.env.cr.precommit._funcs if getattr(func, '__name__', None) == '_run_session_sync']
+        self.assertEqual(len(hooks), 1)
+        queued = self.env.cr.precommit.data['training_attendance_sync']
+        self.assertEqual(queued['member_ids'], set(members.ids))
+        self.assertEqual(queued['channel_ids'], {self.course.id})
+
+        self._run_precommit()
+        self.assertNotIn('training_attendance_sync', self.env.cr.precommit.data)
+        self.assertEqual(self._get_session_members(self.session), set((self.members | members).ids))
+
+    def _get_member_rows(self, member):
+        return self.env['slide.attendance'].search([('name', '=', member.id)])
+
+    def test_unlink_keeps_member_with_other_attendance(self):
+        member = self.members[0]
+        self._get_member_rows(member).filtered(lambda row: row.session_id == self.session).unlink()
+        self.assertTrue(member.exists())
+        self.assertEqual(self._get_member_rows(member).session_id, self.past_session)
+
+    def test_unlink_removes_member_without_attendance(self):
+        member = self.members[0]
+        self._get_member_rows(member).unlink()
+        self.assertFalse(member.exists())
+        self.assertEqual(self.course.channel_partner_ids, self.members[1:])
+
+    def test_unlink_mixed_batch(self):
+        rows = self._get_member_rows(self.members[0])
+        rows |= self._get_member_rows(self.members[1]).filtered(lambda row: row.session_id == self.session)
+        self.assertEqual(rows._get_members_without_other_attendance(), self.members[0])
+        rows.unlink()
+        self.assertFalse(self.members[0].exists())
+        self.assertTrue(self.members[1].exists())
+        self.assertEqual(self._get_session_members(self.past_session), set(self.members[1].ids))